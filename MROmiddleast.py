@@ -3,9 +3,17 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
+import pandas as pd
+from network_capture import NetworkCapture, enable_performance_log, records_from_responses
+from driver_factory import make_driver
 
-# --- Setup driver ---
-driver = webdriver.Chrome()
+SAVE_FILE = "mro_middle_east_exhibitors.xlsx"
+
+# --- Setup driver (with DevTools network capture) ---
+options = webdriver.ChromeOptions()
+enable_performance_log(options)
+driver = make_driver(options=options)
+capture = NetworkCapture(driver).start()
 driver.get("https://mromiddleeast.aviationweek.com/en/exhibition/exhibitor-list.html")
 wait = WebDriverWait(driver, 20)
 
@@ -28,3 +36,10 @@ scroll_element(scrollable, driver, "up")
 scroll_element(scrollable, driver, "down")
 
 print("Finished scrolling container!")
+
+# --- Build exhibitor records from the marketplace's JSON responses ---
+records = records_from_responses(capture.drain())
+driver.quit()
+df = pd.DataFrame(records, columns=["Company Name", "Booth No", "Country", "Website", "LinkedIn", "Description"])
+df.to_excel(SAVE_FILE, index=False)
+print(f"💾 Saved {len(df)} exhibitors from captured API responses to {SAVE_FILE}")
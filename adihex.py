@@ -1,19 +1,13 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import time
+from driver_factory import make_driver
 
 # ---------- SETUP ----------
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")  # open browser fullscreen
-options.add_argument("--disable-blink-features=AutomationControlled")  # avoid detection
-
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = make_driver()
 
 url = "https://www.adihex.com/ar/exhibitor-information/exhibitor-list"
 driver.get(url)
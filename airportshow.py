@@ -1,21 +1,48 @@
 # pip install selenium pandas openpyxl
-import time, pandas as pd
+import time, sys, pandas as pd
+from network_capture import NetworkCapture, enable_performance_log, records_from_responses
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from batch_extract import extract_cards
+from driver_factory import make_driver, open_tab
+from inpage_fetch import harvest
 
 URL = "https://www.theairportshow.com/en-gb/exhibitor-directory.html#/"
+CAPTURE = "--capture" in sys.argv  # build records from the directory's JSON instead of the DOM
+# `--harvest` fetch()es detail pages from inside the directory page instead of opening a tab each;
+# pages that only render client-side (no detail markup in the HTML) still get a tab
+HARVEST = "--harvest" in sys.argv
+CARD_SEL = "div.directory-item-feature-toggled.exhibitor-category"
+
+# List card fields, read for every card in one round-trip
+CARD_FIELDS = {
+    "Company": ("h3.exhibitor-name", "text"),
+    "Logo": ("div.profile-logo img", "src"),
+    "Stand": (".directory-stand span:last-child", "text"),
+    "Link": ("h3.exhibitor-name < a", "href"),
+}
+
+# Detail page fields, read the same way from a tab or a harvested page
+DETAIL_FIELDS = {
+    "description": ("div[data-testid='exh-content']", "text"),
+    "country": ("div[data-testid='exh-country'], span.exhibitor-country", "text"),
+    "contacts": ("div.exhibitor-details-contact-us-links a", "href[]"),
+    "social": ("div.social-media-logo-container a", "href[]"),
+}
+DETAIL_READY = "div[data-testid='exh-content'], div.exhibitor-details-contact-us-links"
 
 opts = webdriver.ChromeOptions()
-opts.add_argument("--start-maximized")
-# opts.add_argument("--headless=new")  # optional
-driver = webdriver.Chrome(options=opts)
+if CAPTURE:
+    enable_performance_log(opts)
+driver = make_driver(options=opts, allow=("images",))  # Logo is read from the img src
 wait = WebDriverWait(driver, 30)
+capture = NetworkCapture(driver).start() if CAPTURE else None
 
 driver.get(URL)
 wait.until(EC.presence_of_all_elements_located(
-    (By.CSS_SELECTOR, "div.directory-item-feature-toggled.exhibitor-category")))
+    (By.CSS_SELECTOR, CARD_SEL)))
 
 # -------------------------------
 # STEP 1: AUTO SCROLL UNTIL END
@@ -28,8 +55,7 @@ max_wait_rounds = 15  # ~30 seconds max idle wait
 while stable_rounds < max_wait_rounds:
     driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
     time.sleep(2)
-    cards = driver.find_elements(By.CSS_SELECTOR,
-                                 "div.directory-item-feature-toggled.exhibitor-category")
+    cards = driver.find_elements(By.CSS_SELECTOR, CARD_SEL)
     curr_count = len(cards)
     print(f"Currently loaded: {curr_count}")
 
@@ -41,107 +67,110 @@ while stable_rounds < max_wait_rounds:
 
 print(f"✅ All exhibitors loaded: {len(cards)} total")
 
+# -------------------------------
+# CAPTURE MODE: READ THE API RESPONSES
+# -------------------------------
+if capture:
+    records = records_from_responses(capture.drain())
+    driver.quit()
+    df = pd.DataFrame([{
+        "Company": r["Company Name"],
+        "Country": r["Country"],
+        "Stand": r["Booth No"],
+        "Description": r["Description"],
+        "Website": r["Website"],
+        "Email": r["Email"],
+        "Phone": r["Phone"],
+        "LinkedIn": r["LinkedIn"],
+    } for r in records])
+    df.to_excel("airport_show_exhibitors_full.xlsx", index=False)
+    print(f"✅ Done! {len(records)} exhibitors from captured API responses → airport_show_exhibitors_full.xlsx")
+    sys.exit(0)
+
 # -------------------------------
 # STEP 2: SCRAPE EACH CARD
 # -------------------------------
 exhibitors = []
 
-for idx, card in enumerate(cards, start=1):
+# Read every card's list fields in one execute_script call
+card_rows = extract_cards(driver, CARD_SEL, CARD_FIELDS)
+
+
+def exhibitor_record(row, fields):
+    """Output row from the list card and the detail page fields"""
+    # ----- CONTACTS -----
+    website, email, phone = "", "", ""
+    for href in fields["contacts"]:
+        if href.startswith("mailto:"):
+            email = href.replace("mailto:", "")
+        elif href.startswith("tel:"):
+            phone = href.replace("tel:", "")
+        elif href.startswith("http") and "linkedin" not in href:
+            website = href
+
+    # ----- SOCIAL MEDIA -----
+    linkedin = facebook = instagram = youtube = twitter = ""
+    for href in fields["social"]:
+        lower = href.lower()
+        if "linkedin" in lower:
+            linkedin = href
+        elif "facebook" in lower:
+            facebook = href
+        elif "instagram" in lower:
+            instagram = href
+        elif "youtube" in lower:
+            youtube = href
+        elif "twitter" in lower or "x.com" in lower:
+            twitter = href
+
+    return {
+        "Company": row["Company"],
+        "Country": fields["country"] or "",
+        "Stand": row["Stand"] or "",
+        "Description": fields["description"] or "",
+        "Logo": row["Logo"] or "",
+        "Website": website,
+        "Email": email,
+        "Phone": phone,
+        "LinkedIn": linkedin,
+        "Facebook": facebook,
+        "Instagram": instagram,
+        "YouTube": youtube,
+        "Twitter": twitter
+    }
+
+
+detail_links = [row["Link"] for row in card_rows if row["Company"] is not None and row["Link"]]
+harvested = dict(zip(detail_links, harvest(driver, detail_links, DETAIL_FIELDS, ready=DETAIL_READY))) if HARVEST else {}
+
+for idx, row in enumerate(card_rows, start=1):
     try:
-        name_el = card.find_element(By.CSS_SELECTOR, "h3.exhibitor-name")
-        company = name_el.text.strip()
-        print(f"{idx}/{len(cards)} → {company}")
-
-        logo = ""
-        try:
-            logo = card.find_element(By.CSS_SELECTOR, "div.profile-logo img").get_attribute("src")
-        except Exception:
-            pass
-
-        stand = ""
-        try:
-            stand = card.find_element(By.CSS_SELECTOR, ".directory-stand span:last-child").text.strip()
-        except Exception:
-            pass
-
-        link = name_el.find_element(By.XPATH, "./ancestor::a").get_attribute("href")
-
-        # open detail page in new tab
-        driver.execute_script("window.open(arguments[0], '_blank');", link)
-        driver.switch_to.window(driver.window_handles[1])
-        time.sleep(2)
+        company, link = row["Company"], row["Link"]
+        if company is None or not link:
+            raise ValueError("card has no exhibitor name/link")
+        print(f"{idx}/{len(card_rows)} → {company}")
 
-        wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "main, body")))
+        fields = harvested.get(link)
+        if fields is None:
+            # open detail page in new tab
+            open_tab(driver, link)
+            time.sleep(2)
 
-        def safe(sel):
-            try:
-                return driver.find_element(By.CSS_SELECTOR, sel).text.strip()
-            except Exception:
-                return ""
+            wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, "main, body")))
+            fields = extract_cards(driver, "body", DETAIL_FIELDS)[0]
 
-        description = safe("div[data-testid='exh-content']")
-        country = safe("div[data-testid='exh-country'], span.exhibitor-country")
-
-        # ----- CONTACTS -----
-        website, email, phone = "", "", ""
-        try:
-            links = driver.find_elements(By.CSS_SELECTOR, "div.exhibitor-details-contact-us-links a")
-            for a in links:
-                href = a.get_attribute("href") or ""
-                if href.startswith("mailto:"):
-                    email = href.replace("mailto:", "")
-                elif href.startswith("tel:"):
-                    phone = href.replace("tel:", "")
-                elif href.startswith("http") and "linkedin" not in href:
-                    website = href
-        except Exception:
-            pass
-
-        # ----- SOCIAL MEDIA -----
-        linkedin = facebook = instagram = youtube = twitter = ""
-        try:
-            social_links = driver.find_elements(By.CSS_SELECTOR, "div.social-media-logo-container a")
-            for s in social_links:
-                href = s.get_attribute("href") or ""
-                lower = href.lower()
-                if "linkedin" in lower:
-                    linkedin = href
-                elif "facebook" in lower:
-                    facebook = href
-                elif "instagram" in lower:
-                    instagram = href
-                elif "youtube" in lower:
-                    youtube = href
-                elif "twitter" in lower or "x.com" in lower:
-                    twitter = href
-        except Exception:
-            pass
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
+            time.sleep(1)
 
-        exhibitors.append({
-            "Company": company,
-            "Country": country,
-            "Stand": stand,
-            "Description": description,
-            "Logo": logo,
-            "Website": website,
-            "Email": email,
-            "Phone": phone,
-            "LinkedIn": linkedin,
-            "Facebook": facebook,
-            "Instagram": instagram,
-            "YouTube": youtube,
-            "Twitter": twitter
-        })
-
-        driver.close()
-        driver.switch_to.window(driver.window_handles[0])
-        time.sleep(1)
+        exhibitors.append(exhibitor_record(row, fields))
 
     except Exception as e:
         print(f"⚠️ Error on {idx}: {e}")
         try:
-            driver.close()
-            driver.switch_to.window(driver.window_handles[0])
+            if len(driver.window_handles) > 1:
+                driver.close()
+                driver.switch_to.window(driver.window_handles[0])
         except:
             pass
 
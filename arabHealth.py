@@ -1,4 +1,3 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -7,10 +6,12 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     StaleElementReferenceException,
 )
-import time
+import time, sys
 import pandas as pd
+from driver_factory import make_driver
 
 URL = "https://intersec.ae.messefrankfurt.com/dubai/en/exhibitor-search/exhibitor-search.html"
+SAVE_FILE = "exhibitors_full.xlsx"
 
 # Selectors
 CARD_SEL = "div.ex-exhibitor-search-result-item"
@@ -25,11 +26,16 @@ WEBSITE_SEL = "a.ex-exhibitor-profile__website"
 LINKEDIN_SEL = "a[href*='linkedin']"
 CONTACT_SEL = "a[href^='mailto']"
 
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--log-level=3")
+# ---------------- HTTP MODE ----------------
+# `python arabHealth.py --http` reads the exhibitor-search backend directly, no Chrome
+if "--http" in sys.argv:
+    import logging
+    from messe_frankfurt import MesseFrankfurtClient, save_records
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    save_records(MesseFrankfurtClient(URL).scrape(), SAVE_FILE)
+    sys.exit(0)
 
-driver = webdriver.Chrome(options=options)
+driver = make_driver()
 wait = WebDriverWait(driver, 20)
 
 driver.get(URL)
@@ -137,8 +143,8 @@ finally:
     ])
     if not df.empty:
         df.drop_duplicates(inplace=True)
-        df.to_excel("exhibitors_full.xlsx", index=False)
-        print(f"✅ Saved {len(df)} unique exhibitors to exhibitors_full.xlsx")
+        df.to_excel(SAVE_FILE, index=False)
+        print(f"✅ Saved {len(df)} unique exhibitors to {SAVE_FILE}")
     else:
         print("No data scraped.")
     driver.quit()
\ No newline at end of file
@@ -1,17 +1,12 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import time
+from driver_factory import make_driver
 
 # ---------------- SETUP ----------------
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = make_driver()
 wait = WebDriverWait(driver, 25)
 
 url = "https://arabianorganics.com/pages/exhibitors"
@@ -0,0 +1,170 @@
+"""
+Pull declared card fields for a whole page in one execute_script round-trip.
+
+A field spec maps an output name to (selector, attr):
+    selector  CSS selector inside the card; "" means the card itself;
+              "h3.name < a" means the closest <a> around the h3.name match
+    attr      "text" (rendered text), "html", or an attribute/property name such as
+              "href" or "src"; add "[]" ("text[]", "href[]") to collect every match as a list
+
+Missing elements come back as None (or [] for list fields) so callers keep their own defaults.
+The same specs also run on fetched HTML (extract_cards_html / extract_fields_html), no browser needed.
+"""
+import copy
+import logging
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup
+
+from selenium.common.exceptions import NoSuchElementException, WebDriverException
+from selenium.webdriver.common.by import By
+
+logger = logging.getLogger(__name__)
+
+# Field-spec readers shared with inpage_fetch, which runs them on DOMParser documents
+FIELD_HELPERS_JS = """
+function locate(el, selector) {
+    const [inner, outer] = selector.split('<').map(s => s.trim());
+    if (inner) el = el.querySelector(inner);
+    if (el && outer) el = el.closest(outer);
+    return el;
+}
+function locateAll(el, selector) {
+    const [inner, outer] = selector.split('<').map(s => s.trim());
+    let found = inner ? Array.from(el.querySelectorAll(inner)) : [el];
+    if (outer) found = found.map(e => e.closest(outer)).filter(e => e);
+    return found;
+}
+function textOf(el) {
+    if (el.ownerDocument === document) return (el.innerText || '').trim();
+    // Parsed documents have no layout, so innerText would be plain textContent
+    const clone = el.cloneNode(true);
+    clone.querySelectorAll('br').forEach(br => br.replaceWith('\\n'));
+    return clone.textContent.split('\\n').map(l => l.replace(/\\s+/g, ' ').trim()).filter(l => l).join('\\n');
+}
+function read(el, attr) {
+    if (attr === 'text') return textOf(el);
+    if (attr === 'html') return el.innerHTML;
+    const value = (attr in el && typeof el[attr] === 'string') ? el[attr] : el.getAttribute(attr);
+    return value === null || value === undefined ? null : value;
+}
+function readFields(card, fields) {
+    const out = {};
+    for (const [name, spec] of Object.entries(fields)) {
+        const [selector, attr] = spec;
+        if (attr.endsWith('[]')) {
+            out[name] = locateAll(card, selector).map(e => read(e, attr.slice(0, -2))).filter(v => v !== null);
+        } else {
+            const el = locate(card, selector);
+            out[name] = el ? read(el, attr) : null;
+        }
+    }
+    return out;
+}
+"""
+
+EXTRACT_SCRIPT = FIELD_HELPERS_JS + """
+const cardSelector = arguments[0], fields = arguments[1];
+const root = arguments[2] || document;
+
+return Array.from(root.querySelectorAll(cardSelector)).map(card => readFields(card, fields));
+"""
+
+
+def _read(element, attr):
+    if attr == "text":
+        return element.text.strip()
+    if attr == "html":
+        return element.get_attribute("innerHTML")
+    return element.get_attribute(attr)
+
+
+def _locate_all(card, selector):
+    inner, _, outer = (part.strip() for part in selector.partition("<"))
+    found = card.find_elements(By.CSS_SELECTOR, inner) if inner else [card]
+    if outer:
+        # Fallback only understands a tag name on the right of "<"
+        found = [e.find_element(By.XPATH, f"./ancestor-or-self::{outer}[1]") for e in found]
+    return found
+
+
+def extract_cards_per_element(driver, card_selector, fields):
+    """Same result as extract_cards, one WebDriver call per field (slow path)"""
+    rows = []
+    for card in driver.find_elements(By.CSS_SELECTOR, card_selector):
+        row = {}
+        for name, (selector, attr) in fields.items():
+            try:
+                if attr.endswith("[]"):
+                    row[name] = [v for v in (_read(e, attr[:-2]) for e in _locate_all(card, selector)) if v is not None]
+                else:
+                    found = _locate_all(card, selector)
+                    row[name] = _read(found[0], attr) if found else None
+            except (NoSuchElementException, WebDriverException):
+                row[name] = [] if attr.endswith("[]") else None
+        rows.append(row)
+    return rows
+
+
+def extract_cards(driver, card_selector, fields, batch=True):
+    """Return one dict per card matching card_selector, reading every field in a single execute_script call"""
+    if batch:
+        try:
+            return driver.execute_script(EXTRACT_SCRIPT, card_selector, {k: list(v) for k, v in fields.items()})
+        except WebDriverException as e:
+            logger.warning(f"Batch extraction failed, falling back to per-element reads: {e}")
+    return extract_cards_per_element(driver, card_selector, fields)
+
+
+# ---------------- HTML (no browser) ----------------
+
+def _inner_text(element):
+    """Close to the DOM's innerText: <br> becomes a line break, whitespace collapses within lines"""
+    element = copy.copy(element)  # other fields may still read the same element, so leave the soup as is
+    for br in element.find_all("br"):
+        br.replace_with("\n")
+    lines = (" ".join(line.split()) for line in element.get_text().splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def _read_html(element, attr, base_url):
+    if attr == "text":
+        return _inner_text(element)
+    if attr == "html":
+        return element.decode_contents()
+    value = element.get(attr)
+    if isinstance(value, list):
+        value = " ".join(value)
+    if value is not None and attr in ("href", "src") and base_url:
+        value = urljoin(base_url, value)  # the DOM property is absolute too
+    return value
+
+
+def _locate_all_html(card, selector):
+    inner, _, outer = (part.strip() for part in selector.partition("<"))
+    found = card.select(inner) if inner else [card]
+    if outer:
+        found = [e for e in (e.css.closest(outer) for e in found) if e is not None]
+    return found
+
+
+def _extract(card, fields, base_url):
+    row = {}
+    for name, (selector, attr) in fields.items():
+        found = _locate_all_html(card, selector)
+        if attr.endswith("[]"):
+            row[name] = [v for v in (_read_html(e, attr[:-2], base_url) for e in found) if v is not None]
+        else:
+            row[name] = _read_html(found[0], attr, base_url) if found else None
+    return row
+
+
+def extract_cards_html(html, card_selector, fields, base_url=None):
+    """extract_cards for a fetched page: one dict per card, links resolved against base_url"""
+    soup = BeautifulSoup(html, "html.parser")
+    return [_extract(card, fields, base_url) for card in soup.select(card_selector)]
+
+
+def extract_fields_html(html, fields, base_url=None):
+    """The fields of a whole fetched document or fragment, as one dict"""
+    return _extract(BeautifulSoup(html, "html.parser"), fields, base_url)
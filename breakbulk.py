@@ -1,21 +1,30 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import time
+import sys
 import pandas as pd
+from tab_pool import TabPool
+from driver_factory import make_driver
+from inpage_fetch import harvest
 
 # ---------------- CONFIG ----------------
 URL = "https://middleeast.breakbulk.com/exhibitors"
 SAVE_FILE = "breakbulk_2026.xlsx"
+TAB_POOL_SIZE = 8  # exhibitor tabs kept loading at once
+# `--harvest` fetch()es detail pages from inside the list page (session cookies, no tabs);
+# pages it can't read still go through the tab pool
+HARVEST = "--harvest" in sys.argv
+DETAIL_FIELDS = {
+    "name": (".exhibitor-title-banner h1", "text"),
+    "booth": (".exhibitor-profile-stand", "text"),
+    "contacts": (".exhibitor-contacts", "text"),
+    "contacts_html": (".exhibitor-contacts", "html"),
+    "links": (".exhibitor-contacts a", "href[]"),
+}
 
 # ---------------- SETUP ----------------
-options = webdriver.ChromeOptions()
-options.add_argument("--disable-gpu")
-options.add_argument("--no-sandbox")
-options.add_argument("--start-maximized")
-# options.add_argument("--headless=new")  # optional
-driver = webdriver.Chrome(options=options)
+driver = make_driver()
 
 wait = WebDriverWait(driver, 20)
 data = []
@@ -24,7 +33,14 @@ data = []
 def get_country(contact_element):
     """Extract country text from contact block"""
     try:
-        html = contact_element.get_attribute("innerHTML").split("<br>")
+        return country_from_html(contact_element.get_attribute("innerHTML"))
+    except:
+        return ""
+
+def country_from_html(contact_html):
+    """Line after "Location" in the contact block's HTML"""
+    try:
+        html = (contact_html or "").split("<br>")
         for i, item in enumerate(html):
             if "Location" in item:
                 if i + 1 < len(html):
@@ -75,31 +91,46 @@ def scrape_detail():
 
     return info
 
-def open_and_scrape_all_on_page(links):
-    """Open all exhibitors in new tabs, scrape, then close"""
-    print(f"🟢 Opening {len(links)} exhibitor tabs...")
-
-    # --- Open all tabs ---
-    for href in links:
-        driver.execute_script("window.open(arguments[0], '_blank');", href)
-        time.sleep(0.1)
+def info_from_fields(fields, url):
+    """Same record as scrape_detail, from harvested fields"""
+    info = {
+        "Company name": fields["name"] or "",
+        "Country": country_from_html(fields["contacts_html"]),
+        "Booth No": fields["booth"] or "",
+        "Company Website": "",
+        "Company LinkedIn": "",
+        "Company Contact": fields["contacts"] or "",
+        "URL": url
+    }
+    for href in fields["links"]:
+        if "linkedin.com" in href.lower():
+            info["Company LinkedIn"] = href
+        elif href.startswith("http"):
+            info["Company Website"] = href
+    return info
 
-    # --- Scrape each tab ---
-    for i in range(1, len(driver.window_handles)):
-        driver.switch_to.window(driver.window_handles[i])
-        try:
-            exhibitor = scrape_detail()
-            data.append(exhibitor)
-            print(f"✅ {len(data)} | {exhibitor['Company name'] or '(No Name)'} — {exhibitor['Booth No']}")
-        except Exception as e:
-            print(f"⚠️ Error scraping tab {i}: {e}")
+def open_and_scrape_all_on_page(links):
+    """Scrape exhibitors through in-page fetches (--harvest) and/or a bounded pool of tabs"""
+    scraped = {}
+    if HARVEST:
+        print(f"🟢 Harvesting {len(links)} exhibitors in the page...")
+        for link, fields in zip(links, harvest(driver, links, DETAIL_FIELDS, ready=".exhibitor-title-banner h1")):
+            if fields is not None:
+                scraped[link] = info_from_fields(fields, link)
+
+    todo = [link for link in links if link not in scraped]
+    if todo:
+        print(f"🟢 Scraping {len(todo)} exhibitors, {TAB_POOL_SIZE} tabs at a time...")
+        pool = TabPool(driver, size=TAB_POOL_SIZE, ready_selector=".exhibitor-title-banner h1")
+        scraped.update(zip(todo, pool.run(todo, lambda d: scrape_detail())))
+
+    for link in links:
+        exhibitor = scraped.get(link)
+        if exhibitor is None:
             continue
+        data.append(exhibitor)
+        print(f"✅ {len(data)} | {exhibitor['Company name'] or '(No Name)'} — {exhibitor['Booth No']}")
 
-    # --- Close all tabs except main ---
-    while len(driver.window_handles) > 1:
-        driver.switch_to.window(driver.window_handles[-1])
-        driver.close()
-    driver.switch_to.window(driver.window_handles[0])
     print(f"💾 Completed {len(links)} exhibitors on this page.\n")
 
 # ---------------- MAIN SCRAPING LOOP ----------------
@@ -0,0 +1,119 @@
+import logging
+import queue
+import threading
+
+from selenium.common.exceptions import WebDriverException
+
+from driver_factory import make_driver
+
+logger = logging.getLogger(__name__)
+
+
+def headless_chrome():
+    """Default driver factory for pool workers"""
+    return make_driver("lean")
+
+
+class BrowserPool:
+    """K Chrome drivers pulling page numbers or URL batches from one shared work queue"""
+
+    def __init__(self, make_driver=headless_chrome, size=4):
+        self.make_driver = make_driver
+        self.size = size
+        self.drivers = []
+        self._idle = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        """Reuse an idle driver, or start a new one"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            driver = self.make_driver()
+            with self._lock:
+                self.drivers.append(driver)
+            return driver
+
+    def _discard(self, driver):
+        """Quit a driver whose session died so no later item (or pool user) gets it"""
+        with self._lock:
+            if driver in self.drivers:
+                self.drivers.remove(driver)
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _alive(driver):
+        try:
+            driver.current_window_handle
+            return True
+        except WebDriverException:
+            return False
+
+    def imap(self, func, items):
+        """Yield func(driver, item) for every item, in item order, as soon as each is available"""
+        items = list(items)
+        work = queue.Queue()
+        for index, item in enumerate(items):
+            work.put((index, item))
+        done = queue.Queue()
+
+        def worker():
+            driver = None
+            while True:
+                try:
+                    index, item = work.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    driver = driver or self._acquire()
+                    result = func(driver, item)
+                except Exception as e:
+                    logger.error(f"Worker failed on {item!r}: {e}")
+                    result = None
+                    # A crashed chromedriver or invalid session would fail every later item too
+                    if isinstance(e, WebDriverException) and driver is not None and not self._alive(driver):
+                        logger.warning("Driver session is gone; starting a fresh one")
+                        self._discard(driver)
+                        driver = None
+                done.put((index, result))
+            if driver is not None:
+                self._idle.put(driver)
+
+        threads = [threading.Thread(target=worker, daemon=True) for _ in range(min(self.size, len(items)))]
+        for thread in threads:
+            thread.start()
+
+        # Re-order: hold finished items until every earlier one has been yielded
+        buffered = {}
+        next_index = 0
+        while next_index < len(items):
+            index, result = done.get()
+            buffered[index] = result
+            while next_index in buffered:
+                yield buffered.pop(next_index)
+                next_index += 1
+
+        for thread in threads:
+            thread.join()
+
+    def map(self, func, items):
+        """Like imap, but return the full list"""
+        return list(self.imap(func, items))
+
+    def close(self):
+        for driver in self.drivers:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+        self.drivers = []
+        self._idle = queue.Queue()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,307 @@
+import argparse
+import ctypes
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+import urllib.request
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium import webdriver
+
+from driver_factory import HEADED_ENV, cached_service
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT = 9300  # control server; scripts use SCRAPER_BROWSER_SERVICE=127.0.0.1:9300
+FIRST_DEBUG_PORT = 9310  # Chrome instances listen on 9310, 9311, ...
+RECYCLE_AFTER = 50  # leases before an instance is restarted with a fresh Chrome
+LEASE_WAIT = 600  # seconds a client waits for a free instance
+CHROME_ENV = "CHROME_BINARY"
+CHROME_NAMES = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+
+
+def chrome_binary():
+    path = os.environ.get(CHROME_ENV) or next(filter(None, map(shutil.which, CHROME_NAMES)), None)
+    if not path:
+        raise RuntimeError(f"Chrome not found; set {CHROME_ENV}")
+    return path
+
+
+def _devtools(port, path, method="GET"):
+    request = urllib.request.Request(f"http://127.0.0.1:{port}{path}", method=method)
+    with urllib.request.urlopen(request, timeout=5) as response:
+        body = response.read()
+    return json.loads(body) if body.strip().startswith((b"{", b"[")) else body
+
+
+def _pid_alive(pid):
+    if os.name == "nt":
+        # os.kill(pid, 0) on Windows sends CTRL_C_EVENT instead of probing, so ask the process handle
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+        handle = kernel32.OpenProcess(0x1000, False, pid)  # PROCESS_QUERY_LIMITED_INFORMATION
+        if not handle:
+            return ctypes.get_last_error() == 5  # ERROR_ACCESS_DENIED: exists but isn't ours
+        try:
+            code = ctypes.c_ulong()
+            ok = kernel32.GetExitCodeProcess(handle, ctypes.byref(code))
+            return bool(ok) and code.value == 259  # STILL_ACTIVE
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class ChromeInstance:
+    """One Chrome kept running with remote debugging on `port` and its own profile directory"""
+
+    def __init__(self, port, headless=True):
+        self.port = port
+        self.headless = headless
+        self.profile_dir = tempfile.mkdtemp(prefix=f"scraper-chrome-{port}-")
+        self.process = None
+        self.leases = 0
+
+    def start(self, timeout=30):
+        args = [
+            chrome_binary(), f"--remote-debugging-port={self.port}", f"--user-data-dir={self.profile_dir}",
+            "--no-first-run", "--no-default-browser-check", "--disable-dev-shm-usage",
+            "--disable-blink-features=AutomationControlled", "--window-size=1920,1080",
+        ]
+        if self.headless:
+            args.append("--headless=new")
+        self.process = subprocess.Popen(args + ["about:blank"], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        self.leases = 0
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            try:
+                _devtools(self.port, "/json/version")
+                return self
+            except OSError:
+                time.sleep(0.2)
+        raise RuntimeError(f"Chrome on port {self.port} did not come up")
+
+    def alive(self):
+        return self.process is not None and self.process.poll() is None
+
+    def reset(self):
+        """Back to a single blank tab for the next lease"""
+        _devtools(self.port, "/json/new?about:blank", method="PUT")
+        pages = [t for t in _devtools(self.port, "/json/list") if t["type"] == "page"]
+        for target in pages:
+            if target["url"] != "about:blank":
+                _devtools(self.port, f"/json/close/{target['id']}")
+        for target in [t for t in pages if t["url"] == "about:blank"][1:]:
+            _devtools(self.port, f"/json/close/{target['id']}")
+
+    def stop(self):
+        if self.alive():
+            self.process.terminate()
+            try:
+                self.process.wait(10)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+
+
+class BrowserService:
+    """Pre-warmed Chrome instances leased to scraper processes one at a time"""
+
+    def __init__(self, size=4, first_port=FIRST_DEBUG_PORT, headless=True):
+        self.instances = [ChromeInstance(first_port + i, headless) for i in range(size)]
+        self.idle = []
+        self.leases = {}  # lease id → (instance, client pid, leased at)
+        self._cond = threading.Condition()
+
+    def start(self):
+        threads = [threading.Thread(target=instance.start) for instance in self.instances]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.idle = [instance for instance in self.instances if instance.alive()]
+        logger.info(f"Browser service: {len(self.idle)} Chrome instances warm "
+                    f"on ports {', '.join(str(i.port) for i in self.idle)}")
+
+    def _reap(self):
+        """Take back leases whose client process died without releasing; called with the lock held"""
+        for lease_id, (instance, pid, _) in list(self.leases.items()):
+            if not _pid_alive(pid):
+                logger.warning(f"Lease {lease_id} of dead pid {pid} reclaimed")
+                del self.leases[lease_id]
+                self._return(instance)
+
+    def _return(self, instance):
+        # Resetting or restarting Chrome takes seconds; other leases and releases must not wait on it
+        threading.Thread(target=self._recycle, args=(instance,), daemon=True).start()
+
+    def _recycle(self, instance):
+        """Reset or restart a returned instance without holding the lock, then make it leasable again"""
+        try:
+            if not instance.alive() or instance.leases >= RECYCLE_AFTER:
+                instance.stop()
+                instance.start()
+            else:
+                instance.reset()
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"Chrome on port {instance.port} restarted after failed reset: {e}")
+            try:
+                instance.stop()
+                instance.start()
+            except (OSError, RuntimeError) as e:
+                logger.error(f"Chrome on port {instance.port} could not be restarted, dropping it: {e}")
+                instance.stop()
+                with self._cond:
+                    self.instances.remove(instance)
+                    self._cond.notify_all()
+                return
+        with self._cond:
+            self.idle.append(instance)
+            self._cond.notify()
+
+    def lease(self, pid, wait=LEASE_WAIT):
+        """Block until an instance is free; {"lease": id, "port": debug port}, or None on timeout"""
+        deadline = time.time() + wait
+        with self._cond:
+            while not self.idle:
+                if not self.instances:
+                    return None
+                self._reap()
+                if not self.idle and not self._cond.wait(min(5, max(0, deadline - time.time()))):
+                    if time.time() >= deadline:
+                        return None
+            instance = self.idle.pop(0)
+            instance.leases += 1
+            lease_id = uuid.uuid4().hex
+            self.leases[lease_id] = (instance, pid, time.time())
+        return {"lease": lease_id, "port": instance.port}
+
+    def release(self, lease_id):
+        with self._cond:
+            lease = self.leases.pop(lease_id, None)
+        if lease:
+            self._return(lease[0])
+
+    def status(self):
+        with self._cond:
+            return {
+                "instances": len(self.instances),
+                "idle": len(self.idle),
+                "leases": [{"lease": k, "port": i.port, "pid": pid, "seconds": round(time.time() - t)}
+                           for k, (i, pid, t) in self.leases.items()],
+            }
+
+    def stop(self):
+        for instance in self.instances:
+            instance.stop()
+
+
+class _Handler(BaseHTTPRequestHandler):
+    service = None
+
+    def _reply(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._reply(200, self.service.status())
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)) or b"{}")
+        if self.path == "/lease":
+            lease = self.service.lease(payload.get("pid", 0), payload.get("wait", LEASE_WAIT))
+            self._reply(200 if lease else 503, lease or {"error": "no browser free"})
+        elif self.path == "/release":
+            self.service.release(payload.get("lease"))
+            self._reply(200, {})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def serve(size=4, port=DEFAULT_PORT, headless=True):
+    """Warm up `size` Chrome instances and serve leases on 127.0.0.1:port until interrupted"""
+    service = BrowserService(size, headless=headless)
+    service.start()
+    _Handler.service = service
+    server = ThreadingHTTPServer(("127.0.0.1", port), _Handler)
+    logger.info(f"Browser service listening on 127.0.0.1:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+
+
+# ---------------- CLIENT ----------------
+
+def _call(address, path, payload, timeout):
+    request = urllib.request.Request(f"http://{address}{path}", data=json.dumps(payload).encode("utf-8"),
+                                     headers={"Content-Type": "application/json"}, method="POST")
+    with urllib.request.urlopen(request, timeout=timeout) as response:
+        return json.loads(response.read())
+
+
+class LeasedChrome(webdriver.Chrome):
+    """WebDriver session attached to a leased Chrome; quit() hands the browser back instead of closing it"""
+
+    def quit(self):
+        try:
+            self.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            pass
+        try:
+            super().quit()  # stops only chromedriver; it did not launch this Chrome
+        finally:
+            _call(self.service_address, "/release", {"lease": self.lease_id}, timeout=30)
+
+
+def lease_driver(address, options=None, page_load_strategy="eager", wait=LEASE_WAIT):
+    """Lease a warm Chrome from the service at address and attach a WebDriver session to it"""
+    lease = _call(address, "/lease", {"pid": os.getpid(), "wait": wait}, timeout=wait + 30)
+    attach = webdriver.ChromeOptions()
+    attach.debugger_address = f"127.0.0.1:{lease['port']}"
+    attach.page_load_strategy = page_load_strategy
+    # Launch flags can't apply to a running Chrome, but capabilities like the performance log can
+    if options is not None and "goog:loggingPrefs" in options.to_capabilities():
+        attach.set_capability("goog:loggingPrefs", options.to_capabilities()["goog:loggingPrefs"])
+    try:
+        driver = LeasedChrome(options=attach, service=cached_service())
+    except Exception:
+        # Nothing will ever quit() this session, so hand the browser back now
+        _call(address, "/release", {"lease": lease["lease"]}, timeout=30)
+        raise
+    driver.lease_id = lease["lease"]
+    driver.service_address = address
+    logger.info(f"Leased Chrome on port {lease['port']} from {address}")
+    return driver
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Keep warm Chrome instances that scrapers lease instead of launching")
+    parser.add_argument("--size", type=int, default=4, help="Chrome instances to keep running")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="control server port")
+    args = parser.parse_args()
+    serve(args.size, args.port, headless=not os.environ.get(HEADED_ENV))
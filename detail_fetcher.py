@@ -0,0 +1,229 @@
+import asyncio
+import logging
+import time
+import argparse
+import os
+import threading
+from contextlib import asynccontextmanager
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from functools import partial
+from urllib.parse import urlsplit
+
+import aiohttp
+import requests
+from bs4 import BeautifulSoup
+
+from rate_limiter import HostLimiter, get_limiter
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+logger = logging.getLogger(__name__)
+
+
+def parse_detail_page(html):
+    """Extract website, email, LinkedIn, categories and description from an exhibitor detail page"""
+    soup = BeautifulSoup(html, 'html.parser')
+
+    detailed_info = {}
+
+    # Extract website
+    website_element = soup.find('i', class_='fa-solid fa-globe')
+    if website_element:
+        website_parent = website_element.parent
+        if website_parent:
+            website_link = website_parent.find('a')
+            if website_link:
+                website_url = website_link.get('href', '').strip()
+                if website_url and website_url != 'N/A':
+                    detailed_info['website'] = website_url
+
+    # Extract email (if available)
+    email_element = soup.find('i', class_='fa-regular fa-envelope')
+    if email_element:
+        email_parent = email_element.parent
+        if email_parent:
+            email_link = email_parent.find('a')
+            if email_link and 'mailto:' in email_link.get('href', ''):
+                email = email_link.get('href', '').replace('mailto:', '').strip()
+                if email:
+                    detailed_info['email'] = email
+
+    # Extract LinkedIn page (if available)
+    for social_link in soup.select('.social-links a'):
+        if 'linkedin.com' in social_link.get('href', ''):
+            detailed_info['linkedin'] = social_link['href'].strip()
+            break
+
+    # Extract categories
+    categories = []
+    badge_elements = soup.find_all('span', class_='badge bg-secondary')
+    for badge in badge_elements:
+        category_text = badge.text.strip()
+        if category_text:
+            categories.append(category_text)
+    detailed_info['categories'] = categories
+
+    # Extract company description
+    about_tab = soup.find('div', id='pills-About')
+    description = ""
+    if about_tab:
+        paragraphs = about_tab.find_all('p')
+        description_texts = []
+        for p in paragraphs:
+            text = p.get_text(strip=True)
+            if text and len(text) > 10:  # Only include substantial text
+                description_texts.append(text)
+        description = ' '.join(description_texts)
+    detailed_info['description'] = description
+
+    return detailed_info
+
+
+class _HostSlots:
+    """per_host requests in flight per host, shared by every thread and event loop using the fetcher"""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    @asynccontextmanager
+    async def hold(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            semaphore = self._semaphores[host]
+        # A threading semaphore, since each fetch_all call runs its own event loop; poll instead of blocking it
+        while not semaphore.acquire(blocking=False):
+            await asyncio.sleep(0.05)
+        try:
+            yield
+        finally:
+            semaphore.release()
+
+
+class AsyncDetailFetcher:
+    """Fetch many exhibitor detail pages concurrently over pooled keep-alive connections"""
+
+    def __init__(self, per_host=8, total=32, timeout=15, retries=3, backoff=0.5, headers=None, limiter=None,
+                 cache=None):
+        self.per_host = per_host
+        self.total = total
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = headers or DEFAULT_HEADERS
+        self.limiter = limiter or get_limiter()
+        self.cache = cache  # optional http_cache.HttpCache
+        self.slots = _HostSlots(per_host)  # shared, so shows fetching from one host together stay within per_host
+
+    async def _fetch_one(self, session, url):
+        """Fetch and parse one detail page, retrying transient failures"""
+        entry = self.cache.lookup(url) if self.cache else None
+        if entry and self.cache.is_fresh(entry):
+            return parse_detail_page(self.cache.hit(url, entry).content)
+        headers = self.cache.conditional_headers(entry) if self.cache else {}
+
+        for attempt in range(1, self.retries + 1):
+            try:
+                # Hold a per-host slot so no request times out queued behind the connection pool
+                async with self.slots.hold(url):
+                    await self.limiter.acquire_async(url)
+                    async with session.get(url, headers=headers) as response:
+                        if response.status == 304 and entry:
+                            return parse_detail_page(self.cache.hit(url, entry, revalidated=True).content)
+                        response.raise_for_status()
+                        html = await response.read()
+                        if self.cache:
+                            self.cache.miss(url, entry, response.status, response.headers, html)
+                return parse_detail_page(html)
+            except aiohttp.ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == self.retries:
+                    logger.error(f"Error getting detailed info from {url}: {e}")
+                    return {}
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == self.retries:
+                    logger.error(f"Error getting detailed info from {url}: {e}")
+                    return {}
+            await asyncio.sleep(self.backoff * 2 ** (attempt - 1))
+        return {}
+
+    async def fetch_all_async(self, urls):
+        """Return a {url: detailed_info} dict for every unique URL"""
+        unique_urls = list(dict.fromkeys(u for u in urls if u))
+        connector = aiohttp.TCPConnector(limit=self.total, limit_per_host=self.per_host)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=self.headers) as session:
+            results = await asyncio.gather(*(self._fetch_one(session, url) for url in unique_urls))
+        return dict(zip(unique_urls, results))
+
+    def fetch_all(self, urls):
+        """Blocking wrapper around fetch_all_async for the synchronous scrapers"""
+        return asyncio.run(self.fetch_all_async(urls))
+
+
+# ---------------- BENCHMARK ----------------
+class _SlowHandler(SimpleHTTPRequestHandler):
+    """Serve recorded detail pages with an artificial per-request latency"""
+    protocol_version = "HTTP/1.1"
+    delay = 0.0
+
+    def do_GET(self):
+        time.sleep(self.delay)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run_benchmark(fixtures_dir, delay=0.2, repeat=5, per_host=8):
+    """Compare the serial requests.Session path against AsyncDetailFetcher on a local stand-in server"""
+    pages = sorted(f for f in os.listdir(fixtures_dir) if f.endswith(('.html', '.htm')))
+    if not pages:
+        raise SystemExit(f"No .html fixtures found in {fixtures_dir}")
+
+    handler = partial(type("Handler", (_SlowHandler,), {"delay": delay}), directory=fixtures_dir)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [f"{base}/{name}?copy={i}" for i in range(repeat) for name in pages]
+
+    try:
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        start = time.perf_counter()
+        serial = {}
+        for url in urls:
+            response = session.get(url, timeout=10)
+            response.raise_for_status()
+            serial[url] = parse_detail_page(response.content)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        # Local server: measure connection concurrency, not the politeness budget
+        unlimited = HostLimiter(rate=10_000, burst=10_000)
+        concurrent = AsyncDetailFetcher(per_host=per_host, limiter=unlimited).fetch_all(urls)
+        async_time = time.perf_counter() - start
+    finally:
+        server.shutdown()
+
+    mismatches = sum(1 for url in urls if serial[url] != concurrent.get(url))
+    print(f"Detail pages: {len(urls)} ({len(pages)} fixtures x {repeat}), latency {delay:.2f}s")
+    print(f"Serial requests.Session: {serial_time:.2f}s ({len(urls) / serial_time:.1f} pages/s)")
+    print(f"AsyncDetailFetcher (per_host={per_host}): {async_time:.2f}s ({len(urls) / async_time:.1f} pages/s)")
+    print(f"Speed-up: {serial_time / async_time:.1f}x, mismatched results: {mismatches}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the async detail fetcher against recorded detail pages")
+    parser.add_argument("fixtures_dir", help="directory of saved exhibitor detail pages (*.html)")
+    parser.add_argument("--delay", type=float, default=0.2, help="simulated server latency per request in seconds")
+    parser.add_argument("--repeat", type=int, default=5, help="how many times each fixture is requested")
+    parser.add_argument("--per-host", type=int, default=8, help="concurrent connections per host")
+    args = parser.parse_args()
+    run_benchmark(args.fixtures_dir, args.delay, args.repeat, args.per_host)
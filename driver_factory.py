@@ -0,0 +1,147 @@
+import json
+import logging
+import os
+import time
+
+from selenium import webdriver
+from selenium.common.exceptions import SessionNotCreatedException
+from selenium.webdriver.chrome.service import Service
+
+try:
+    from webdriver_manager.chrome import ChromeDriverManager
+except ImportError:
+    ChromeDriverManager = None
+
+logger = logging.getLogger(__name__)
+
+HEADED_ENV = "SCRAPER_HEADED"  # SCRAPER_HEADED=1 shows the browser window, e.g. to debug a selector
+SERVICE_ENV = "SCRAPER_BROWSER_SERVICE"  # host:port of a running browser_service.py to lease Chrome from
+CHROMEDRIVER_ENV = "CHROMEDRIVER"  # explicit chromedriver path, skips resolution entirely
+DRIVER_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "scrapers", "chromedriver.json")
+DRIVER_MAX_AGE = 7 * 24 * 3600
+
+# Resource groups the lean profile keeps Chrome from downloading, as Network.setBlockedURLs patterns
+BLOCKED = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.m3u8", "*.mp3", "*.ogg", "*.wav", "*youtube.com/embed/*", "*player.vimeo.com/*"],
+    "trackers": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*connect.facebook.net*",
+        "*hotjar.com*", "*clarity.ms*", "*snap.licdn.com*", "*bat.bing.com*", "*analytics.tiktok.com*",
+    ],
+}
+
+PROFILES = {
+    # Headless, returns at DOMContentLoaded, downloads only documents, scripts, CSS and XHR
+    "lean": {"headless": True, "page_load_strategy": "eager", "block": tuple(BLOCKED)},
+    # What the scripts used to launch: visible, full page loads, nothing blocked
+    "full": {"headless": False, "page_load_strategy": "normal", "block": ()},
+}
+
+
+def blocked_patterns(groups, allow=()):
+    """URL patterns for the blocked groups, minus allowed groups ("fonts") or single patterns ("*.svg")"""
+    patterns = []
+    for group in groups:
+        if group not in allow:
+            patterns.extend(p for p in BLOCKED[group] if p not in allow)
+    return patterns
+
+
+def chromedriver_path(refresh=False):
+    """
+    chromedriver binary, resolved by webdriver_manager at most once a week instead of on every run;
+    None leaves it to Selenium Manager, which keeps its own cache.
+    """
+    if os.environ.get(CHROMEDRIVER_ENV):
+        return os.environ[CHROMEDRIVER_ENV]
+    if not refresh:
+        try:
+            with open(DRIVER_CACHE, encoding="utf-8") as f:
+                cached = json.load(f)
+            if os.path.exists(cached["path"]) and time.time() - cached["resolved_at"] < DRIVER_MAX_AGE:
+                return cached["path"]
+        except (OSError, ValueError, KeyError):
+            pass
+    if ChromeDriverManager is None:
+        return None
+    path = ChromeDriverManager().install()
+    os.makedirs(os.path.dirname(DRIVER_CACHE), exist_ok=True)
+    with open(DRIVER_CACHE, "w", encoding="utf-8") as f:
+        json.dump({"path": path, "resolved_at": time.time()}, f)
+    return path
+
+
+def cached_service(refresh=False):
+    path = chromedriver_path(refresh)
+    return Service(path) if path else Service()
+
+
+def block_resources(driver, patterns=None):
+    """
+    Apply the driver's block list to the current tab; CDP settings are per target, so call this again
+    after switching to a tab the script opened itself.
+    """
+    patterns = getattr(driver, "blocked_urls", []) if patterns is None else patterns
+    if patterns:
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+
+
+def open_tab(driver, url):
+    """Open url in a new tab and switch to it, with the block list applied before the page loads"""
+    driver.switch_to.new_window("tab")
+    block_resources(driver)
+    driver.get(url)
+    return driver.current_window_handle
+
+
+def make_driver(profile="lean", allow=(), headless=None, options=None, service=None, page_load_strategy=None):
+    """
+    Chrome built from a profile. `allow` is the site's allowlist: groups or patterns it actually needs.
+    `options` may carry script-specific settings (user agent, performance log) to build on.
+    With SCRAPER_BROWSER_SERVICE set, a warm Chrome is leased from the browser service instead.
+    """
+    settings = PROFILES[profile]
+    patterns = blocked_patterns(settings["block"], allow)
+    if os.environ.get(SERVICE_ENV):
+        from browser_service import lease_driver  # imported here: browser_service builds on this module
+        driver = lease_driver(os.environ[SERVICE_ENV], options, page_load_strategy or settings["page_load_strategy"])
+        driver.blocked_urls = patterns
+        block_resources(driver)
+        return driver
+
+    if headless is None:
+        headless = settings["headless"]
+    if os.environ.get(HEADED_ENV):
+        headless = False
+
+    options = options or webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    else:
+        options.add_argument("--start-maximized")
+    options.add_argument("--disable-blink-features=AutomationControlled")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--log-level=3")
+    options.add_experimental_option("excludeSwitches", ["enable-automation"])
+    options.add_experimental_option("useAutomationExtension", False)
+    options.page_load_strategy = page_load_strategy or settings["page_load_strategy"]
+
+    if "images" in settings["block"] and "images" not in allow:
+        # Also covers tabs opened later, which the CDP block list does not reach
+        options.add_argument("--blink-settings=imagesEnabled=false")
+
+    try:
+        driver = webdriver.Chrome(options=options, service=service or cached_service())
+    except SessionNotCreatedException:
+        if service is not None:
+            raise
+        # Chrome updated itself since the cached driver was resolved
+        driver = webdriver.Chrome(options=options, service=cached_service(refresh=True))
+    driver.blocked_urls = patterns
+    block_resources(driver)
+    logger.info(f"Chrome ({profile}, {'headless' if headless else 'headed'}, "
+                f"{options.page_load_strategy} load, {len(patterns)} blocked patterns)")
+    return driver
@@ -0,0 +1,211 @@
+import argparse
+import hashlib
+import logging
+import re
+from collections import Counter, defaultdict
+from difflib import SequenceMatcher
+
+from exhibitor_store import STORE_PATH, ExhibitorStore
+from sinks import XlsxSink
+
+try:
+    from rapidfuzz import fuzz
+except ImportError:
+    fuzz = None
+
+logger = logging.getLogger(__name__)
+
+THRESHOLD = 90  # token-sorted name similarity (0-100) that counts as the same company
+NGRAM = 3
+RARE_GRAMS = 4  # each name is only blocked on its rarest n-grams
+MAX_BLOCK = 200  # bigger blocks (a portal domain, " co") say nothing about identity
+
+# Free-mail and social domains are not company websites
+GENERIC_DOMAINS = {
+    "gmail.com", "hotmail.com", "yahoo.com", "outlook.com", "live.com", "icloud.com",
+    "linkedin.com", "facebook.com", "instagram.com", "twitter.com", "x.com", "youtube.com",
+    "google.com", "wa.me", "bit.ly", "linktr.ee",
+}
+
+LEGAL_WORDS = {
+    "the", "and", "co", "company", "llc", "l", "c", "ltd", "limited", "inc", "corp", "corporation",
+    "plc", "fze", "fzco", "fzc", "fz", "fzllc", "dmcc", "est", "establishment", "gmbh", "ag", "sa",
+    "spa", "srl", "bv", "wll", "pjsc", "psc", "trading", "group", "international", "intl",
+}
+
+LINKEDIN_SLUG = re.compile(r"linkedin\.com/(?:company|school|showcase)/([^/?#]+)", re.I)
+
+
+def core_name(name_norm):
+    """Normalized name without legal-form and filler words: "acme trading llc" → "acme\""""
+    words = [w for w in (name_norm or "").split() if w not in LEGAL_WORDS]
+    return " ".join(words) or (name_norm or "")
+
+
+def linkedin_slug(url):
+    match = LINKEDIN_SLUG.search(url or "")
+    return match.group(1).lower() if match else ""
+
+
+def name_grams(core):
+    padded = f" {core} "
+    return {padded[i:i + NGRAM] for i in range(len(padded) - NGRAM + 1)}
+
+
+def similar(a, b, threshold=THRESHOLD):
+    """Token-order-insensitive similarity of at least threshold (0-100), cheapest checks first"""
+    if 200 * min(len(a), len(b)) < threshold * (len(a) + len(b)):
+        return False  # the length difference alone rules it out
+    if fuzz is not None:
+        return fuzz.token_sort_ratio(a, b, score_cutoff=threshold) >= threshold
+    matcher = SequenceMatcher(None, " ".join(sorted(a.split())), " ".join(sorted(b.split())), autojunk=False)
+    return matcher.quick_ratio() * 100 >= threshold and matcher.ratio() * 100 >= threshold
+
+
+class UnionFind:
+    def __init__(self, size):
+        self.parent = list(range(size))
+
+    def find(self, i):
+        while self.parent[i] != i:
+            self.parent[i] = self.parent[self.parent[i]]
+            i = self.parent[i]
+        return i
+
+    def union(self, i, j):
+        i, j = self.find(i), self.find(j)
+        if i != j:
+            self.parent[max(i, j)] = min(i, j)
+
+
+def _blocks(values):
+    """index → key pairs grouped into {key: [indexes]}, skipping empty keys and oversized blocks"""
+    blocks = defaultdict(list)
+    for i, key in values:
+        if key:
+            blocks[key].append(i)
+    return {k: v for k, v in blocks.items() if 1 < len(v) <= MAX_BLOCK}
+
+
+def cluster(rows, threshold=THRESHOLD):
+    """Union-find over exhibitor rows: same website domain, same LinkedIn page, or near-identical names"""
+    uf = UnionFind(len(rows))
+    domains = [r["domain"] if r["domain"] not in GENERIC_DOMAINS else "" for r in rows]
+
+    # Exact identifiers: everyone in the block is the same company
+    for block in list(_blocks(enumerate(domains)).values()) + \
+            list(_blocks((i, linkedin_slug(r["linkedin"])) for i, r in enumerate(rows)).values()):
+        for i in block[1:]:
+            uf.union(block[0], i)
+
+    # Names: block on each name's rarest n-grams, then score only the pairs that share a block
+    cores = [core_name(r["name_norm"]) for r in rows]
+    grams = [name_grams(c) for c in cores]
+    frequency = Counter(g for gs in grams for g in gs)
+    by_gram = defaultdict(list)
+    for i, gs in enumerate(grams):
+        for g in sorted(gs, key=lambda g: (frequency[g], g))[:RARE_GRAMS]:
+            by_gram[g].append(i)
+
+    compared = matched = 0
+    seen = set()
+    for block in by_gram.values():
+        if len(block) > MAX_BLOCK:
+            continue
+        for a, i in enumerate(block):
+            for j in block[a + 1:]:
+                if (i, j) in seen or uf.find(i) == uf.find(j):
+                    continue
+                seen.add((i, j))
+                if domains[i] and domains[j] and domains[i] != domains[j]:
+                    continue  # different websites: namesakes, not the same company
+                compared += 1
+                if cores[i] == cores[j] or similar(cores[i], cores[j], threshold):
+                    uf.union(i, j)
+                    matched += 1
+    logger.info(f"Entity resolution: {compared} name pairs scored, {matched} merged "
+                f"(all-pairs would be {len(rows) * (len(rows) - 1) // 2})")
+
+    clusters = defaultdict(list)
+    for i in range(len(rows)):
+        clusters[uf.find(i)].append(i)
+    return list(clusters.values())
+
+
+def _new_id(anchor):
+    return "C" + hashlib.sha1(anchor.encode("utf-8")).hexdigest()[:12]
+
+
+def assign_ids(rows, clusters, previous=None):
+    """
+    {(show, key): company_id}. A cluster keeps the ID most of its rows had last run, so IDs survive
+    re-scrapes and new shows; new clusters get an ID hashed from their domain, LinkedIn slug or name.
+    """
+    previous = previous or {}
+    ids, taken = {}, set()
+    for members in sorted(clusters, key=len, reverse=True):
+        members_keys = [(rows[i]["show"], rows[i]["key"]) for i in members]
+        votes = Counter(previous[k] for k in members_keys if k in previous)
+        company_id = next((cid for cid, _ in sorted(votes.items(), key=lambda v: (-v[1], v[0]))
+                           if cid not in taken), None)
+        if company_id is None:
+            anchor = (min((rows[i]["domain"] for i in members if rows[i]["domain"] not in GENERIC_DOMAINS
+                           and rows[i]["domain"]), default="")
+                      or min((linkedin_slug(rows[i]["linkedin"]) for i in members), default="")
+                      or min(core_name(rows[i]["name_norm"]) for i in members))
+            company_id = _new_id(anchor)
+            if company_id in taken:
+                company_id = _new_id(anchor + "|" + min("|".join(k) for k in members_keys))
+        taken.add(company_id)
+        for k in members_keys:
+            ids[k] = company_id
+    return ids
+
+
+def _first(members, field):
+    return next((m[field] for m in members if m[field]), "")
+
+
+def companies(rows, ids):
+    """One row per company ID: best-known name, website, country and the shows it exhibits at"""
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[ids[(row["show"], row["key"])]].append(row)
+    result = []
+    for company_id, members in grouped.items():
+        result.append({
+            "Company ID": company_id,
+            "Company Name": Counter(m["company_name"] for m in members).most_common(1)[0][0],
+            "Website": _first(members, "website"),
+            "LinkedIn": _first(members, "linkedin"),
+            "Country": _first(members, "country"),
+            "Shows": ", ".join(sorted({m["show"] for m in members})),
+            "Show Count": len({m["show"] for m in members}),
+            "Records": len(members),
+        })
+    return sorted(result, key=lambda c: (-c["Show Count"], c["Company Name"].lower()))
+
+
+def resolve_store(store, threshold=THRESHOLD):
+    """Cluster every row in the store, persist stable company IDs and return the company list"""
+    rows = store.rows()
+    ids = assign_ids(rows, cluster(rows, threshold), store.company_ids())
+    store.save_company_ids(ids)
+    return companies(rows, ids)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Assign stable company IDs across every show in the exhibitor store")
+    parser.add_argument("--db", default=STORE_PATH)
+    parser.add_argument("--threshold", type=int, default=THRESHOLD)
+    parser.add_argument("-o", "--output", help="also write the company list to this xlsx")
+    args = parser.parse_args()
+
+    result = resolve_store(ExhibitorStore(args.db), args.threshold)
+    if args.output:
+        with XlsxSink(args.output, list(result[0]) if result else ["Company ID"]) as sink:
+            sink.write_many(result)
+    multi = sum(1 for c in result if c["Show Count"] > 1)
+    print(f"🏢 {sum(c['Records'] for c in result)} exhibitor rows → {len(result)} companies, "
+          f"{multi} at more than one show")
@@ -1,21 +1,14 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 import time
+from driver_factory import make_driver, open_tab
 
 BASE_URL = "https://evautoshowonline.com/exhibitorlist.aspx"
 
 def init_driver():
-    options = Options()
-    options.add_argument("--start-maximized")
-    # options.add_argument("--headless")  # uncomment if you don’t want to see Chrome
-    service = Service()  # if chromedriver is in PATH
-    driver = webdriver.Chrome(service=service, options=options)
-    return driver
+    return make_driver()
 
 def scrape_exhibitors():
     driver = init_driver()
@@ -37,8 +30,7 @@ def scrape_exhibitors():
             print(f"[{idx}] {name} - {stand}")
 
             # open details page
-            driver.execute_script("window.open(arguments[0]);", more_link)
-            driver.switch_to.window(driver.window_handles[1])
+            open_tab(driver, more_link)
 
             # wait for company name
             wait.until(EC.presence_of_element_located((By.ID, "cphContents_lblCompanyNamehead")))
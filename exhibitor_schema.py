@@ -0,0 +1,83 @@
+import json
+import math
+import re
+
+# Canonical exhibitor fields and the column names the scrapers use for them, in priority order:
+# the first alias present with a non-empty value wins.
+FIELD_ALIASES = {
+    "company_name": ("Company Name", "Company name", "Exhibitor Name", "Name", "name", "Company", "company_name"),
+    "booth": ("Booth No", "Stand Number", "Stand", "Booth", "stand_info", "Hall & Stand", "Stand Info", "booth"),
+    "hall": ("Hall", "hall"),
+    "country": ("Country", "country", "Location"),
+    "city": ("City", "city"),
+    "address": ("Full Address", "Address", "address"),
+    "website": ("Company Website", "Website", "website", "Websites"),
+    "email": ("Email", "email"),
+    "phone": ("Company Contact", "Phone", "phone", "Contact"),
+    "linkedin": ("Company LinkedIn", "LinkedIn", "linkedin"),
+    "facebook": ("Facebook", "facebook"),
+    "instagram": ("Instagram", "instagram"),
+    "youtube": ("YouTube", "youtube"),
+    "description": ("Full Description", "Description", "description", "Short Description", "About"),
+    "categories": ("All Sectors", "Sectors", "categories", "Categories", "Sector", "Business Activity"),
+    "detail_url": ("URL", "detail_url", "Detail URL", "Profile URL", "Link"),
+    "logo_url": ("Logo URL", "Logo", "image_url"),
+}
+
+LIST_FIELDS = ("categories",)
+
+# Bookkeeping columns that are dropped instead of landing in `extra`
+IGNORED_COLUMNS = ("Order", "Total Sectors", "Profile Scraped")
+
+FIELDS = ("show", "run_date") + tuple(FIELD_ALIASES) + ("extra",)
+
+
+def _is_blank(value):
+    return value is None or (isinstance(value, float) and math.isnan(value)) or value == "" or value == "N/A"
+
+
+def _text(value):
+    if _is_blank(value):
+        return None
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return str(value).strip() or None
+
+
+def _list(value):
+    if _is_blank(value):
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(v).strip() for v in value if str(v).strip()]
+    return [part.strip() for part in re.split(r"[,;]", str(value)) if part.strip()]
+
+
+def to_canonical(record, show, run_date):
+    """Map one scraper record onto the shared schema; unmapped columns are kept as JSON in `extra`"""
+    row = {"show": show, "run_date": run_date}
+    used = set()
+    for field, aliases in FIELD_ALIASES.items():
+        value = None
+        for alias in aliases:
+            if alias in record and not _is_blank(record[alias]):
+                value = record[alias]
+                used.add(alias)
+                break
+        row[field] = _list(value) if field in LIST_FIELDS else _text(value)
+    # Every alias counts as mapped, even when a higher-priority one supplied the value
+    used.update(alias for aliases in FIELD_ALIASES.values() for alias in aliases)
+
+    extra = {k: _text(v) for k, v in record.items()
+             if k not in used and k not in IGNORED_COLUMNS and not k.startswith("_") and not _is_blank(v)}
+    row["extra"] = json.dumps(extra, ensure_ascii=False) if extra else None
+    return row
+
+
+def arrow_schema(pa, partitioned=True):
+    """pyarrow schema of a canonical row; show/run_date live in the directory path when partitioned"""
+    fields = []
+    for name in FIELDS:
+        if partitioned and name in ("show", "run_date"):
+            continue
+        fields.append(pa.field(name, pa.list_(pa.string()) if name in LIST_FIELDS else pa.string()))
+    return pa.schema(fields)
@@ -0,0 +1,175 @@
+import argparse
+import json
+import os
+import sqlite3
+import threading
+from datetime import date
+from urllib.parse import urlsplit
+
+from exhibitor_schema import FIELD_ALIASES, LIST_FIELDS, to_canonical
+from incremental import load_records, normalize, normalize_url
+
+STORE_PATH = os.environ.get("SCRAPER_STORE", "exhibitors.sqlite")
+
+COLUMNS = tuple(FIELD_ALIASES) + ("extra",)
+
+SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS exhibitors (
+    show TEXT NOT NULL,
+    key TEXT NOT NULL,
+    {", ".join(f"{c} TEXT" for c in COLUMNS)},
+    name_norm TEXT,
+    domain TEXT,
+    country_norm TEXT,
+    first_seen TEXT,
+    last_seen TEXT,
+    PRIMARY KEY (show, key)
+);
+CREATE INDEX IF NOT EXISTS exhibitors_name ON exhibitors (name_norm);
+CREATE INDEX IF NOT EXISTS exhibitors_domain ON exhibitors (domain);
+CREATE INDEX IF NOT EXISTS exhibitors_country ON exhibitors (country_norm);
+CREATE TABLE IF NOT EXISTS company_ids (
+    show TEXT NOT NULL,
+    key TEXT NOT NULL,
+    company_id TEXT NOT NULL,
+    PRIMARY KEY (show, key)
+);
+CREATE INDEX IF NOT EXISTS company_ids_company ON company_ids (company_id);
+"""
+
+# Re-scraping a show refreshes the data but keeps when we first saw the exhibitor
+UPSERT = f"""
+INSERT INTO exhibitors (show, key, {", ".join(COLUMNS)}, name_norm, domain, country_norm, first_seen, last_seen)
+VALUES ({", ".join("?" * (len(COLUMNS) + 7))})
+ON CONFLICT (show, key) DO UPDATE SET
+    {", ".join(f"{c} = excluded.{c}" for c in COLUMNS)},
+    name_norm = excluded.name_norm, domain = excluded.domain, country_norm = excluded.country_norm,
+    last_seen = excluded.last_seen
+"""
+
+
+def website_domain(url):
+    """https://www.Acme.com/en → acme.com"""
+    if not url:
+        return ""
+    netloc = urlsplit(url if "://" in url else f"http://{url}").netloc.lower()
+    return netloc[4:] if netloc.startswith("www.") else netloc
+
+
+def exhibitor_key(row):
+    """Stable per-show key of a canonical row: the detail URL, else normalized name + booth"""
+    if row.get("detail_url"):
+        return normalize_url(row["detail_url"])
+    return f"{normalize(row.get('company_name'))} | {normalize(row.get('booth'))}"
+
+
+class ExhibitorStore:
+    """All shows' exhibitors in one SQLite (WAL) database, upserted by (show, key)"""
+
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._local = threading.local()
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def upsert_many(self, show, records, run_date=None):
+        """Map records onto the shared schema and upsert them in one transaction; returns the row count"""
+        run_date = run_date or date.today().isoformat()
+        params = []
+        for record in records:
+            row = to_canonical(record, show, run_date)
+            if not row["company_name"]:
+                continue
+            values = [json.dumps(row[c], ensure_ascii=False) if c in LIST_FIELDS else row[c] for c in COLUMNS]
+            params.append([show, exhibitor_key(row), *values, normalize(row["company_name"]),
+                           website_domain(row["website"]), normalize(row["country"]), run_date, run_date])
+        conn = self._conn()
+        with conn:
+            conn.executemany(UPSERT, params)
+        return len(params)
+
+    def find(self, name=None, domain=None, country=None, show=None):
+        """Indexed lookup by normalized name, website domain and/or country"""
+        clauses, args = [], []
+        for column, value in (("name_norm", normalize(name) if name else None),
+                              ("domain", website_domain(domain) if domain else None),
+                              ("country_norm", normalize(country) if country else None),
+                              ("show", show)):
+            if value:
+                clauses.append(f"{column} = ?")
+                args.append(value)
+        where = " AND ".join(clauses) or "1"
+        return [dict(r) for r in self._conn().execute(f"SELECT * FROM exhibitors WHERE {where}", args)]
+
+    def shared_companies(self, show_a, show_b):
+        """Companies exhibiting at both shows, matched on website domain or normalized name"""
+        query = """
+            SELECT a.company_name, a.website, a.country, a.booth AS booth_a, b.booth AS booth_b
+            FROM exhibitors a JOIN exhibitors b ON b.domain = a.domain
+            WHERE a.show = ? AND b.show = ? AND a.domain != ''
+            UNION
+            SELECT a.company_name, a.website, a.country, a.booth AS booth_a, b.booth AS booth_b
+            FROM exhibitors a JOIN exhibitors b ON b.name_norm = a.name_norm
+            WHERE a.show = ? AND b.show = ?
+            ORDER BY 1
+        """
+        return [dict(r) for r in self._conn().execute(query, (show_a, show_b, show_a, show_b))]
+
+    def rows(self, show=None):
+        """Every exhibitor row, or one show's"""
+        query, args = "SELECT * FROM exhibitors", ()
+        if show:
+            query, args = query + " WHERE show = ?", (show,)
+        return [dict(r) for r in self._conn().execute(query, args)]
+
+    def company_ids(self):
+        """{(show, key): company_id} from the last entity-resolution run"""
+        return {(r[0], r[1]): r[2] for r in self._conn().execute("SELECT show, key, company_id FROM company_ids")}
+
+    def save_company_ids(self, ids):
+        """Replace the (show, key) → company_id mapping"""
+        conn = self._conn()
+        with conn:
+            conn.execute("DELETE FROM company_ids")
+            conn.executemany("INSERT INTO company_ids VALUES (?, ?, ?)",
+                             [(show, key, company_id) for (show, key), company_id in ids.items()])
+
+    def shows(self):
+        """(show, exhibitor count, last run date) for every show in the store"""
+        query = "SELECT show, COUNT(*), MAX(last_seen) FROM exhibitors GROUP BY show ORDER BY show"
+        return [tuple(r) for r in self._conn().execute(query)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load and query the cross-show exhibitor store")
+    parser.add_argument("--db", default=STORE_PATH)
+    commands = parser.add_subparsers(dest="command", required=True)
+    load = commands.add_parser("import", help="upsert an existing xlsx/csv/json output under a show name")
+    load.add_argument("show")
+    load.add_argument("file")
+    both = commands.add_parser("both", help="companies exhibiting at both shows")
+    both.add_argument("show_a")
+    both.add_argument("show_b")
+    commands.add_parser("shows", help="list shows in the store")
+    args = parser.parse_args()
+
+    store = ExhibitorStore(args.db)
+    if args.command == "import":
+        print(f"💾 Upserted {store.upsert_many(args.show, load_records(args.file))} exhibitors into {args.show}")
+    elif args.command == "both":
+        rows = store.shared_companies(args.show_a, args.show_b)
+        for row in rows:
+            print(f"{row['company_name']} | {row['website'] or '-'} | {row['booth_a']} / {row['booth_b']}")
+        print(f"\n{len(rows)} companies at both {args.show_a} and {args.show_b}")
+    else:
+        for show, count, last_seen in store.shows():
+            print(f"{show:<32}{count:>7}  {last_seen}")
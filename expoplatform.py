@@ -0,0 +1,442 @@
+import csv
+import json
+import logging
+import re
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from urllib.parse import urljoin, urlsplit
+
+from bs4 import BeautifulSoup
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from detail_fetcher import AsyncDetailFetcher
+from driver_factory import make_driver
+from http_cache import HttpCache
+from http_client import fetch, get, make_session, post
+from incremental import IncrementalRun, changes_path, make_key, save_changeset
+from sinks import shared_sinks
+
+logger = logging.getLogger(__name__)
+
+# One line per show on the Expoplatform `/<event>/Exhibitor` directories: site, event path, page cap
+SHOWS = {
+    "big5-global-2024": {
+        "base_url": "https://exhibitors.big5global.com", "event": "Big-5-Global-2024", "max_pages": 120,
+    },
+    "big5-construct-saudi-2025": {
+        "base_url": "https://exhibitors.big5constructsaudi.com", "event": "big-5-construct-saudi-2025-first-week",
+        "max_pages": 50,
+    },
+    "stone-and-surface-saudi-2024": {
+        "base_url": "https://exhibitors.stoneandsurfacesaudi.com", "event": "stone-and-surface-saudi-arabia-2024",
+        "max_pages": 50,
+    },
+    "fm-expo-saudi-2024": {
+        "base_url": "https://exhibitors.fmexpo-saudi.com", "event": "fm-expo-saudi-2024", "max_pages": 50,
+    },
+    "hvac-r-expo-saudi-2025": {
+        "base_url": "https://exhibitors.big5constructsaudi.com", "event": "hvac-r-expo-saudi-2025", "max_pages": 50,
+    },
+    "liveable-citiesx-2025": {
+        "base_url": "https://exhibitors.liveablecitiesx.com", "event": "liveable-citiesx-2025", "max_pages": 50,
+    },
+}
+
+# Filled from the detail page; everything else comes from the list card
+DETAIL_FIELDS = ('website', 'email', 'linkedin', 'categories', 'description')
+CSV_FIELDS = [
+    'name', 'stand_info', 'country', 'is_featured', 'has_eco_trail',
+    'website', 'email', 'linkedin', 'categories', 'description',
+    'image_url', 'detail_url', 'resources'
+]
+DETAIL_CONCURRENCY = 8  # detail connections per host; the shared rate limiter still sets the pace
+LIST_CONCURRENCY = 6  # list offsets requested at once in HTTP mode
+
+SHOWING_RE = re.compile(r'Showing (\d+) to (\d+) of (\d+)')
+SEARCH_FILTER_RE = re.compile(r'function\s+searchFilter\s*\(\s*(\w*)')
+AJAX_URL_RE = re.compile(r"""url\s*:\s*['"]([^'"]+)['"]""")
+AJAX_METHOD_RE = re.compile(r"""(?:type|method)\s*:\s*['"](\w+)['"]""", re.I)
+AJAX_DATA_RE = re.compile(r'data\s*:\s*\{([^}]*)\}', re.S)
+AJAX_KEY_RE = re.compile(r"""['"]?(\w+)['"]?\s*:\s*([^,]+)""")
+JS_LITERAL_RE = re.compile(r"""^(?:(-?\d+(?:\.\d+)?)|'([^']*)'|"([^"]*)")$""")
+JQUERY_ID_RE = re.compile(r"""\$\(\s*['"]#([\w-]+)['"]\s*\)""")
+
+
+def _form_fields(soup):
+    """Named inputs and selects of every form on the page, as their current values"""
+    fields = {}
+    for element in soup.select('form input[name], form select[name]'):
+        if element.name == 'select':
+            option = element.find('option', selected=True) or element.find('option')
+            fields[element['name']] = option.get('value', '') if option else ''
+        elif element.get('type') not in ('checkbox', 'radio') or element.has_attr('checked'):
+            fields[element['name']] = element.get('value', '')
+    return fields
+
+
+def discover_search_endpoint(html, page_url, session=None):
+    """
+    The request searchFilter(offset) sends, read from the list page's inline or same-site scripts:
+    {"method", "url", "offset_param", "data"}; None when the function can't be found.
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    sources = (script.string or '' for script in soup.find_all('script') if not script.get('src'))
+    host = urlsplit(page_url).netloc
+    script_urls = [urljoin(page_url, s['src']) for s in soup.find_all('script', src=True)]
+
+    def same_site_scripts():
+        for url in script_urls:
+            if urlsplit(url).netloc == host:
+                try:
+                    yield get(url, session=session).text
+                except Exception as e:
+                    logger.debug(f"Skipping script {url}: {e}")
+
+    # External scripts are only downloaded when no inline script defines searchFilter
+    for source in chain(sources, same_site_scripts()):
+        match = SEARCH_FILTER_RE.search(source)
+        if not match:
+            continue
+        body = source[match.end():match.end() + 3000]
+        url, method = AJAX_URL_RE.search(body), AJAX_METHOD_RE.search(body)
+        argument = match.group(1) or 'offset'
+        # Payload: the page's filter form plus whatever keys the ajax call sets itself
+        data = _form_fields(soup)
+        offset_param = argument
+        data_block = AJAX_DATA_RE.search(body)
+        for key, expression in AJAX_KEY_RE.findall(data_block.group(1) if data_block else ''):
+            expression = expression.strip()
+            literal, element_id = JS_LITERAL_RE.match(expression), JQUERY_ID_RE.search(expression)
+            if expression == argument:
+                offset_param = key
+            elif literal:
+                data[key] = next(g for g in literal.groups() if g is not None)
+            else:
+                # $('#id').val() or a bare variable: the page element it most likely reads
+                element = soup.find(id=element_id.group(1) if element_id else key) or soup.find(attrs={'name': key})
+                if element:
+                    data[key] = element.get('value', '')
+                else:
+                    data.setdefault(key, '')
+        return {
+            'method': method.group(1).upper() if method else 'POST',
+            'url': urljoin(page_url, url.group(1)) if url else page_url,
+            'offset_param': offset_param,
+            'data': data,
+        }
+    return None
+
+
+def output_path(show, ext):
+    """Per-show output file, so every show can run from the same directory"""
+    return f"{show}_exhibitors.{ext}"
+
+
+class ExpoplatformScraper:
+    """Exhibitor list and detail pages of one show; sessions, cache and detail fetcher may be shared"""
+
+    def __init__(self, show, headless=True, detail_fetcher=None, incremental=False, session=None, use_browser=False):
+        config = SHOWS[show]
+        self.show = show
+        self.base_url = config['base_url']
+        self.list_url = f"{self.base_url}/{config['event']}/Exhibitor"
+        self.max_pages = config['max_pages']
+        self.headless = headless
+        self.use_browser = use_browser
+        self.session = session or make_session()
+        self.detail_fetcher = detail_fetcher or AsyncDetailFetcher(per_host=DETAIL_CONCURRENCY, cache=HttpCache())
+        self.exhibitors_data = []
+
+        # Incremental mode: exhibitors whose card is unchanged since the last run keep their old details
+        self.incremental = None
+        if incremental:
+            key = make_key(url_field='detail_url', name_field='name', stand_fields=('stand_info',))
+            self.incremental = IncrementalRun(output_path(show, 'json'), key,
+                                              list_fields=('name', 'stand_info', 'country'))
+
+    def scrape_all_pages_selenium(self):
+        """Scrape all pages using Selenium to handle JavaScript pagination"""
+        driver = make_driver(headless=self.headless, allow=("images",))  # cards export their image_url
+        try:
+            logger.info(f"[{self.show}] Starting Selenium scraping...")
+            driver.get(self.list_url)
+            time.sleep(5)
+
+            page_count = 0
+            while True:
+                page_count += 1
+                WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CLASS_NAME, "card")))
+
+                soup = BeautifulSoup(driver.page_source, 'html.parser')
+                cards = soup.find_all('div', class_='card')
+                logger.info(f"[{self.show}] Found {len(cards)} exhibitor cards on page {page_count}")
+                for card in cards:
+                    exhibitor_data = self.extract_exhibitor_data(card)
+                    if exhibitor_data:
+                        self.exhibitors_data.append(exhibitor_data)
+
+                # Find the "»" button
+                next_button = next((b for b in driver.find_elements(By.XPATH, "//a[contains(@onclick, 'searchFilter')]")
+                                    if "»" in b.text), None)
+                if not next_button:
+                    logger.info(f"[{self.show}] No more pages found")
+                    break
+
+                # Check if we're on the last page by looking at pagination text
+                pagination_divs = driver.find_elements(By.CLASS_NAME, "list-pagination")
+                if pagination_divs:
+                    match = re.search(r'Showing (\d+) to (\d+) of (\d+)', pagination_divs[0].text)
+                    if match and int(match.group(2)) >= int(match.group(3)):
+                        logger.info(f"[{self.show}] Reached the last page")
+                        break
+
+                try:
+                    driver.execute_script("arguments[0].click();", next_button)
+                    time.sleep(4)  # Wait for page to load
+                    WebDriverWait(driver, 15).until(EC.presence_of_element_located((By.CLASS_NAME, "card")))
+                except Exception as e:
+                    logger.error(f"[{self.show}] Error clicking next button: {e}")
+                    break
+
+                # Safety break to avoid infinite loops
+                if page_count >= self.max_pages:
+                    logger.warning(f"[{self.show}] Reached maximum page limit")
+                    break
+
+            logger.info(f"[{self.show}] Total pages: {page_count}, total exhibitors: {len(self.exhibitors_data)}")
+        finally:
+            driver.quit()
+
+    def parse_list_html(self, html):
+        """Exhibitor records of every card in a list page or searchFilter response"""
+        soup = BeautifulSoup(html, 'html.parser')
+        return [data for data in map(self.extract_exhibitor_data, soup.find_all('div', class_='card')) if data]
+
+    def fetch_list_page(self, endpoint, offset):
+        """Cards at one offset, requested the way searchFilter(offset) would; None if the request failed"""
+        data = dict(endpoint['data'], **{endpoint['offset_param']: offset})
+        headers = {'X-Requested-With': 'XMLHttpRequest', 'Referer': self.list_url}
+        try:
+            if endpoint['method'] == 'GET':
+                response = fetch(endpoint['url'], session=self.session, params=data, headers=headers)
+            else:
+                response = post(endpoint['url'], session=self.session, data=data, headers=headers)
+                response.raise_for_status()
+        except Exception as e:
+            logger.error(f"[{self.show}] List offset {offset} failed: {e}")
+            return None
+        html = response.text
+        if 'json' in response.headers.get('Content-Type', ''):
+            # Some events answer with {"html": "..."} instead of the bare fragment
+            payload = response.json()
+            html = next((v for v in payload.values() if isinstance(v, str) and 'card' in v), '') \
+                if isinstance(payload, dict) else ''
+        return self.parse_list_html(html)
+
+    def scrape_all_pages_http(self):
+        """
+        List pages without a browser: the first page gives "Showing X to Y of Z", so every other offset
+        is known up front and requested in parallel. False when the page doesn't expose what's needed or
+        the pages don't add up to exactly that total.
+        """
+        logger.info(f"[{self.show}] Starting HTTP list scraping...")
+        first = fetch(self.list_url, session=self.session)
+        showing = SHOWING_RE.search(BeautifulSoup(first.text, 'html.parser').get_text(' '))
+        endpoint = discover_search_endpoint(first.text, self.list_url, self.session)
+        if not showing or not endpoint:
+            logger.warning(f"[{self.show}] No pagination total or searchFilter endpoint in the list page")
+            return False
+
+        start, end, total = map(int, showing.groups())
+        page_size = end - start + 1
+        offsets = list(range(end, total, page_size))
+        logger.info(f"[{self.show}] {total} exhibitors, {len(offsets) + 1} pages of {page_size} "
+                    f"via {endpoint['method']} {endpoint['url']}")
+        with ThreadPoolExecutor(max_workers=LIST_CONCURRENCY) as pool:
+            pages = list(pool.map(lambda offset: self.fetch_list_page(endpoint, offset), offsets))
+
+        # Featured exhibitors can repeat on every page; keep each detail page once
+        seen = set()
+        failed, stale = 0, 0
+        for page in [self.parse_list_html(first.text)] + pages:
+            if page is None:
+                failed += 1
+                continue
+            before = len(seen)
+            for exhibitor in page:
+                key = exhibitor['detail_url'] or (exhibitor['name'], exhibitor['stand_info'])
+                if key not in seen:
+                    seen.add(key)
+                    self.exhibitors_data.append(exhibitor)
+            # A page adding nothing new means the endpoint ignored the offset (e.g. it served page 1 again)
+            stale += len(seen) == before
+        logger.info(f"[{self.show}] Total exhibitors: {len(self.exhibitors_data)} of {total}")
+        if failed or stale or len(self.exhibitors_data) != total:
+            logger.warning(f"[{self.show}] Incomplete HTTP listing: {failed} list pages failed, "
+                           f"{stale} returned no new exhibitors, {len(self.exhibitors_data)} of {total} collected")
+            return False
+        return True
+
+    def scrape_all_pages(self):
+        """HTTP list pages, or the browser with --browser or when the endpoint can't be found"""
+        if not self.use_browser:
+            try:
+                if self.scrape_all_pages_http():
+                    return
+            except Exception as e:
+                logger.warning(f"[{self.show}] HTTP list scraping failed: {e}")
+            self.exhibitors_data = []
+            logger.info(f"[{self.show}] Falling back to the browser")
+        self.scrape_all_pages_selenium()
+
+    def fetch_detailed_info(self):
+        """Fetch all collected detail pages concurrently and merge them into the exhibitor records"""
+        detail_urls = []
+        for exhibitor in self.exhibitors_data:
+            previous = self.incremental.reuse(exhibitor) if self.incremental else None
+            if previous:
+                exhibitor.update({k: previous[k] for k in DETAIL_FIELDS if k in previous})
+            elif exhibitor.get('detail_url'):
+                detail_urls.append(exhibitor['detail_url'])
+        if self.incremental:
+            logger.info(f"[{self.show}] Incremental: reusing {self.incremental.reused} unchanged exhibitors")
+        if not detail_urls:
+            return
+
+        logger.info(f"[{self.show}] Fetching {len(detail_urls)} detail pages concurrently...")
+        start = time.time()
+        detailed = self.detail_fetcher.fetch_all(detail_urls)
+        for exhibitor in self.exhibitors_data:
+            exhibitor.update(detailed.get(exhibitor.get('detail_url'), {}))
+        logger.info(f"[{self.show}] Fetched detail pages in {time.time() - start:.1f}s")
+
+    def extract_exhibitor_data(self, card):
+        """Extract data from a single exhibitor card"""
+        try:
+            name_element = card.find('h5', class_='card-title')
+            name_link = name_element.find('a') if name_element else None
+            if name_element:
+                name = name_link.text.strip() if name_link else name_element.text.strip()
+            else:
+                name = "N/A"
+
+            detail_url = name_link.get('href') if name_link else None
+            if detail_url and not detail_url.startswith('http'):
+                detail_url = urljoin(self.base_url + "/", detail_url)
+
+            stand_element = card.find('h6', class_='card-subtitle')
+            country_element = card.find('p', class_='card-text')
+            img_element = card.find('img', class_='card-img-top')
+            footer = card.find('div', class_='card-footer')
+            resources = [link.get('title') for link in footer.find_all('a') if link.get('title')] if footer else []
+
+            # Detail pages are fetched in bulk by fetch_detailed_info once all cards are collected
+            return {
+                'name': name,
+                'stand_info': stand_element.text.strip() if stand_element else "N/A",
+                'country': country_element.text.strip() if country_element else "N/A",
+                'is_featured': card.find('span', class_='featured-badge') is not None,
+                'has_eco_trail': card.find('div', class_='ecotrailicon-img') is not None,
+                'image_url': img_element.get('src') if img_element else "N/A",
+                'resources': resources,
+                'detail_url': detail_url
+            }
+
+        except Exception as e:
+            logger.error(f"[{self.show}] Error extracting exhibitor data: {e}")
+            return None
+
+    def run(self, flags=()):
+        """List pages, details and every output for this show"""
+        self.scrape_all_pages()
+        self.fetch_detailed_info()
+        self.save_to_json()
+        self.save_to_csv()
+        self.save_changes()
+        self.save_to_shared(flags)
+        return len(self.exhibitors_data)
+
+    def save_changes(self):
+        """Write what changed since the previous run (incremental mode only)"""
+        if self.incremental:
+            save_changeset(self.incremental.changeset(self.exhibitors_data),
+                           changes_path(output_path(self.show, 'json')))
+
+    def save_to_shared(self, flags):
+        """Append this run to the shared Parquet dataset (--parquet) and/or SQLite store (--store)"""
+        for sink in shared_sinks(self.show, flags):
+            with sink:
+                sink.write_many(self.exhibitors_data)
+            logger.info(f"[{self.show}] Data saved to {sink.path}")
+
+    def save_to_json(self):
+        """Save data to JSON file"""
+        filename = output_path(self.show, 'json')
+        with open(filename, 'w', encoding='utf-8') as f:
+            json.dump(self.exhibitors_data, f, indent=2, ensure_ascii=False)
+        logger.info(f"[{self.show}] Data saved to {filename}")
+
+    def save_to_csv(self):
+        """Save data to CSV file"""
+        if not self.exhibitors_data:
+            logger.warning(f"[{self.show}] No data to save")
+            return
+
+        filename = output_path(self.show, 'csv')
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
+            writer.writeheader()
+            for exhibitor in self.exhibitors_data:
+                row = {field: exhibitor.get(field, '') for field in CSV_FIELDS}
+                row['is_featured'] = exhibitor.get('is_featured', False)
+                row['has_eco_trail'] = exhibitor.get('has_eco_trail', False)
+                row['categories'] = ', '.join(exhibitor.get('categories', []))
+                row['resources'] = ', '.join(exhibitor.get('resources', []))
+                writer.writerow(row)
+        logger.info(f"[{self.show}] Data saved to {filename}")
+
+
+def run_shows(shows, flags=()):
+    """
+    Scrape the given shows concurrently on one pooled session, sharing the detail fetcher, its per-host
+    connection cap and its HTTP cache; the process-wide rate limiter keeps shows on the same host within its budget.
+    List pages come over HTTP; --browser (or a page without the endpoint) uses one browser per show.
+    True if every show succeeded.
+    """
+    unknown = [show for show in shows if show not in SHOWS]
+    if unknown:
+        raise ValueError(f"Unknown show(s) {', '.join(unknown)}; known: {', '.join(SHOWS)}")
+
+    cache = None if "--no-cache" in flags else HttpCache()
+    fetcher = AsyncDetailFetcher(per_host=DETAIL_CONCURRENCY, cache=cache)
+    session = make_session(pool_size=32)
+    scrapers = [ExpoplatformScraper(show, headless="--headed" not in flags, detail_fetcher=fetcher,
+                                    incremental="--incremental" in flags, session=session,
+                                    use_browser="--browser" in flags) for show in shows]
+    start = time.time()
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as pool:
+        futures = {s.show: pool.submit(s.run, flags) for s in scrapers}
+
+    ok = True
+    print(f"\n=== SCRAPING SUMMARY ({time.time() - start:.0f}s) ===")
+    for show, future in futures.items():
+        try:
+            print(f"✅ {show}: {future.result()} exhibitors → {output_path(show, 'json')}, {output_path(show, 'csv')}")
+        except Exception as e:
+            logger.error(f"[{show}] Error in main execution: {e}")
+            print(f"❌ {show}: {e}")
+            ok = False
+    if cache:
+        cache.report()
+    return ok
+
+
+if __name__ == "__main__":
+    # `python expoplatform.py [show ...] [--browser] [--headed] [--incremental] [--no-cache] [--parquet] [--store]`
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    selected = [arg for arg in sys.argv[1:] if not arg.startswith("--")] or list(SHOWS)
+    sys.exit(0 if run_shows(selected, sys.argv) else 1)
@@ -5,16 +5,16 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import pandas as pd
 import time
+import sys
+from driver_factory import make_driver
+from network_capture import NetworkCapture, enable_performance_log, records_from_responses
 
 
-def scrape_with_selenium():
+def scrape_with_selenium(capture=False):
 
-    options = webdriver.ChromeOptions()
-    options.add_argument('--headless')  
-    options.add_argument('--no-sandbox')
-    options.add_argument('--disable-dev-shm-usage')
-    
-    driver = webdriver.Chrome(options=options)
+    options = enable_performance_log(webdriver.ChromeOptions()) if capture else None
+    driver = make_driver(options=options)
+    network = NetworkCapture(driver).start() if capture else None
     
     companies = []
     booth_numbers = []
@@ -50,6 +50,19 @@ def scrape_with_selenium():
                 break
             last_height = new_height
         
+        # Capture mode: the scroll made the widget fetch every page of its JSON API
+        if network:
+            records = records_from_responses(network.drain())
+            print(f"Found {len(records)} exhibitors in captured API responses")
+            if not records:
+                return None
+            return pd.DataFrame({
+                'Company Name': [r['Company Name'] for r in records],
+                'Booth Number': [r['Booth No'] or 'N/A' for r in records],
+                'Country': [r['Country'] or 'N/A' for r in records],
+                'LinkedIn URL': [r['LinkedIn'] or 'N/A' for r in records]
+            })
+        
         # Find all exhibitor cards
         exhibitor_cards = driver.find_elements(By.CSS_SELECTOR, "[class*='sc-'][class*='exhibitor'], [class*='sc-'][class*='company']")
         
@@ -126,7 +139,7 @@ if __name__ == "__main__":
     print("Note: This script requires ChromeDriver to be installed.")
     print("Download from: https://chromedriver.chromium.org/")
     
-    df = scrape_with_selenium()
+    df = scrape_with_selenium(capture="--capture" in sys.argv)
     if df is not None:
         df.to_excel('middle_east_energy_exhibitors_selenium.xlsx', index=False)
         print(f"Extracted {len(df)} exhibitors")
\ No newline at end of file
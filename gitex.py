@@ -1,31 +1,95 @@
 import time
-import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.chrome.service import Service
 import re
+import sys
+from waits import STATS, wait_for, network_quiet, count_stable
+from batch_extract import extract_cards
+from incremental import IncrementalRun, changes_path, make_key, save_changeset
+from journal import Journal, journal_path
+from sinks import XlsxSink, with_shared
+from driver_factory import make_driver
+
+EXHIBITOR_SEL = "div.item.col-12.list-group-item"
+
+# List-view fields, read for every card in one execute_script call
+BASIC_INFO_FIELDS = {
+    'Company Name': ("h4.heading", "text"),
+    'Stand Info': ("p[style*='margin-bottom:0']", "text"),
+    'Country': ("span[style*='font-weight: 600']", "text"),
+    'Short Description': ("span[style='']", "text"),
+    'Sectors': ("ul.sector_block li", "text[]"),
+}
+
+FINAL_FILE = "gitex_exhibitors_complete.xlsx"
+SHOW = "gitex-global-2025"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
+FINAL_COLUMNS = [
+    'Company Name', 'Country', 'Stand Number', 'Hall', 'Booth Info', 'Website', 'LinkedIn', 'YouTube',
+    'Short Description', 'Full Description', 'Sectors', 'All Sectors', 'Total Sectors', 'Profile Scraped',
+]
+
+
+def as_list(value):
+    """Sector lists come back as "a, b" strings when a row is reused from the previous workbook"""
+    if isinstance(value, list):
+        return value
+    return [v.strip() for v in str(value).split(',') if v.strip()] if value else []
+
+
+def final_row(item):
+    """One output row for a scraped (or reused) exhibitor"""
+    return {
+        'Company Name': item.get('Company Name', ''),
+        'Country': item.get('Country', ''),
+        'Stand Number': item.get('Stand Number', ''),
+        'Hall': item.get('Hall', ''),
+        'Booth Info': item.get('Booth Info', ''),
+        'Website': item.get('Website', ''),
+        'LinkedIn': item.get('LinkedIn', ''),
+        'YouTube': item.get('YouTube', ''),
+        'Short Description': item.get('Short Description', ''),
+        'Full Description': item.get('Full Description', ''),
+        'Sectors': ', '.join(as_list(item.get('Sectors', []))),
+        'All Sectors': ', '.join(as_list(item.get('All Sectors', []))),
+        'Total Sectors': len(as_list(item.get('All Sectors', []))),
+        'Profile Scraped': 'Yes' if item.get('Website') else 'No'
+    }
+
+
+def exhibitor_key(info):
+    """Journal key for a card: the list view has no URL, so name + stand"""
+    return f"{info.get('Company Name')}|{info.get('Stand Number')}"
 
 class GitexExhibitorScraper:
-    def __init__(self):
+    def __init__(self, incremental=False, resume=False, flags=()):
         self.setup_driver()
-        self.all_data = []
+        # Each finished exhibitor is appended to the journal; resume=True starts from what is already there
+        self.journal = Journal(journal_path(FINAL_FILE), resume=resume)
+        self.all_data = list(self.journal.records)
+        self.basic_infos = []
+        self.complete = False  # every listed exhibitor scraped; only then is the changeset trustworthy
+        
+        # Incremental mode: cards unchanged since the last complete workbook skip the profile click
+        self.incremental = None
+        if incremental:
+            key = make_key(name_field='Company Name', stand_fields=('Stand Number',))
+            self.incremental = IncrementalRun(FINAL_FILE, key, list_fields=('Country', 'Hall', 'Short Description'))
         
+        # Output rows stream to disk as exhibitors finish; save_final_data only closes the workbook
+        self.sink = with_shared(XlsxSink(FINAL_FILE, FINAL_COLUMNS), SHOW, flags)
+        self.sink.write_many(final_row(item) for item in self.all_data)
+        
+    def add_exhibitor(self, data, key):
+        """Keep, journal and stream out one finished exhibitor"""
+        self.all_data.append(data)
+        self.journal.record(data, key=key)
+        self.sink.write(final_row(data))
+    
     def setup_driver(self):
         """Setup Chrome driver with appropriate options"""
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        service = Service(ChromeDriverManager().install())
-        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        self.driver = make_driver()
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         self.wait = WebDriverWait(self.driver, 15)
         
@@ -38,7 +102,11 @@ class GitexExhibitorScraper:
         while True:
             # Scroll down to bottom
             self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
+            wait_for(
+                self.driver,
+                lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.item.col-12.list-group-item")) > last_count,
+                timeout=2, label="infinite scroll batch",
+            )
             
             # Get current count of exhibitors
             current_exhibitors = self.driver.find_elements(By.CSS_SELECTOR, "div.item.col-12.list-group-item")
@@ -64,8 +132,7 @@ class GitexExhibitorScraper:
     def scroll_to_element(self, element):
         """Scroll to a specific element to ensure it's in view"""
         try:
-            self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", element)
-            time.sleep(0.5)  # Wait for scroll to complete
+            self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
             return True
         except Exception as e:
             print(f"❌ Error scrolling to element: {e}")
@@ -127,6 +194,23 @@ class GitexExhibitorScraper:
             print(f"❌ Error extracting basic info: {e}")
             return None
     
+    def basic_info_from_fields(self, fields):
+        """Turn one batch-extracted card into the same dict extract_exhibitor_basic_info returns"""
+        stand_text = fields.get('Stand Info')
+        stand_match = re.search(r'Stand No-\s*([^,]+)', stand_text) if stand_text else None
+        hall_match = re.search(r'Hall\s*(\d+)', stand_text) if stand_text else None
+        description = fields.get('Short Description')
+        
+        return {
+            'Company Name': fields.get('Company Name') or "Not found",
+            'Stand Info': stand_text if stand_text is not None else "Not found",
+            'Stand Number': stand_match.group(1) if stand_match else "Not found",
+            'Hall': f"Hall {hall_match.group(1)}" if hall_match else "Not found",
+            'Country': fields.get('Country') if fields.get('Country') is not None else "Not found",
+            'Short Description': description[:300] if description is not None else "Not found",
+            'Sectors': fields.get('Sectors') or [],
+        }
+    
     def extract_detailed_profile_data(self):
         """Extract detailed data from the exhibitor profile page"""
         try:
@@ -243,8 +327,11 @@ class GitexExhibitorScraper:
             if not exhibitor_element:
                 return False
             
-            # Store basic info first
-            basic_info = self.extract_exhibitor_basic_info(exhibitor_element)
+            # Store basic info first (batch-extracted up front, per-element as a fallback)
+            if index < len(self.basic_infos):
+                basic_info = self.basic_infos[index]
+            else:
+                basic_info = self.extract_exhibitor_basic_info(exhibitor_element)
             if not basic_info:
                 return False
             
@@ -255,7 +342,6 @@ class GitexExhibitorScraper:
             
             # Scroll to the button to ensure it's clickable
             self.scroll_to_element(view_profile_btn)
-            time.sleep(0.5)
             
             # Click using JavaScript to avoid interception issues
             self.driver.execute_script("arguments[0].click();", view_profile_btn)
@@ -265,7 +351,7 @@ class GitexExhibitorScraper:
                 EC.presence_of_element_located((By.CSS_SELECTOR, "div.company_description"))
             )
             
-            time.sleep(2)  # Wait for complete loading
+            network_quiet(self.driver, label="profile loaded")
             
             # Extract detailed data from profile page
             detailed_data = self.extract_detailed_profile_data()
@@ -273,7 +359,7 @@ class GitexExhibitorScraper:
             if detailed_data:
                 # Merge basic and detailed data
                 merged_data = {**basic_info, **detailed_data}
-                self.all_data.append(merged_data)
+                self.add_exhibitor(merged_data, exhibitor_key(basic_info))
             
             # Go back to main list
             print("🔙 Navigating back to main list...")
@@ -293,7 +379,7 @@ class GitexExhibitorScraper:
                 scroll_script = f"window.scrollTo(0, {index * 200});"
                 self.driver.execute_script(scroll_script)
             
-            time.sleep(2)  # Wait for the list to stabilize
+            count_stable(self.driver, "div.item.col-12.list-group-item", stable_for=0.5, label="list restored")
             
             print(f"✅ Completed profile {index + 1}: {basic_info.get('Company Name', 'Unknown')}")
             return True
@@ -332,9 +418,12 @@ class GitexExhibitorScraper:
             # Scroll to load all exhibitors first
             self.scroll_to_load_all_exhibitors()
             
-            # Get final count of exhibitors
-            exhibitor_elements = self.driver.find_elements(By.CSS_SELECTOR, "div.item.col-12.list-group-item")
-            total_exhibitors = len(exhibitor_elements)
+            # Read every card's list-view fields in one round-trip
+            self.basic_infos = [
+                self.basic_info_from_fields(fields)
+                for fields in extract_cards(self.driver, EXHIBITOR_SEL, BASIC_INFO_FIELDS)
+            ]
+            total_exhibitors = len(self.basic_infos)
             
             print(f"🎯 Starting to scrape {total_exhibitors} exhibitors...")
             
@@ -342,12 +431,21 @@ class GitexExhibitorScraper:
             successful_scrapes = 0
             for index in range(total_exhibitors):
                 try:
+                    if exhibitor_key(self.basic_infos[index]) in self.journal.done_keys:
+                        successful_scrapes += 1
+                        continue
+                    
+                    previous = self.incremental.reuse(self.basic_infos[index]) if self.incremental else None
+                    if previous:
+                        self.add_exhibitor(previous, exhibitor_key(self.basic_infos[index]))
+                        successful_scrapes += 1
+                        continue
+                    
                     if self.scrape_exhibitor_profile(index):
                         successful_scrapes += 1
                     
-                    # Save progress every 3 exhibitors (more frequent due to navigation)
+                    # Every exhibitor is already journaled; just report progress
                     if (index + 1) % 3 == 0:
-                        self.save_progress()
                         print(f"📈 Progress: {index + 1}/{total_exhibitors} completed ({successful_scrapes} successful)")
                         
                     # Small delay between profiles
@@ -358,6 +456,7 @@ class GitexExhibitorScraper:
                     continue
             
             print(f"✅ Successfully scraped {successful_scrapes} out of {total_exhibitors} exhibitors")
+            self.complete = successful_scrapes == total_exhibitors
             
         except Exception as e:
             print(f"❌ Error in main scraping process: {e}")
@@ -366,56 +465,38 @@ class GitexExhibitorScraper:
             self.save_final_data()
             self.cleanup()
     
-    def save_progress(self):
-        """Save progress to Excel file"""
-        if self.all_data:
-            df = self.prepare_final_dataframe()
-            df.to_excel("gitex_exhibitors_progress.xlsx", index=False)
-            print(f"💾 Progress saved: {len(self.all_data)} exhibitors")
-    
-    def prepare_final_dataframe(self):
-        """Prepare final DataFrame with all data"""
-        detailed_data = []
-        for item in self.all_data:
-            detailed_item = {
-                'Company Name': item.get('Company Name', ''),
-                'Country': item.get('Country', ''),
-                'Stand Number': item.get('Stand Number', ''),
-                'Hall': item.get('Hall', ''),
-                'Booth Info': item.get('Booth Info', ''),
-                'Website': item.get('Website', ''),
-                'LinkedIn': item.get('LinkedIn', ''),
-                'YouTube': item.get('YouTube', ''),
-                'Short Description': item.get('Short Description', ''),
-                'Full Description': item.get('Full Description', ''),
-                'Sectors': ', '.join(item.get('Sectors', [])),
-                'All Sectors': ', '.join(item.get('All Sectors', [])),
-                'Total Sectors': len(item.get('All Sectors', [])),
-                'Profile Scraped': 'Yes' if item.get('Website') else 'No'
-            }
-            detailed_data.append(detailed_item)
-        
-        return pd.DataFrame(detailed_data)
-    
     def save_final_data(self):
-        """Save final data to Excel file"""
+        """Finish the streamed workbook and print a summary"""
+        self.sink.close()
         if self.all_data:
-            df = self.prepare_final_dataframe()
-            df.to_excel("gitex_exhibitors_complete.xlsx", index=False)
+            if self.incremental and self.complete:
+                rows = [final_row(item) for item in self.all_data]
+                save_changeset(self.incremental.changeset(rows), changes_path(FINAL_FILE))
+            elif self.incremental:
+                # Exhibitors this run never reached would be listed as removed
+                print("⚠️ Run incomplete; skipping the changeset")
+            
+            found = {'Website': 0, 'LinkedIn': 0, 'YouTube': 0}
+            total_sectors = 0
+            for item in self.all_data:
+                for field in found:
+                    found[field] += item.get(field, '') != 'Not found'
+                total_sectors += len(as_list(item.get('All Sectors', [])))
             
             print(f"🎉 Final data saved: {len(self.all_data)} exhibitors")
             print("📊 Summary Report:")
             print(f"   - Total companies: {len(self.all_data)}")
-            print(f"   - With websites: {df[df['Website'] != 'Not found'].shape[0]}")
-            print(f"   - With LinkedIn: {df[df['LinkedIn'] != 'Not found'].shape[0]}")
-            print(f"   - With YouTube: {df[df['YouTube'] != 'Not found'].shape[0]}")
-            print(f"   - Average sectors per company: {df['Total Sectors'].mean():.1f}")
+            print(f"   - With websites: {found['Website']}")
+            print(f"   - With LinkedIn: {found['LinkedIn']}")
+            print(f"   - With YouTube: {found['YouTube']}")
+            print(f"   - Average sectors per company: {total_sectors / len(self.all_data):.1f}")
         else:
             print("⚠️ No data to save")
     
     def cleanup(self):
         """Clean up resources"""
         try:
+            self.journal.close()
             self.driver.quit()
             print("🧹 Browser closed")
         except:
@@ -426,7 +507,8 @@ def main():
     print("🚀 Starting GITEX Global 2025 Exhibitor Scraper...")
     print("=" * 50)
     
-    scraper = GitexExhibitorScraper()
+    scraper = GitexExhibitorScraper(incremental="--incremental" in sys.argv, resume="--resume" in sys.argv,
+                                    flags=sys.argv)
     
     try:
         scraper.scrape_all_exhibitors()
@@ -437,6 +519,7 @@ def main():
         print(f"💥 Unexpected error: {e}")
         scraper.save_final_data()
     finally:
+        STATS.report()
         print("=" * 50)
         print("🎯 Scraping completed!")
 
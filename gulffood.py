@@ -1,22 +1,48 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
-import csv
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from browser_pool import BrowserPool
+from driver_factory import make_driver
+from waits import STATS, count_stable, element_gone
+from batch_extract import extract_cards, extract_cards_html, extract_fields_html
+from http_client import fetch, fetch_pages
+from incremental import IncrementalRun, changes_path, make_key, normalize, save_changeset
+from sinks import CsvSink, with_shared
 
 # --- Setup ---
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-driver = webdriver.Chrome(options=options)
-
 base_url = "https://www.gulfood.com/exhibitor-list?page={}&sortby=title asc,title asc&azLetterField="
+TOTAL_PAGES = 151
+BROWSERS = 4  # Chrome instances splitting the pages between them
+ITEM_SEL = "li.m-exhibitors-list__items__item"
 
-# --- Output CSV ---
-csv_file = open("gulfood_exhibitors.csv", "w", newline="", encoding="utf-8")
-writer = csv.writer(csv_file)
-writer.writerow([
+# List item fields, read for the whole page in one round-trip
+LIST_FIELDS = {
+    "name": (".m-exhibitors-list__items__item__name", "text"),
+    "hall": (".m-exhibitors-list__items__item__hall", "text"),
+    "stand": (".m-exhibitors-list__items__item__stand", "text"),
+    "country": (".m-exhibitors-list__items__item__location", "text"),
+    "link": (".m-exhibitors-list__items__item__name__link", "href"),
+}
+
+# Exhibitor entry (the modal's content), for the HTTP mode
+SITE_URL = "https://www.gulfood.com/"
+ENTRY_FIELDS = {
+    "name": ("h1.m-exhibitor-entry__item__header__infos__title", "text"),
+    "hall_stand": (".m-exhibitor-entry__item__header__infos__stand", "text"),
+    "address": (".m-exhibitor-entry__item__body__contacts__address", "text"),
+    "floorplan": (".m-exhibitor-entry__item__body__contacts__additional__button__additional-field a", "href"),
+    "website": (".m-exhibitor-entry__item__body__contacts__additional__button__website a", "href"),
+    "social": (".m-exhibitor-entry__item__body__contacts__additional__social__item a", "href[]"),
+}
+ENTRY_WORKERS = 16  # entries fetched at once; the shared rate limiter sets the pace per host
+PAGE_CHUNK = 10  # list pages whose entries are fetched, parsed and written before the next ones start
+
+OUTPUT_FILE = "gulfood_exhibitors.csv"
+SHOW = "gulfood"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
+COLUMNS = [
     "Name",
     "Country", 
     "Full Address",
@@ -27,41 +53,63 @@ writer.writerow([
     "Facebook",
     "Instagram",
     "YouTube"
-])
+]
 
-# --- Loop through pages ---
-for page in range(1, 152):  # 1 → 151
+# --- Incremental mode ---
+# `python gulffood.py --incremental` only opens the modal for exhibitors missing from the last CSV
+# or listed at a different hall/stand (read before the CSV below is truncated)
+incremental = None
+if "--incremental" in sys.argv:
+    incremental = IncrementalRun(OUTPUT_FILE, make_key(name_field="Name", stand_fields=("Country",)))
+
+
+def reuse_row(fields):
+    """The last run's row if the exhibitor is known and still listed at the same hall/stand, else None"""
+    if not incremental:
+        return None
+    previous = incremental.reuse({"Name": fields["name"], "Country": fields["country"] or ""})
+    # The saved Hall & Stand is the modal's wording, so compare the list's hall/stand words against it
+    listed = set(normalize(f"{fields['hall'] or ''} {fields['stand'] or ''}").split())
+    if previous and not listed <= set(normalize(previous.get("Hall & Stand")).split()):
+        return None
+    return previous
+
+# --- Output CSV ---
+sink = with_shared(CsvSink(OUTPUT_FILE, COLUMNS), SHOW, sys.argv)
+
+# --- Scrape one list page ---
+def scrape_page(driver, page):
+    """Scrape every exhibitor modal on one list page and return its rows"""
+    rows = []
     print(f"\n📄 Scraping page {page}...")
     driver.get(base_url.format(page))
-    time.sleep(3)  # let page load
+    # A page whose items never render is a failed page, not an empty one
+    if not count_stable(driver, ITEM_SEL, label="list items"):
+        raise TimeoutException(f"no exhibitors rendered on page {page}")
 
-    # Find all exhibitor items
-    exhibitors = driver.find_elements(By.CSS_SELECTOR, "li.m-exhibitors-list__items__item")
+    # Find all exhibitor items; their list fields come back in one execute_script call
+    exhibitors = driver.find_elements(By.CSS_SELECTOR, ITEM_SEL)
+    list_fields = extract_cards(driver, ITEM_SEL, LIST_FIELDS)
     print(f"Found {len(exhibitors)} exhibitors on page {page}")
 
-    for index, exhibitor in enumerate(exhibitors):
+    for index, (exhibitor, fields) in enumerate(zip(exhibitors, list_fields)):
         try:
-            # --- Extract basic info from list ---
-            name_elem = exhibitor.find_element(By.CSS_SELECTOR, ".m-exhibitors-list__items__item__name")
-            name = name_elem.text.strip()
-            
-            try:
-                hall = exhibitor.find_element(By.CSS_SELECTOR, ".m-exhibitors-list__items__item__hall").text.strip()
-            except NoSuchElementException:
-                hall = ""
-                
-            try:
-                stand = exhibitor.find_element(By.CSS_SELECTOR, ".m-exhibitors-list__items__item__stand").text.strip()
-            except NoSuchElementException:
-                stand = ""
-                
-            try:
-                location_country = exhibitor.find_element(By.CSS_SELECTOR, ".m-exhibitors-list__items__item__location").text.strip()
-            except NoSuchElementException:
-                location_country = ""
+            # --- Basic info from list ---
+            if fields["name"] is None:
+                raise NoSuchElementException("exhibitor name not found")
+            name = fields["name"]
+            hall = fields["hall"] or ""
+            stand = fields["stand"] or ""
+            location_country = fields["country"] or ""
 
             hall_stand = f"{hall} | {stand}" if hall and stand else f"{hall}{stand}"
 
+            previous = reuse_row(fields)
+            if previous:
+                rows.append({column: previous.get(column, "") for column in COLUMNS})
+                print(f"♻️ Unchanged {index + 1}/{len(exhibitors)}: {name}")
+                continue
+
             print(f"Processing {index + 1}/{len(exhibitors)}: {name}")
 
             # --- Click to open modal ---
@@ -138,7 +186,7 @@ for page in range(1, 152):  # 1 → 151
                 pass
 
             # --- Save row ---
-            writer.writerow([
+            rows.append(dict(zip(COLUMNS, [
                 modal_name,
                 location_country,
                 full_address,
@@ -149,7 +197,7 @@ for page in range(1, 152):  # 1 → 151
                 facebook,
                 instagram,
                 youtube
-            ])
+            ])))
 
             # --- Console log ---
             print(f"✅ {modal_name}")
@@ -167,11 +215,10 @@ for page in range(1, 152):  # 1 → 151
             try:
                 close_btn = driver.find_element(By.CSS_SELECTOR, ".mfp-close")
                 driver.execute_script("arguments[0].click();", close_btn)
-                time.sleep(1)  # wait for modal to close
             except NoSuchElementException:
                 # If close button not found, try ESC key or click outside
                 driver.execute_script("document.activeElement.blur();")
-                time.sleep(1)
+            element_gone(driver, "div.m-exhibitor-entry__item__body", timeout=5, label="modal closed")
 
         except Exception as e:
             print(f"❌ Error on exhibitor {index + 1}: {str(e)}")
@@ -179,13 +226,150 @@ for page in range(1, 152):  # 1 → 151
             try:
                 close_btn = driver.find_element(By.CSS_SELECTOR, ".mfp-close")
                 driver.execute_script("arguments[0].click();", close_btn)
-                time.sleep(1)
+                element_gone(driver, "div.m-exhibitor-entry__item__body", timeout=5, label="modal closed")
             except:
                 pass
             continue
 
     print(f"✅ Completed page {page}")
+    return rows
+
+# --- HTTP mode ---
+# `python gulffood.py --http` fetches every exhibitor entry concurrently instead of clicking each modal;
+# list pages come over HTTP too, with the browser only as a fallback if they render client-side
+def parse_list_page(html):
+    return extract_cards_html(html, ITEM_SEL, LIST_FIELDS, base_url=SITE_URL)
+
+
+def list_page_in_browser(driver, page):
+    driver.get(base_url.format(page))
+    if not count_stable(driver, ITEM_SEL, label="list items"):
+        raise TimeoutException(f"no exhibitors rendered on page {page}")
+    return extract_cards(driver, ITEM_SEL, LIST_FIELDS)
+
+
+def entry_row(fields, entry):
+    """CSV row from the list item fields and the fetched entry (None when it could not be fetched)"""
+    entry = entry or {}
+    hall, stand = fields["hall"] or "", fields["stand"] or ""
+    address = entry.get("address") or ""
+    if address.startswith("Address"):
+        address = address[len("Address"):].strip()
+    social = {"LinkedIn": "", "Facebook": "", "Instagram": "", "YouTube": ""}
+    for href in entry.get("social") or []:
+        for column, domains in (("LinkedIn", ("linkedin.com",)), ("Facebook", ("facebook.com",)),
+                                ("Instagram", ("instagram.com",)), ("YouTube", ("youtube.com", "youtu.be"))):
+            if any(domain in href for domain in domains):
+                social[column] = href
+    return {
+        "Name": entry.get("name") or fields["name"],
+        "Country": fields["country"] or "",
+        "Full Address": address,
+        "Hall & Stand": entry.get("hall_stand") or (f"{hall} | {stand}" if hall and stand else f"{hall}{stand}"),
+        "Floorplan Link": entry.get("floorplan") or "",
+        "Website": entry.get("website") or "",
+        **social,
+    }
+
+
+def fetch_entry(url):
+    """Entry fields of one exhibitor, parsed on the worker so only the fields are kept (None on failure)"""
+    try:
+        return extract_fields_html(fetch(url).text, ENTRY_FIELDS, base_url=SITE_URL)
+    except Exception as e:
+        print(f"❌ Failed to fetch {url}: {e}")
+        return None
+
+
+def scrape_http(pages):
+    """
+    (page, rows) for every page, in page order; rows is None for a page that failed. Pages go PAGE_CHUNK
+    at a time, list first and then all their exhibitor entries concurrently, so only one chunk is ever
+    held in memory.
+    """
+    browser = None  # opened once if the list pages turn out to render client-side
+    try:
+        with ThreadPoolExecutor(max_workers=ENTRY_WORKERS) as entries:
+            for start in range(0, len(pages), PAGE_CHUNK):
+                chunk = pages[start:start + PAGE_CHUNK]
+                listed = None if browser else fetch_pages(base_url, chunk, parse_list_page, parse_workers=0)
+                if listed is not None and start == 0 and not listed[0]:
+                    print("⚠️ List pages render client-side; reading them in the browser")
+                    browser = BrowserPool(make_driver, size=BROWSERS)
+                if browser:
+                    listed = list(browser.imap(list_page_in_browser, chunk))
+
+                # Every entry of the chunk is queued at once, then the rows come back page by page
+                queued = []
+                for page, found in zip(chunk, listed):
+                    if not found:
+                        queued.append((page, None, None, None))
+                        continue
+                    found = [fields for fields in found if fields["name"]]
+                    reused = [reuse_row(fields) for fields in found]
+                    fetched = [entries.submit(fetch_entry, fields["link"]) if fields["link"] and not previous else None
+                               for fields, previous in zip(found, reused)]
+                    print(f"📄 Page {page}: {len(found)} exhibitors, fetching {sum(map(bool, fetched))} entries")
+                    queued.append((page, found, reused, fetched))
+
+                for page, found, reused, fetched in queued:
+                    if found is None:
+                        yield page, None
+                        continue
+                    yield page, [{column: previous.get(column, "") for column in COLUMNS} if previous
+                                 else entry_row(fields, future.result() if future else None)
+                                 for fields, previous, future in zip(found, reused, fetched)]
+    finally:
+        if browser:
+            browser.close()
+
+
+def save_changes(rows, failed):
+    """Write the incremental changeset, unless failed pages would show up as removed exhibitors"""
+    if failed:
+        print(f"⚠️ {failed} pages failed; skipping the changeset, it would list their exhibitors as removed")
+    else:
+        save_changeset(incremental.changeset(rows), changes_path(OUTPUT_FILE))
+
+
+if "--http" in sys.argv:
+    total = failed = 0
+    all_rows = []  # only kept for the incremental changeset
+    try:
+        for page, rows in scrape_http(list(range(1, TOTAL_PAGES + 1))):
+            if rows is None:
+                print(f"❌ Page {page} failed")
+                failed += 1
+                continue
+            sink.write_many(rows)
+            total += len(rows)
+            if incremental:
+                all_rows.extend(rows)
+    finally:
+        sink.close()
+    if incremental:
+        save_changes(all_rows, failed)
+    STATS.report()
+    print(f"\n🎉 Scraping completed! {total} exhibitors saved to {OUTPUT_FILE}")
+    sys.exit(0)
+
+# --- Loop through pages ---
+pages = list(range(1, TOTAL_PAGES + 1))  # 1 → 151
+all_rows = []  # only kept for the incremental changeset
+failed = 0
+with BrowserPool(make_driver, size=BROWSERS) as pool:
+    # Pages run in parallel but are written in page order
+    for page, rows in zip(pages, pool.imap(scrape_page, pages)):
+        if rows is None:
+            print(f"❌ Page {page} failed")
+            failed += 1
+            continue
+        sink.write_many(rows)
+        if incremental:
+            all_rows.extend(rows)
 
-csv_file.close()
-driver.quit()
-print("\n🎉 Scraping completed! Data saved to gulfood_exhibitors.csv")
\ No newline at end of file
+sink.close()
+if incremental:
+    save_changes(all_rows, failed)
+STATS.report()
+print(f"\n🎉 Scraping completed! Data saved to {OUTPUT_FILE}")
\ No newline at end of file
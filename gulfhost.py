@@ -1,11 +1,9 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
 import pandas as pd
 import time, logging
+from driver_factory import make_driver
 
 logging.basicConfig(
     filename="gulfhost_scrape_log.txt",
@@ -17,10 +15,7 @@ def log(msg):
     print(msg)
     logging.info(msg)
 
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = make_driver()
 wait = WebDriverWait(driver, 25)
 
 url = "https://www.gulfhost.ae/exhibitors-2024"
@@ -1,20 +1,21 @@
-import requests
+import sys
 from bs4 import BeautifulSoup
-import pandas as pd
-import time
+from http_client import fetch, fetch_pages
+from sinks import XlsxSink, with_shared
 
 BASE_URL = "https://www.gulfoodmanufacturing.com/2025exhibitorlist?page={}"
 
-headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                  "(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
-}
+RATE = 5  # requests per second across all page fetches
+COLUMNS = ["Name", "Country", "Hall", "Stand"]
+SHOW = "gulfood-manufacturing"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
+
 
 def scrape_page(page):
-    url = BASE_URL.format(page)
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+    return parse_page(fetch(BASE_URL.format(page)).text)
+
+
+def parse_page(html):
+    soup = BeautifulSoup(html, "html.parser")
 
     data = []
     exhibitors = soup.select("li.m-exhibitors-list__items__item")
@@ -45,19 +46,14 @@ def scrape_page(page):
     return data
 
 
-all_data = []
-
-for page in range(1, 42):  # 41 pages
-    print(f"Scraping page {page} ...")
-    try:
-        page_data = scrape_page(page)
-        all_data.extend(page_data)
-        time.sleep(1)  # be polite, avoid blocking
-    except Exception as e:
-        print(f"Error on page {page}: {e}")
-
-# Save to Excel
-df = pd.DataFrame(all_data)
-df.to_excel("gulfood_exhibitors_2025.xlsx", index=False)
+if __name__ == "__main__":
+    pages = range(1, 42)  # 41 pages
+    print(f"Scraping {len(pages)} pages in parallel ...")
+    with with_shared(XlsxSink("gulfood_exhibitors_2025.xlsx", COLUMNS), SHOW, sys.argv) as sink:
+        for page, page_data in zip(pages, fetch_pages(BASE_URL, pages, parse_page, rate=RATE)):
+            if page_data is None:
+                print(f"Error on page {page}")
+                continue
+            sink.write_many(page_data)
 
-print("✅ Done! Data saved to gulfood_exhibitors_2025.xlsx")
+    print("✅ Done! Data saved to gulfood_exhibitors_2025.xlsx")
@@ -0,0 +1,191 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+import requests
+
+from http_client import DEFAULT_TIMEOUT, get
+
+logger = logging.getLogger(__name__)
+
+HTTP_CACHE_PATH = os.environ.get("SCRAPER_HTTP_CACHE", "http_cache.sqlite")
+DEFAULT_TTL = 12 * 3600             # serve without a request for this long, then revalidate
+DEFAULT_MAX_BYTES = 512 * 1024 ** 2  # evict least-recently-used bodies beyond this
+EVICT_EVERY = 200                    # stores between size checks
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url TEXT PRIMARY KEY,
+    status INTEGER,
+    headers TEXT,
+    body BLOB,
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL,
+    accessed_at REAL,
+    size INTEGER
+);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at);
+"""
+
+
+class CachedResponse:
+    """Just enough of requests.Response for the scrapers' parsing code"""
+
+    def __init__(self, url, status_code, headers, content, from_cache):
+        self.url = url
+        self.status_code = status_code
+        self.headers = requests.structures.CaseInsensitiveDict(headers)
+        self.content = content
+        self.from_cache = from_cache
+
+    @property
+    def text(self):
+        return self.content.decode(self._encoding(), errors="replace")
+
+    def _encoding(self):
+        content_type = self.headers.get("Content-Type", "")
+        if "charset=" in content_type:
+            return content_type.split("charset=")[-1].split(";")[0].strip()
+        return "utf-8"
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error for url: {self.url}")
+
+
+class HttpCache:
+    """SQLite response cache keyed by URL, revalidated with ETag / Last-Modified once the TTL runs out"""
+
+    def __init__(self, path=HTTP_CACHE_PATH, ttl=DEFAULT_TTL, max_bytes=DEFAULT_MAX_BYTES):
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.stats = {"fresh": 0, "revalidated": 0, "miss": 0, "changed": 0}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stores = 0
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, kind):
+        with self._lock:
+            self.stats[kind] += 1
+
+    # ---------------- STORAGE ----------------
+    def lookup(self, url):
+        row = self._conn().execute(
+            "SELECT status, headers, body, etag, last_modified, fetched_at FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return None
+        keys = ("status", "headers", "body", "etag", "last_modified", "fetched_at")
+        entry = dict(zip(keys, row))
+        entry["headers"] = json.loads(entry["headers"])
+        return entry
+
+    def is_fresh(self, entry):
+        return time.time() - entry["fetched_at"] < self.ttl
+
+    def conditional_headers(self, entry):
+        """If-None-Match / If-Modified-Since for revalidating a cached entry"""
+        headers = {}
+        if entry and entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry and entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def touch(self, url, refetched=False):
+        now = time.time()
+        conn = self._conn()
+        if refetched:
+            conn.execute("UPDATE responses SET accessed_at = ?, fetched_at = ? WHERE url = ?", (now, now, url))
+        else:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (now, url))
+        conn.commit()
+
+    def store(self, url, status, headers, body):
+        """Save a 200 response; pages marked no-store are skipped"""
+        headers = requests.structures.CaseInsensitiveDict(headers)
+        if status != 200 or "no-store" in headers.get("Cache-Control", ""):
+            return
+        now = time.time()
+        conn = self._conn()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (url, status, json.dumps(dict(headers)), body, headers.get("ETag"), headers.get("Last-Modified"),
+             now, now, len(body)),
+        )
+        conn.commit()
+        with self._lock:
+            self._stores += 1
+            due = self._stores % EVICT_EVERY == 0
+        if due:
+            self.evict()
+
+    def evict(self):
+        """Drop least-recently-used entries until the cache fits in max_bytes"""
+        conn = self._conn()
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        removed = 0
+        for url, size in conn.execute("SELECT url, size FROM responses ORDER BY accessed_at").fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            total -= size
+            removed += 1
+        conn.commit()
+        logger.info(f"HTTP cache: evicted {removed} entries")
+
+    # ---------------- FETCHING ----------------
+    def hit(self, url, entry, revalidated=False):
+        """Count and touch a cache hit (fresh, or confirmed by a 304) and return it as a response"""
+        self._count("revalidated" if revalidated else "fresh")
+        self.touch(url, refetched=revalidated)
+        return CachedResponse(url, entry["status"], entry["headers"], entry["body"], from_cache=True)
+
+    def miss(self, url, entry, status, headers, body):
+        """Count and store a full response that had to be downloaded"""
+        self._count("changed" if entry else "miss")
+        self.store(url, status, headers, body)
+
+    def fetch(self, url, session=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+        """http_client.fetch with the cache in front: fresh hit → no request, stale hit → conditional GET"""
+        entry = self.lookup(url)
+        if entry and self.is_fresh(entry):
+            return self.hit(url, entry)
+
+        headers = {**kwargs.pop("headers", {}), **self.conditional_headers(entry)}
+        response = get(url, session=session, timeout=timeout, headers=headers, **kwargs)
+        if response.status_code == 304 and entry:
+            return self.hit(url, entry, revalidated=True)
+
+        response.raise_for_status()
+        self.miss(url, entry, response.status_code, response.headers, response.content)
+        return response
+
+    def report(self):
+        """Log this run's hit rate"""
+        total = sum(self.stats.values())
+        if not total:
+            return
+        hits = self.stats["fresh"] + self.stats["revalidated"]
+        logger.info(f"HTTP cache: {hits}/{total} hits ({hits / total:.0%}) - "
+                    f"{self.stats['fresh']} fresh, {self.stats['revalidated']} revalidated (304), "
+                    f"{self.stats['changed']} changed, {self.stats['miss']} new")
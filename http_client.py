@@ -0,0 +1,170 @@
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from rate_limiter import get_limiter
+
+try:
+    import brotli  # noqa: F401  (lets urllib3 decode Content-Encoding: br)
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                  "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept-Encoding": ACCEPT_ENCODING,
+}
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+DEFAULT_TIMEOUT = 20
+
+
+def make_session(pool_size=16, retries=3, backoff=0.5, headers=None, http2=False):
+    """Keep-alive session with a connection pool and the project-wide retry policy"""
+    if http2:
+        if httpx is None:
+            raise RuntimeError("http2=True needs httpx with HTTP/2 support: pip install 'httpx[http2]'")
+        limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+        transport = httpx.HTTPTransport(http2=True, retries=retries, limits=limits)
+        return httpx.Client(headers={**DEFAULT_HEADERS, **(headers or {})}, transport=transport,
+                            follow_redirects=True)
+
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD", "POST"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(DEFAULT_HEADERS)
+    if headers:
+        session.headers.update(headers)
+    return session
+
+
+_default_session = None
+_default_lock = threading.Lock()
+
+
+def get_session():
+    """Process-wide shared session, created on first use"""
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = make_session()
+        return _default_session
+
+
+def get(url, session=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """GET url through the pooled session once the host's rate limit allows it"""
+    session = session or get_session()
+    get_limiter().acquire(url)
+    return session.get(url, timeout=timeout, **kwargs)
+
+
+def post(url, session=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """POST to url through the pooled session once the host's rate limit allows it"""
+    session = session or get_session()
+    get_limiter().acquire(url)
+    return session.post(url, timeout=timeout, **kwargs)
+
+
+def fetch(url, session=None, timeout=DEFAULT_TIMEOUT, **kwargs):
+    """Like get(), but raise on a final HTTP error status"""
+    response = get(url, session=session, timeout=timeout, **kwargs)
+    response.raise_for_status()
+    return response
+
+
+class _HostLimits:
+    """One bounded semaphore per host so fetch_many never opens more than per_host requests to a site"""
+
+    def __init__(self, per_host):
+        self.per_host = per_host
+        self._lock = threading.Lock()
+        self._semaphores = {}
+
+    def __call__(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            if host not in self._semaphores:
+                self._semaphores[host] = threading.BoundedSemaphore(self.per_host)
+            return self._semaphores[host]
+
+
+def fetch_many(urls, max_workers=8, per_host=4, session=None, **kwargs):
+    """Fetch every URL concurrently; returns responses in the order of urls (None where a fetch failed)"""
+    session = session or get_session()
+    limits = _HostLimits(per_host)
+
+    def fetch_one(url):
+        with limits(url):
+            try:
+                return fetch(url, session=session, **kwargs)
+            except Exception as e:
+                logger.error(f"Failed to fetch {url}: {e}")
+                return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(fetch_one, urls))
+
+
+def fetch_pages(url_template, pages, parse, rate=None, max_workers=8, parse_workers=None, session=None, **kwargs):
+    """
+    Fetch url_template.format(page) for every page concurrently under the host's rate limit,
+    hand each body to parse(html) on a process pool as soon as it arrives, and return the
+    parse results in page order (None for pages that failed to fetch or parse).
+
+    rate overrides the host's budget in the shared limiter (requests per second).
+    parse must be a module-level function so it can be pickled; parse_workers=0 parses on a thread instead.
+    """
+    session = session or get_session()
+    pages = list(pages)
+    urls = [url_template.format(page) for page in pages]
+    if rate:
+        get_limiter().configure(url_template, rate)
+
+    def fetch_one(url):
+        try:
+            return fetch(url, session=session, **kwargs).text
+        except Exception as e:
+            logger.error(f"Failed to fetch {url}: {e}")
+            return None
+
+    parser_pool = ThreadPoolExecutor(1) if parse_workers == 0 else ProcessPoolExecutor(parse_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as fetchers, parser_pool as parsers:
+        fetched = {fetchers.submit(fetch_one, url): index for index, url in enumerate(urls)}
+        parsed = [None] * len(urls)
+        for future in as_completed(fetched):
+            html = future.result()
+            if html is not None:
+                parsed[fetched[future]] = parsers.submit(parse, html)
+
+        results = []
+        for url, future in zip(urls, parsed):
+            try:
+                results.append(future.result() if future else None)
+            except Exception as e:
+                logger.error(f"Failed to parse {url}: {e}")
+                results.append(None)
+    return results
@@ -1,21 +1,27 @@
 import time
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from batch_extract import extract_cards
+from driver_factory import make_driver
 
 # Setup Selenium
-options = webdriver.ChromeOptions()
-# options.add_argument("--headless")  # Uncomment later for production
-options.add_argument("--disable-gpu")
-options.add_argument("--no-sandbox")
-options.add_argument("--window-size=1920,1080")
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+driver = make_driver()
 
 BASE_URL = "https://www.idexuae.ae/exhibit/exhibitor-list/"
+CARD_SEL = "div.v-col-sm-4 div.v-card.v-theme--light.bg-white"
+
+# Card fields, read for the whole page in one execute_script call
+CARD_FIELDS = {
+    "Name": ("div.v-card-title", "text"),
+    "Subtitles": ("div.v-card-subtitle span", "text[]"),
+    "Stand Number": ("a.v-chip--link div.v-chip__content", "text"),
+    "Stand Link": ("a[href*='map.idexuae.ae']", "href"),
+    "Website": ("div.v-card-text a[target='_blank']", "href"),
+    "Type": ("span.v-chip--label div.v-chip__content", "text"),
+}
+
 driver.get(BASE_URL)
 time.sleep(5)
 
@@ -28,63 +34,28 @@ for page in range(1, 66):  # 65 pages
 
     # Wait for cards to load and use more specific selector
     cards = wait.until(
-        EC.presence_of_all_elements_located((By.CSS_SELECTOR, "div.v-col-sm-4 div.v-card.v-theme--light.bg-white"))
+        EC.presence_of_all_elements_located((By.CSS_SELECTOR, CARD_SEL))
     )
     print(f"Found {len(cards)} exhibitors on page {page}")
 
-    for idx, card in enumerate(cards, start=1):
-        try:
-            name = card.find_element(By.CSS_SELECTOR, "div.v-card-title").text.strip()
-        except:
-            name = ""
-
-        try:
-            # Get country - look for the span that contains country name after the flag icon
-            country_elements = card.find_elements(By.CSS_SELECTOR, "div.v-card-subtitle span")
-            country = ""
-            for elem in country_elements:
-                text = elem.text.strip()
-                # Skip empty text and chip labels (like "Individual", "Brand", etc.)
-                if text and not any(keyword in text.lower() for keyword in ['individual', 'brand', 'pavilion', 'uae pavilion']):
-                    country = text
-                    break
-        except:
-            country = ""
-
-        try:
-            # Stand number - more specific selector
-            stand_element = card.find_element(By.CSS_SELECTOR, "a.v-chip--link div.v-chip__content")
-            stand_number = stand_element.text.strip()
-        except:
-            stand_number = ""
-
-        try:
-            stand_link = card.find_element(By.CSS_SELECTOR, "a[href*='map.idexuae.ae']").get_attribute("href")
-        except:
-            stand_link = ""
+    for idx, fields in enumerate(extract_cards(driver, CARD_SEL, CARD_FIELDS), start=1):
+        name = fields["Name"] or ""
 
-        try:
-            # Website - more specific selector
-            website_element = card.find_element(By.CSS_SELECTOR, "div.v-card-text a[target='_blank']")
-            website = website_element.get_attribute("href")
-        except:
-            website = ""
-
-        # Additional data points you might want
-        try:
-            # Company type (Individual, Brand, Pavilion, etc.)
-            type_element = card.find_element(By.CSS_SELECTOR, "span.v-chip--label div.v-chip__content")
-            company_type = type_element.text.strip()
-        except:
-            company_type = ""
+        # Country is the first subtitle span that isn't a chip label (Individual, Brand, Pavilion...)
+        country = next(
+            (t for t in fields["Subtitles"]
+             if t and not any(keyword in t.lower() for keyword in ['individual', 'brand', 'pavilion', 'uae pavilion'])),
+            ""
+        )
+        stand_number = fields["Stand Number"] or ""
 
         row = {
             "Name": name,
-            "Type": company_type,
+            "Type": fields["Type"] or "",
             "Country": country,
             "Stand Number": stand_number,
-            "Stand Link": stand_link,
-            "Website": website
+            "Stand Link": fields["Stand Link"] or "",
+            "Website": fields["Website"] or ""
         }
         all_data.append(row)
 
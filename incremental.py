@@ -0,0 +1,125 @@
+import json
+import logging
+import math
+import os
+import re
+from urllib.parse import urlsplit, urlunsplit
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Bookkeeping columns that change on every run and never count as a modification
+IGNORED_FIELDS = ("Order",)
+
+
+def normalize(text):
+    """Lower-case and collapse whitespace/punctuation so cosmetic edits don't change a key"""
+    return re.sub(r"[\W_]+", " ", str(text or "")).strip().lower()
+
+
+def normalize_url(url):
+    """Drop the fragment and trailing slash, lower-case scheme and host"""
+    parts = urlsplit(url.strip())
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), parts.query, ""))
+
+
+def value_text(value):
+    """Comparable text for a value that may have round-tripped through xlsx/csv/json"""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        if value.is_integer():
+            return str(int(value))
+    if isinstance(value, (list, tuple)):
+        return ", ".join(value_text(v) for v in value)
+    return str(value).strip()
+
+
+def make_key(url_field=None, name_field="Company Name", stand_fields=()):
+    """Key function: the detail URL when a record has one, otherwise normalized name + stand"""
+    def key(record):
+        url = value_text(record.get(url_field)) if url_field else ""
+        if url and url != "N/A":
+            return normalize_url(url)
+        return " | ".join(normalize(value_text(record.get(f))) for f in (name_field, *stand_fields))
+    return key
+
+
+def load_records(path):
+    """Previous run's output (xlsx, csv or json) as a list of dicts; [] when there is none"""
+    if not path or not os.path.exists(path):
+        return []
+    if path.endswith(".json"):
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    if path.endswith(".csv"):
+        df = pd.read_csv(path, dtype=str, keep_default_na=False)
+    else:
+        df = pd.read_excel(path, dtype=str).fillna("")
+    return df.to_dict("records")
+
+
+class IncrementalRun:
+    """Diff a fresh list scrape against the previous output so only new or changed exhibitors get detail fetches"""
+
+    def __init__(self, previous_path, key, list_fields=()):
+        self.previous_path = previous_path
+        self.key = key
+        self.list_fields = list_fields
+        self.previous = {}
+        for record in load_records(previous_path):
+            self.previous.setdefault(key(record), record)
+        self.reused = 0
+        logger.info(f"Incremental: {len(self.previous)} exhibitors in {previous_path}")
+
+    def reuse(self, list_record):
+        """The previous full record if this exhibitor is known and its list fields are unchanged, else None"""
+        previous = self.previous.get(self.key(list_record))
+        if previous is None:
+            return None
+        if any(value_text(list_record.get(f)) != value_text(previous.get(f)) for f in self.list_fields):
+            return None
+        self.reused += 1
+        return previous
+
+    def changeset(self, records):
+        """Added / removed exhibitors and per-field modifications between the previous output and records"""
+        current = {}
+        for record in records:
+            current.setdefault(self.key(record), record)
+
+        modified = []
+        for key, record in current.items():
+            previous = self.previous.get(key)
+            if previous is None:
+                continue
+            for field, value in record.items():
+                if field in IGNORED_FIELDS or field not in previous:
+                    continue
+                old, new = value_text(previous[field]), value_text(value)
+                if old != new:
+                    modified.append({"Key": key, "Field": field, "Old": old, "New": new})
+
+        return {
+            "added": [r for k, r in current.items() if k not in self.previous],
+            "removed": [r for k, r in self.previous.items() if k not in current],
+            "modified": modified,
+        }
+
+
+def changes_path(output_file):
+    """exhibitors.xlsx → exhibitors_changes.xlsx"""
+    return f"{os.path.splitext(output_file)[0]}_changes.xlsx"
+
+
+def save_changeset(changeset, path):
+    """Write the changeset as an xlsx with Added / Removed / Modified sheets"""
+    with pd.ExcelWriter(path) as writer:
+        for sheet in ("added", "removed", "modified"):
+            rows = [{k: value_text(v) for k, v in row.items()} for row in changeset[sheet]]
+            pd.DataFrame(rows).to_excel(writer, sheet_name=sheet.title(), index=False)
+    print(f"🔁 Changes: {len(changeset['added'])} added, {len(changeset['removed'])} removed, "
+          f"{len(changeset['modified'])} field changes → {path}")
@@ -0,0 +1,85 @@
+"""
+Harvest detail pages through the live browser session without opening tabs.
+
+One execute_async_script call fetch()es a batch of URLs from inside the current page, so the
+requests carry the session's cookies and anti-bot state, parses each response with DOMParser,
+and returns the declared fields as JSON. Fields use the batch_extract spec format.
+"""
+import logging
+
+from selenium.common.exceptions import WebDriverException
+
+from batch_extract import FIELD_HELPERS_JS
+from rate_limiter import get_limiter
+
+logger = logging.getLogger(__name__)
+
+HARVEST_SCRIPT = FIELD_HELPERS_JS + """
+const urls = arguments[0], fields = arguments[1], ready = arguments[2];
+const concurrency = arguments[3], timeoutMs = arguments[4], delays = arguments[5];
+const done = arguments[arguments.length - 1];
+const results = new Array(urls.length).fill(null);
+const started = performance.now();
+let next = 0;
+
+async function harvestOne(url) {
+    const controller = new AbortController();
+    const timer = setTimeout(() => controller.abort(), timeoutMs);
+    try {
+        const response = await fetch(url, {credentials: 'include', signal: controller.signal});
+        if (!response.ok) return {error: 'HTTP ' + response.status};
+        const doc = new DOMParser().parseFromString(await response.text(), 'text/html');
+        // Relative links resolve against the detail page, not the page running the script
+        const base = doc.createElement('base');
+        base.href = response.url;
+        doc.head.prepend(base);
+        if (ready && !doc.querySelector(ready)) return {error: 'no ' + ready};
+        return {fields: readFields(doc, fields)};
+    } catch (e) {
+        return {error: String(e)};
+    } finally {
+        clearTimeout(timer);
+    }
+}
+
+async function worker() {
+    while (next < urls.length) {
+        const i = next++;
+        // Each request waits for its rate-limit slot, so the page never bursts past the host's budget
+        const wait = delays[i] * 1000 - (performance.now() - started);
+        if (wait > 0) await new Promise(resolve => setTimeout(resolve, wait));
+        results[i] = await harvestOne(urls[i]);
+    }
+}
+
+Promise.all(Array.from({length: Math.min(concurrency, urls.length)}, worker)).then(() => done(results));
+"""
+
+
+def harvest(driver, urls, fields, ready=None, concurrency=8, batch=100, timeout=30):
+    """
+    Fields of every detail page, in the order of urls; None where the fetch failed or the page lacks
+    the ready selector (e.g. it only renders client-side), so callers can fall back to a tab for those.
+    """
+    results = []
+    for start in range(0, len(urls), batch):
+        chunk = list(urls[start:start + batch])
+        # The page's requests bypass Python: reserve their rate-limit tokens here and let the page
+        # wait out each one's delay before sending it
+        delays = [get_limiter().bucket(url).reserve() for url in chunk]
+        driver.set_script_timeout(max(delays) + timeout * (len(chunk) // concurrency + 2))
+        try:
+            answers = driver.execute_async_script(HARVEST_SCRIPT, chunk, {k: list(v) for k, v in fields.items()},
+                                                  ready, concurrency, timeout * 1000, delays)
+        except WebDriverException as e:
+            logger.warning(f"In-page fetch of {len(chunk)} pages failed: {e}")
+            answers = [None] * len(chunk)
+        for url, answer in zip(chunk, answers):
+            if answer and "fields" in answer:
+                results.append(answer["fields"])
+            else:
+                logger.debug(f"In-page fetch of {url}: {answer and answer.get('error')}")
+                results.append(None)
+    failed = sum(1 for r in results if r is None)
+    logger.info(f"In-page fetch: {len(results) - failed}/{len(results)} detail pages harvested")
+    return results
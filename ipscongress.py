@@ -1,80 +1,78 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
-import time
+import sys
+from batch_extract import extract_cards
+from driver_factory import make_driver, open_tab
+from inpage_fetch import harvest
 
 URL = "https://www.ipscongress.com/exhibitors-2025"
-
-options = webdriver.ChromeOptions()
-options.add_argument("--log-level=3")
-options.add_argument("--start-maximized")
-driver = webdriver.Chrome(options=options)
+# `--harvest` fetch()es every detail page from inside the list page instead of opening a tab each
+HARVEST = "--harvest" in sys.argv
+DETAIL_FIELDS = {
+    "name": (".col-lg-7 h1", "text"),
+    "paragraphs": (".col-lg-7 p", "text[]"),
+    "website": (".col-lg-7 a.btn[href*='http']", "href"),
+    "linkedin": (".col-lg-7 a[href*='linkedin.com']", "href"),
+}
+
+driver = make_driver()
 driver.get(URL)
 
 wait = WebDriverWait(driver, 10)
 cards = wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, ".exhibitor-item")))
 print(f"Found {len(cards)} exhibitors")
+links = [row["link"] for row in extract_cards(driver, ".exhibitor-item", {"link": ("a", "href")})]
 
 data = []
 
-for i, card in enumerate(cards):
-    try:
-        link = card.find_element(By.TAG_NAME, "a").get_attribute("href")
-
-        # Open detail page in a new tab
-        driver.execute_script("window.open(arguments[0]);", link)
-        driver.switch_to.window(driver.window_handles[1])
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".col-lg-7 h1")))
 
-        # Scrape details
-        company_name = driver.find_element(By.CSS_SELECTOR, ".col-lg-7 h1").text.strip()
+def record(fields):
+    """Output row from the detail page fields"""
+    booth_no = ""
+    country = ""
+    for text in fields["paragraphs"]:
+        text = text.strip()
+        if "Stand No" in text:
+            booth_no = text.replace("Stand No:", "").strip()
+        elif len(text.split(',')) == 1:
+            country = text  # comma-separated lines are the street address, which isn't exported
 
-        info_paragraphs = driver.find_elements(By.CSS_SELECTOR, ".col-lg-7 p")
-        booth_no = ""
-        country = ""
-        address = ""
-        for p in info_paragraphs:
-            text = p.text.strip()
-            if "Stand No" in text:
-                booth_no = text.replace("Stand No:", "").strip()
-            elif len(text.split(',')) == 1:
-                country = text
-            else:
-                address = text
+    return {
+        "Company name": (fields["name"] or "").strip(),
+        "Country": country,
+        "Booth No": booth_no,
+        "Company Website": fields["website"] or "",
+        "Company LinkedIn": fields["linkedin"] or "",
+        "Company Contact": ""
+    }
 
-        try:
-            website = driver.find_element(By.CSS_SELECTOR, ".col-lg-7 a.btn[href*='http']").get_attribute("href")
-        except:
-            website = ""
 
-        try:
-            linkedin = driver.find_element(By.CSS_SELECTOR, ".col-lg-7 a[href*='linkedin.com']").get_attribute("href")
-        except:
-            linkedin = ""
+detail_links = [link for link in links if link]
+harvested = dict(zip(detail_links, harvest(driver, detail_links, DETAIL_FIELDS, ready=".col-lg-7 h1"))) if HARVEST else {}
 
-        contact = ""
-
-        data.append({
-            "Company name": company_name,
-            "Country": country,
-            "Booth No": booth_no,
-            "Company Website": website,
-            "Company LinkedIn": linkedin,
-            "Company Contact": contact
-        })
+for i, link in enumerate(links):
+    try:
+        fields = harvested.get(link)
+        if fields is None:
+            # Open detail page in a new tab
+            open_tab(driver, link)
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".col-lg-7 h1")))
+            fields = extract_cards(driver, "body", DETAIL_FIELDS)[0]
 
-        print(f"Scraped: {company_name}")
+            # Close tab and switch back
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
 
-        # Close tab and switch back
-        driver.close()
-        driver.switch_to.window(driver.window_handles[0])
+        data.append(record(fields))
+        print(f"Scraped: {data[-1]['Company name']}")
 
     except Exception as e:
         print(f"Error on card {i+1}: {e}")
-        driver.close()
-        driver.switch_to.window(driver.window_handles[0])
+        if len(driver.window_handles) > 1:
+            driver.close()
+            driver.switch_to.window(driver.window_handles[0])
         continue
 
 # Save to CSV
@@ -1,18 +1,17 @@
-import requests
+import sys
 from bs4 import BeautifulSoup
-import pandas as pd
-import time
+from http_client import fetch_pages
+from sinks import XlsxSink, with_shared
 
 BASE_URL = "https://www.ism-me.com/exhibitor-list?page={}&filters.exhibitor-year=__isBlank&searchgroup=CAE58EE8-exhibitors"
 
-headers = {
-    "User-Agent": "Mozilla/5.0"
-}
+RATE = 5  # requests per second across all page fetches
+COLUMNS = ["Name", "Hall", "Booth", "Floor Plan Link", "Country"]
+SHOW = "ism-middle-east"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
 
-def scrape_page(page):
-    url = BASE_URL.format(page)
-    response = requests.get(url, headers=headers)
-    soup = BeautifulSoup(response.text, "html.parser")
+
+def parse_page(html):
+    soup = BeautifulSoup(html, "html.parser")
 
     items = soup.select("li.m-exhibitors-list__items__item")
     data = []
@@ -50,17 +49,25 @@ def scrape_page(page):
 
 
 def scrape_all_pages(max_pages=73):  # default to 73 pages
-    all_data = []
-    for page in range(1, max_pages + 1):
-        print(f"Scraping page {page}/{max_pages} ...")
-        page_data = scrape_page(page)
+    """Exhibitors of every page that loaded, and the pages that failed"""
+    print(f"Scraping {max_pages} pages in parallel ...")
+    all_data, failed = [], []
+    pages = range(1, max_pages + 1)
+    for page, page_data in zip(pages, fetch_pages(BASE_URL, pages, parse_page, rate=RATE)):
+        if page_data is None:
+            print(f"❌ Page {page}/{max_pages} failed")
+            failed.append(page)
+            continue
         all_data.extend(page_data)
-        time.sleep(1)  # polite delay so we don’t overload the server
-    return all_data
+    return all_data, failed
 
 
 if __name__ == "__main__":
-    exhibitors = scrape_all_pages(73)
-    df = pd.DataFrame(exhibitors)
-    df.to_excel("ism_exhibitors_all.xlsx", index=False)
+    exhibitors, failed = scrape_all_pages(73)
+    with with_shared(XlsxSink("ism_exhibitors_all.xlsx", COLUMNS), SHOW, sys.argv) as sink:
+        sink.write_many(exhibitors)
+    if failed:
+        print(f"⚠️ {len(failed)} pages failed ({', '.join(map(str, failed))}); "
+              f"saved {len(exhibitors)} exhibitors from the rest to ism_exhibitors_all.xlsx")
+        sys.exit(1)
     print("✅ Scraping complete. Saved to ism_exhibitors_all.xlsx")
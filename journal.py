@@ -0,0 +1,85 @@
+import json
+import logging
+import os
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+def journal_path(save_file):
+    """exhibitors.xlsx → exhibitors.journal.jsonl"""
+    return f"{os.path.splitext(save_file)[0]}.journal.jsonl"
+
+
+class Journal:
+    """Append-only JSONL log of scraped records and finished pages, replayed on --resume"""
+
+    def __init__(self, path, resume=False):
+        self.path = path
+        self.records = []
+        self.done_keys = set()
+        self.done_pages = set()
+        if resume:
+            self._replay()
+        self._file = open(path, "a" if resume else "w", encoding="utf-8")
+        if resume and self._file.tell() and not self._ends_with_newline():
+            self._file.write("\n")  # close off a torn last line so new entries parse
+        self._lock = threading.Lock()
+
+    def _replay(self):
+        if not os.path.exists(self.path):
+            logger.info(f"No journal at {self.path}, starting from scratch")
+            return
+        entries = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    continue  # torn last line from a crash
+        self.done_pages = {e["page"] for e in entries if e["type"] == "page"}
+        # Records of a page that never finished are dropped; that page gets scraped again
+        kept = []
+        for entry in entries:
+            if entry["type"] == "page":
+                kept.append(entry)
+            elif entry["type"] == "record" and (entry.get("page") is None or entry["page"] in self.done_pages):
+                kept.append(entry)
+                self.records.append(entry["data"])
+                if entry.get("key"):
+                    self.done_keys.add(entry["key"])
+        self._rewrite(kept)
+        print(f"♻️ Resuming: {len(self.records)} records, {len(self.done_pages)} pages from {self.path}")
+
+    def _rewrite(self, entries):
+        """Replace the journal with the entries kept on replay, so dropped records can't come back later"""
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False, default=str) + "\n")
+        os.replace(tmp, self.path)
+
+    def _ends_with_newline(self):
+        with open(self.path, "rb") as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b"\n"
+
+    def _write(self, entry):
+        line = json.dumps(entry, ensure_ascii=False, default=str) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._file.flush()
+
+    def record(self, data, key=None, page=None):
+        """Journal one scraped exhibitor"""
+        self._write({"type": "record", "key": key, "page": page, "data": data})
+        if key:
+            self.done_keys.add(key)
+
+    def page_done(self, page):
+        """Mark a page as complete so --resume skips it"""
+        self._write({"type": "page", "page": page})
+        self.done_pages.add(page)
+
+    def close(self):
+        self._file.close()
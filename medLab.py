@@ -2,7 +2,6 @@ import requests
 from bs4 import BeautifulSoup
 import time
 import pandas as pd
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -10,27 +9,27 @@ from selenium.webdriver.chrome.options import Options
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 import re
 import json
+import sys
+from driver_factory import make_driver
+from network_capture import NetworkCapture, enable_performance_log, records_from_responses
 
 class WHXExhibitorScraper:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, capture=False):
         self.base_url = "https://www.worldhealthexpo.com/events/labs/dubai/en/attend/exhibitor-list.html"
         self.driver = None
-        self.setup_driver(headless)
+        self.capture = None
+        self.setup_driver(headless, capture)
         
-    def setup_driver(self, headless=False):
+    def setup_driver(self, headless=False, capture=False):
         """Setup Chrome driver"""
         chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-blink-features=AutomationControlled")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
-        chrome_options.add_argument("--window-size=1920,1080")
+        if capture:
+            enable_performance_log(chrome_options)
         
-        self.driver = webdriver.Chrome(options=chrome_options)
+        self.driver = make_driver(headless=headless, options=chrome_options)
+        if capture:
+            self.capture = NetworkCapture(self.driver).start()
         self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
     
     def wait_for_exhibitor_widget(self):
@@ -99,6 +98,23 @@ class WHXExhibitorScraper:
         print(f"🎉 Finished scrolling. Total exhibitors found: {final_count}")
         return final_count
     
+    def extract_exhibitor_data_from_network(self):
+        """Build exhibitor data from the widget's captured JSON responses instead of the DOM"""
+        print("🔍 Building exhibitor data from captured API responses...")
+        
+        exhibitors_data = []
+        for record in records_from_responses(self.capture.drain()):
+            exhibitors_data.append({
+                'company_name': record['Company Name'] or 'N/A',
+                'booth_number': record['Booth No'] or 'N/A',
+                'linkedin': record['LinkedIn'] or 'N/A',
+                'email': record['Email'] or 'N/A',
+                'phone': record['Phone'] or 'N/A'
+            })
+        
+        print(f"📋 Found {len(exhibitors_data)} exhibitors in captured responses")
+        return exhibitors_data
+    
     def extract_exhibitor_data_from_list(self):
         """Extract exhibitor data directly from the list without clicking"""
         print("🔍 Extracting exhibitor data from list...")
@@ -262,6 +278,10 @@ class WHXExhibitorScraper:
             # Perform infinite scroll to load all exhibitors
             total_exhibitors = self.infinite_scroll_until_end()
             
+            # The scroll made the widget request every page; read those responses directly
+            if self.capture:
+                return self.extract_exhibitor_data_from_network()
+            
             if total_exhibitors == 0:
                 print("❌ No exhibitors found after scrolling")
                 return []
@@ -346,7 +366,7 @@ def main():
     scraper = None
     try:
         # Initialize scraper with visible browser
-        scraper = WHXExhibitorScraper(headless=False)
+        scraper = WHXExhibitorScraper(headless=False, capture="--capture" in sys.argv)
         
         # Scrape all exhibitors
         exhibitors_data = scraper.scrape_all_exhibitors()
@@ -3,20 +3,24 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
-import time, traceback
+import time, sys, traceback
+from network_capture import NetworkCapture, enable_performance_log, records_from_responses
+from driver_factory import make_driver, open_tab
 
 # ---------------- CONFIG ----------------
 URL = "https://www.worldhealthexpo.com/events/labs/dubai/en/attend/exhibitor-list.html"
 SAVE_FILE = "medlab_full_exhibitors.xlsx"
+CAPTURE = "--capture" in sys.argv  # build records from the widget's JSON instead of the DOM
 
 # ---------------- SETUP ----------------
 options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-# options.add_argument("--headless=new")  # optional if running on server
 
-driver = webdriver.Chrome(options=options)
+if CAPTURE:
+    enable_performance_log(options)
+
+driver = make_driver(options=options)
 wait = WebDriverWait(driver, 25)
+capture = NetworkCapture(driver).start() if CAPTURE else None
 
 # ---------------- LOAD PAGE ----------------
 driver.get(URL)
@@ -41,6 +45,15 @@ def scroll_until_end(pause=2, max_waits=10):
 
 scroll_until_end()
 
+# ---------------- CAPTURE MODE ----------------
+if capture:
+    records = records_from_responses(capture.drain())
+    df = pd.DataFrame(records, columns=["Company Name", "Booth No", "Country", "Hall", "Website", "LinkedIn"])
+    df.to_excel(SAVE_FILE, index=False)
+    print(f"\n💾 Saved {len(df)} exhibitors from captured API responses to {SAVE_FILE}")
+    driver.quit()
+    sys.exit(0)
+
 # ---------------- SCRAPE ALL EXHIBITOR LINKS ----------------
 cards = driver.find_elements(By.CSS_SELECTOR, "a[href*='/widget/event/medlab-middle-east-2025/exhibitor/']")
 print(f"📦 Total exhibitor cards found: {len(cards)}")
@@ -111,8 +124,7 @@ def scrape_detail_page():
 # ---------------- SCRAPE EACH EXHIBITOR ----------------
 for link in exhibitor_links:
     try:
-        driver.execute_script("window.open(arguments[0], '_blank');", link)
-        driver.switch_to.window(driver.window_handles[-1])
+        open_tab(driver, link)
         time.sleep(4)
         data = scrape_detail_page()
         data["Order"] = counter
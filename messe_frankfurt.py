@@ -0,0 +1,366 @@
+import argparse
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from bs4 import BeautifulSoup
+
+from http_cache import HttpCache
+from http_client import get
+from sinks import open_sink, with_shared
+
+logger = logging.getLogger(__name__)
+
+# Backend the exhibitor-search page queries from the browser
+SEARCH_API_URL = "https://api.messefrankfurt.com/service/esb_api/exhibitor-service/api/2.1/public/exhibitor/search"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json, text/plain, */*",
+}
+
+COLUMNS = [
+    "Order", "Company Name", "City", "Country", "Booth No",
+    "Company Website", "Company LinkedIn", "Company Contact", "URL",
+]
+
+
+# ---------------- PARSERS ----------------
+def discover_search_config(html):
+    """Read the API key and event variable the exhibitor-search page passes to its widget"""
+    config = {}
+    key = re.search(r'apikey["\']?\s*[:=]\s*["\']([^"\']+)["\']', html, re.IGNORECASE)
+    if key:
+        config["api_key"] = key.group(1)
+    event = re.search(
+        r'(?:findEventVariable|eventVariable|event-variable)["\']?\s*[:=]\s*["\']([A-Za-z0-9_\-]+)["\']',
+        html, re.IGNORECASE,
+    )
+    if event:
+        config["event_variable"] = event.group(1)
+    return config
+
+
+def _get(data, path, default=""):
+    """Follow a dotted path through nested dicts, taking the first item of any list on the way"""
+    for key in path.split("."):
+        if isinstance(data, list):
+            data = data[0] if data else None
+        if not isinstance(data, dict):
+            return default
+        data = data.get(key)
+    return default if data is None else data
+
+
+def _find_linkedin(data):
+    """Return the first linkedin.com URL found anywhere in a JSON value"""
+    if isinstance(data, str):
+        return data if "linkedin.com" in data.lower() else ""
+    values = data.values() if isinstance(data, dict) else data if isinstance(data, list) else []
+    for value in values:
+        found = _find_linkedin(value)
+        if found:
+            return found
+    return ""
+
+
+def format_booth(exhibition):
+    """Format every hall/stand pair of a search hit as 'Hall - Stand'"""
+    booths = []
+    halls = exhibition.get("exhibitionHall", []) if isinstance(exhibition, dict) else []
+    for hall in halls:
+        hall_name = (hall.get("name") or "").strip()
+        stands = hall.get("stand") or [{}]
+        for stand in stands:
+            stand_name = (stand.get("name") or "").strip()
+            booths.append(f"{hall_name} - {stand_name}" if hall_name and stand_name else hall_name or stand_name)
+    return "; ".join(b for b in booths if b)
+
+
+def record_from_hit(hit, detail_url=""):
+    """Map one search API hit to the scrape_detail_page columns"""
+    exhibitor = hit.get("exhibitor", hit)
+    address = exhibitor.get("address") or {}
+    return {
+        "Order": "",
+        "Company Name": (exhibitor.get("name") or "").strip(),
+        "City": (address.get("city") or "").strip(),
+        "Country": str(_get(address, "country.label") or _get(address, "country")).strip(),
+        "Booth No": format_booth(exhibitor.get("exhibition") or {}),
+        "Company Website": (exhibitor.get("href") or exhibitor.get("homepage") or "").strip(),
+        "Company LinkedIn": _find_linkedin(exhibitor),
+        "Company Contact": (address.get("tel") or address.get("phone") or "").strip(),
+        "URL": detail_url,
+    }
+
+
+def parse_detail_html(html, url=""):
+    """Extract the .ex-contact-box__* fields from a rendered exhibitor detail page"""
+    soup = BeautifulSoup(html, "html.parser")
+    data = {
+        "Company Name": "",
+        "City": "",
+        "Country": "",
+        "Booth No": "",
+        "Company Website": "",
+        "Company LinkedIn": "",
+        "Company Contact": "",
+        "URL": url,
+    }
+
+    title = soup.select_one("h1.ex-exhibitor-detail__title-headline")
+    if title:
+        data["Company Name"] = title.get_text(strip=True)
+
+    addr_block = soup.select_one(".ex-contact-box__address-field-full-address")
+    if addr_block:
+        lines = [l.strip() for l in addr_block.get_text("\n").split("\n") if l.strip()]
+        if len(lines) >= 2:
+            data["City"] = lines[-2]
+            data["Country"] = lines[-1]
+
+    tel = soup.select_one(".ex-contact-box__address-field-tel-number")
+    if tel:
+        data["Company Contact"] = tel.get_text(strip=True)
+
+    hall = soup.select_one(".ex-contact-box__container-location-hall")
+    booth = soup.select_one(".ex-contact-box__container-location-stand")
+    if hall and booth:
+        data["Booth No"] = f"{hall.get_text(strip=True)} - {booth.get_text(strip=True)}"
+
+    website = soup.select_one("a.ex-contact-box__website-link")
+    if website and website.get("href"):
+        data["Company Website"] = website["href"].strip()
+
+    for link in soup.select(".ex-contact-box__container-social a"):
+        href = link.get("href")
+        if href and "linkedin.com" in href:
+            data["Company LinkedIn"] = href
+            break
+
+    return data
+
+
+def merge_detail(record, detail):
+    """Fill the blanks of an API record with values parsed from its detail page"""
+    for key, value in detail.items():
+        if value and not record.get(key):
+            record[key] = value
+    return record
+
+
+# ---------------- RECORDED FIXTURES ----------------
+def _fixture_key(url, params=None):
+    prepared = requests.Request("GET", url, params=params).prepare().url
+    return prepared, hashlib.sha1(prepared.encode("utf-8")).hexdigest()[:16]
+
+
+class RecordingSession(requests.Session):
+    """requests.Session that saves every GET response into a fixtures directory"""
+
+    def __init__(self, fixtures_dir):
+        super().__init__()
+        self.fixtures_dir = fixtures_dir
+        os.makedirs(fixtures_dir, exist_ok=True)
+        self.manifest_path = os.path.join(fixtures_dir, "manifest.json")
+        self.manifest = {}
+        self._lock = threading.Lock()  # detail pages are fetched from several threads
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, encoding="utf-8") as f:
+                self.manifest = json.load(f)
+
+    def get(self, url, params=None, **kwargs):
+        response = super().get(url, params=params, **kwargs)
+        prepared, key = _fixture_key(url, params)
+        with self._lock:
+            with open(os.path.join(self.fixtures_dir, key), "wb") as f:
+                f.write(response.content)
+            self.manifest[prepared] = {"file": key, "status": response.status_code}
+            with open(self.manifest_path, "w", encoding="utf-8") as f:
+                json.dump(self.manifest, f, indent=2)
+        return response
+
+
+class ReplayResponse:
+    """Minimal stand-in for requests.Response backed by a recorded fixture"""
+
+    def __init__(self, url, status_code, content):
+        self.url = url
+        self.status_code = status_code
+        self.content = content
+        self.text = content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} for replayed {self.url}")
+
+
+class ReplaySession:
+    """Serve GET requests from a fixtures directory written by RecordingSession"""
+
+    def __init__(self, fixtures_dir):
+        self.fixtures_dir = fixtures_dir
+        self.headers = {}
+        with open(os.path.join(fixtures_dir, "manifest.json"), encoding="utf-8") as f:
+            self.manifest = json.load(f)
+
+    def get(self, url, params=None, **kwargs):
+        prepared, _ = _fixture_key(url, params)
+        entry = self.manifest.get(prepared)
+        if entry is None:
+            return ReplayResponse(prepared, 404, b"")
+        with open(os.path.join(self.fixtures_dir, entry["file"]), "rb") as f:
+            return ReplayResponse(prepared, entry.get("status", 200), f.read())
+
+
+# ---------------- CLIENT ----------------
+class MesseFrankfurtClient:
+    """Browserless client for the Messe Frankfurt exhibitor-search backend"""
+
+    def __init__(self, search_page_url, api_key=None, event_variable=None, language="en-GB",
+                 page_size=90, detail_workers=8, session=None, api_url=SEARCH_API_URL, cache=None):
+        parts = urlsplit(search_page_url)
+        self.search_page_url = urlunsplit((parts.scheme, parts.netloc, parts.path, "", ""))
+        self.api_key = api_key
+        self.event_variable = event_variable
+        self.language = language
+        self.page_size = page_size
+        self.detail_workers = detail_workers
+        self.cache = cache  # optional http_cache.HttpCache for detail pages
+        self.api_url = api_url
+        self.session = session or requests.Session()
+        self.session.headers.update(HEADERS)
+
+    def discover(self):
+        """Fill in the API key / event variable from the search page when not given explicitly"""
+        if self.api_key and self.event_variable:
+            return
+        response = get(self.search_page_url, session=self.session)
+        response.raise_for_status()
+        config = discover_search_config(response.text)
+        self.api_key = self.api_key or config.get("api_key")
+        self.event_variable = self.event_variable or config.get("event_variable")
+        if not self.event_variable:
+            raise ValueError(f"Could not find the event variable on {self.search_page_url}; pass it explicitly")
+
+    def detail_url(self, exhibitor):
+        """Build the exhibitor-search.detail.html URL the list page links to"""
+        rewrite_id = exhibitor.get("rewriteId") or exhibitor.get("id")
+        if not rewrite_id:
+            return ""
+        base = self.search_page_url[:-len(".html")] if self.search_page_url.endswith(".html") else self.search_page_url
+        return f"{base}.detail.html/{rewrite_id}.html"
+
+    def search_page(self, page_number):
+        """Fetch one page of search hits as decoded JSON"""
+        params = {
+            "language": self.language,
+            "q": "",
+            "orderBy": "name",
+            "pageNumber": page_number,
+            "pageSize": self.page_size,
+            "showJumpLabels": "false",
+            "findEventVariable": self.event_variable,
+        }
+        headers = {"apikey": self.api_key} if self.api_key else {}
+        response = get(self.api_url, session=self.session, params=params, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    def iter_hits(self, max_pages=None):
+        """Yield every search hit, page by page, until the reported total is reached"""
+        page_number = 1
+        seen = 0
+        while max_pages is None or page_number <= max_pages:
+            payload = self.search_page(page_number)
+            result = payload.get("result", payload)
+            hits = result.get("hits") or []
+            if not hits:
+                break
+            yield from hits
+            seen += len(hits)
+            total = _get(result, "metaData.hitsTotal", 0)
+            logger.info(f"Page {page_number}: {len(hits)} exhibitors ({seen}/{total or '?'})")
+            if total and seen >= total:
+                break
+            page_number += 1
+
+    def fetch_detail(self, url):
+        """Fetch and parse one detail page; returns {} on failure"""
+        try:
+            if self.cache:
+                response = self.cache.fetch(url, session=self.session)
+            else:
+                response = get(url, session=self.session)
+                response.raise_for_status()
+            return parse_detail_html(response.text, url)
+        except Exception as e:
+            logger.warning(f"Could not fetch detail page {url}: {e}")
+            return {}
+
+    def scrape(self, max_pages=None, with_details=True):
+        """Return one record per exhibitor with the same columns scrape_detail_page fills"""
+        self.discover()
+        records = []
+        for hit in self.iter_hits(max_pages):
+            exhibitor = hit.get("exhibitor", hit)
+            records.append(record_from_hit(hit, self.detail_url(exhibitor)))
+
+        if with_details:
+            # Detail pages only fill what the search API left blank
+            todo = [r for r in records if r["URL"] and not all(r[c] for c in COLUMNS[1:-1])]
+            with ThreadPoolExecutor(max_workers=self.detail_workers) as pool:
+                for record, detail in zip(todo, pool.map(self.fetch_detail, [r["URL"] for r in todo])):
+                    merge_detail(record, detail)
+            if self.cache:
+                self.cache.report()
+
+        for order, record in enumerate(records, start=1):
+            record["Order"] = order
+        return records
+
+
+def save_records(records, save_file, show=None, flags=()):
+    """Write records to xlsx/csv in the usual column order, plus the shared outputs named in flags under show"""
+    with with_shared(open_sink(save_file, COLUMNS), show, flags if show else ()) as sink:
+        sink.write_many(records)
+    print(f"💾 Saved {sink.count} exhibitors to {save_file}")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    parser = argparse.ArgumentParser(description="Scrape a Messe Frankfurt exhibitor search without a browser")
+    parser.add_argument("search_url", help="exhibitor-search.html URL of the show")
+    parser.add_argument("-o", "--output", default="messe_frankfurt_exhibitors.xlsx")
+    parser.add_argument("--event-variable", help="findEventVariable of the show (read from the page if omitted)")
+    parser.add_argument("--api-key", help="apikey header (read from the page if omitted)")
+    parser.add_argument("--max-pages", type=int)
+    parser.add_argument("--no-details", action="store_true", help="skip detail pages, API fields only")
+    parser.add_argument("--record", metavar="DIR", help="save every HTTP response as a fixture in DIR")
+    parser.add_argument("--replay", metavar="DIR", help="run offline from fixtures recorded in DIR")
+    parser.add_argument("--no-cache", action="store_true", help="always download detail pages")
+    parser.add_argument("--show", help="show name in the shared Parquet dataset / SQLite store")
+    parser.add_argument("--parquet", action="store_true", help="also write to the shared Parquet dataset (needs --show)")
+    parser.add_argument("--store", action="store_true", help="also upsert into the SQLite exhibitor store (needs --show)")
+    args = parser.parse_args()
+
+    session = None
+    if args.replay:
+        session = ReplaySession(args.replay)
+    elif args.record:
+        session = RecordingSession(args.record)
+
+    cache = None if args.no_cache or args.replay or args.record else HttpCache()
+    client = MesseFrankfurtClient(args.search_url, api_key=args.api_key,
+                                  event_variable=args.event_variable, session=session, cache=cache)
+    save_records(client.scrape(args.max_pages, with_details=not args.no_details), args.output,
+                 show=args.show, flags=[f"--{f}" for f in ("parquet", "store") if getattr(args, f)])
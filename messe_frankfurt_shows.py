@@ -0,0 +1,230 @@
+import logging
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+
+from browser_pool import BrowserPool
+from driver_factory import make_driver
+from http_cache import HttpCache
+from http_client import make_session
+from incremental import IncrementalRun, changes_path, make_key, save_changeset
+from journal import Journal, journal_path
+from messe_frankfurt import COLUMNS, MesseFrankfurtClient, parse_detail_html, save_records
+from sinks import XlsxSink, with_shared
+from tab_pool import TabPool
+from waits import STATS, count_stable, element_present, wait_for
+
+# ---------------- CONFIG ----------------
+# One line per show: exhibitor-search page, output file, and (browser mode) page count if known
+SHOWS = {
+    "intersec-dubai": {
+        "url": "https://intersec.ae.messefrankfurt.com/dubai/en/exhibitor-search/exhibitor-search.html",
+        "save_file": "Intersec_Dubai.xlsx", "pages": 7,
+    },
+    "intersec-ksa": {
+        "url": "https://intersec-ksa.ae.messefrankfurt.com/ksa/en/exhibitor-search.html",
+        "save_file": "Intersec_KSA_2025.xlsx", "pages": 7,
+    },
+    "light-middle-east": {
+        "url": "https://light-middle-east.ae.messefrankfurt.com/dubai/en/exhibitor-search.html",
+        "save_file": "lightinteligent.xlsx", "pages": 2,
+    },
+    "automechanika-dubai": {
+        "url": "https://automechanika-dubai.ae.messefrankfurt.com/dubai/en/exhibitor-search/exhibitor-list.html",
+        "save_file": "automec_dxb.xlsx",
+    },
+    "automechanika-riyadh": {
+        "url": "https://automechanika-riyadh.ae.messefrankfurt.com/riyadh/en/exhibitor-list.html",
+        "save_file": "automec_riyadh.xlsx",
+    },
+    "beautyworld-middle-east": {
+        "url": "https://beautyworld-middle-east.ae.messefrankfurt.com/dubai/en/exhibitor-search.html",
+        "save_file": "beautyworldbxb.xlsx",
+    },
+    "beautyworld-saudi-arabia": {
+        "url": "https://beautyworld-saudi-arabia.ae.messefrankfurt.com/ksa/en/exhibitor-search.html",
+        "save_file": "beautyworldksa.xlsx",
+    },
+    "paperworld-middle-east": {
+        "url": "https://paperworld-middle-east.ae.messefrankfurt.com/dubai/en/exhibitor-search.html",
+        "save_file": "papperworldmiddile.xlsx",
+    },
+}
+
+MAX_SHOWS = 4  # shows scraped at once over HTTP; the rate limiter still caps each host
+BROWSERS = 3  # Chrome instances shared by every show in browser mode
+TAB_POOL_SIZE = 8  # exhibitor tabs kept loading at once per browser
+CARD_SEL = "div.col-xxs-6.col-md-4.col-sm-6.grid-item a"
+HEADLINE_SEL = "h1.ex-exhibitor-detail__title-headline"
+
+
+# ---------------- HTTP MODE ----------------
+def scrape_show_http(slug, session, cache, flags):
+    """Scrape one show through the exhibitor-search backend and save it; returns the record count"""
+    config = SHOWS[slug]
+    client = MesseFrankfurtClient(config["url"], session=session, cache=cache)
+    records = client.scrape(with_details="--no-details" not in flags)
+    save_records(records, config["save_file"], show=slug, flags=flags)
+    return len(records)
+
+
+def run_http(slugs, flags=()):
+    """All shows at once on one pooled session and detail-page cache"""
+    session = make_session(pool_size=32)
+    cache = None if "--no-cache" in flags else HttpCache()
+    with ThreadPoolExecutor(max_workers=MAX_SHOWS) as pool:
+        futures = {slug: pool.submit(scrape_show_http, slug, session, cache, flags) for slug in slugs}
+    ok = True
+    for slug, future in futures.items():
+        try:
+            print(f"✅ {slug}: {future.result()} exhibitors")
+        except Exception as e:
+            print(f"❌ {slug}: {e}")
+            ok = False
+    return ok
+
+
+# ---------------- BROWSER MODE ----------------
+class BrowserShow:
+    """Output, journal and incremental state of one show during a browser run"""
+
+    def __init__(self, slug, flags):
+        config = SHOWS[slug]
+        self.slug = slug
+        self.url = config["url"]
+        self.save_file = config["save_file"]
+        self.pages = config.get("pages")
+        # `--incremental` only opens exhibitors whose listing URL is not in the last save file yet
+        self.incremental = IncrementalRun(self.save_file, make_key(url_field="URL")) if "--incremental" in flags else None
+        # `--resume` skips the pages the journal already has
+        self.journal = Journal(journal_path(self.save_file), resume="--resume" in flags)
+        self.results = list(self.journal.records)
+        self.sink = with_shared(XlsxSink(self.save_file, COLUMNS), slug, flags)
+        self.sink.write_many(self.results)
+        self.failed_pages = []
+        self.finished = False
+
+    def page_url(self, page):
+        return f"{self.url}?page={page}&pagesize=90"
+
+    def add_page(self, page, page_results):
+        for data in page_results:
+            data["Order"] = len(self.results) + 1
+            self.results.append(data)
+            self.journal.record(data, key=data["URL"], page=page)
+            self.sink.write(data)
+        self.journal.page_done(page)
+        print(f"➡️ {self.slug}: page {page} done, {len(self.results)} exhibitors")
+
+    def close(self):
+        self.sink.close()
+        if self.results:
+            print(f"💾 {self.slug}: {len(self.results)} exhibitors saved to {self.save_file}")
+            # A partial run would report every unvisited exhibitor as removed
+            if self.incremental and self.finished:
+                save_changeset(self.incremental.changeset(self.results), changes_path(self.save_file))
+        self.journal.close()
+
+
+def scrape_detail_page(driver):
+    """Wait out the redirect loader, then parse the rendered detail page"""
+    wait_for(driver, lambda d: "redirect" not in d.current_url.lower(), timeout=25, label="detail redirect")
+    element_present(driver, HEADLINE_SEL, timeout=25, label="detail headline")
+    return parse_detail_html(driver.page_source, driver.current_url)
+
+
+def count_pages(driver, show):
+    """Highest page number in the list page's pager (1 when there is none)"""
+    driver.get(show.page_url(1))
+    if not count_stable(driver, CARD_SEL, timeout=25, label="list cards"):
+        raise TimeoutException(f"{show.slug}: no exhibitor cards rendered")
+    numbers = [b.text.strip() for b in driver.find_elements(By.CSS_SELECTOR, "div.m-paging button")]
+    return max([int(n) for n in numbers if n.isdigit()], default=1)
+
+
+def scrape_page(driver, item):
+    """Scrape all exhibitors of one (show, page) through a window of tabs"""
+    show, page = item
+    driver.get(show.page_url(page))
+    # No cards is a failed page: journaling it would skip it on --resume and drop its exhibitors
+    if not count_stable(driver, CARD_SEL, timeout=25, label="list cards"):
+        raise TimeoutException(f"{show.slug} page {page}: no exhibitor cards rendered")
+    links = [c.get_attribute("href") for c in driver.find_elements(By.CSS_SELECTOR, CARD_SEL)]
+    links = [link for link in links if link]
+    print(f"📄 {show.slug} page {page}: {len(links)} exhibitors")
+
+    # The listing link is the stable key, so it is what gets saved as URL
+    reused = {link: show.incremental.reuse({"URL": link}) for link in links} if show.incremental else {}
+    todo = [link for link in links if not reused.get(link)]
+    pool = TabPool(driver, size=TAB_POOL_SIZE, ready_selector=HEADLINE_SEL)
+    scraped = dict(zip(todo, pool.run(todo, scrape_detail_page)))
+    page_results = []
+    for link in links:
+        data = reused.get(link) or scraped.get(link)
+        if data is not None:
+            page_results.append(dict(data, URL=link))
+    return page_results
+
+
+def run_browser(slugs, flags=()):
+    """Every show's pages on one shared pool of browsers: one warm-up for the whole family"""
+    shows = [BrowserShow(slug, flags) for slug in slugs]
+    browser_pool = BrowserPool(make_driver, size=BROWSERS)
+    ok = True
+    try:
+        unknown = [show for show in shows if not show.pages]
+        for show, pages in zip(unknown, browser_pool.map(count_pages, unknown)):
+            if pages is None:
+                print(f"⚠️ {show.slug}: page count failed")
+                show.failed_pages.append(1)
+                ok = False
+            show.pages = pages or 0
+        items = [(show, page) for show in shows for page in range(1, show.pages + 1)
+                 if page not in show.journal.done_pages]
+        # Results come back in (show, page) order while the pool works ahead on later items
+        for (show, page), page_results in zip(items, browser_pool.imap(scrape_page, items)):
+            if page_results is None:
+                print(f"⚠️ {show.slug}: page {page} failed")
+                show.failed_pages.append(page)
+                ok = False
+                continue
+            show.add_page(page, page_results)
+        # A show with failed pages stays unfinished: no changeset, and --resume retries just those pages
+        for show in shows:
+            show.finished = not show.failed_pages
+    except KeyboardInterrupt:
+        print("\n🛑 Interrupted by user — saving progress.")
+        ok = False
+    except Exception as e:
+        print(f"\n❌ Unexpected error: {e}")
+        traceback.print_exc()
+        ok = False
+    finally:
+        for show in shows:
+            show.close()
+        browser_pool.close()
+        STATS.report()
+    return ok
+
+
+def run_shows(slugs, flags=()):
+    """Scrape the given shows concurrently: Chrome by default, the search API with --http; True if all succeeded"""
+    unknown = [slug for slug in slugs if slug not in SHOWS]
+    if unknown:
+        raise ValueError(f"Unknown show(s) {', '.join(unknown)}; known: {', '.join(SHOWS)}")
+    http = "--http" in flags
+    if http and ("--resume" in flags or "--incremental" in flags):
+        # Journals and incremental reuse are page-by-page browser features; the HTTP client has neither
+        print("ℹ️ --resume / --incremental run in the browser; ignoring --http")
+        http = False
+    return (run_http if http else run_browser)(slugs, flags)
+
+
+if __name__ == "__main__":
+    # `python messe_frankfurt_shows.py [show ...] [--http] [--resume] [--incremental] [--parquet] [--store]`
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    slugs = [arg for arg in sys.argv[1:] if not arg.startswith("--")] or list(SHOWS)
+    sys.exit(0 if run_shows(slugs, sys.argv) else 1)
@@ -0,0 +1,166 @@
+import base64
+import json
+import logging
+import re
+
+from selenium.common.exceptions import WebDriverException
+
+logger = logging.getLogger(__name__)
+
+NAME_KEYS = ("name", "companyName", "company_name", "exhibitorName", "organisationName", "title")
+BOOTH_KEYS = ("booth", "booths", "boothNumber", "booth_number", "stand", "stands", "standNumber", "standName")
+HALL_KEYS = ("hall", "halls", "hallName")
+COUNTRY_KEYS = ("country", "countryName", "country_name", "countryCode")
+WEBSITE_KEYS = ("websiteUrl", "website", "websiteURL", "web", "url", "homepage")
+DESCRIPTION_KEYS = ("description", "about", "shortDescription", "profile")
+EMAIL_KEYS = ("email", "emailAddress", "contactEmail")
+PHONE_KEYS = ("phone", "phoneNumber", "telephone", "tel")
+NESTED_KEYS = ("address", "withEvent", "contact", "contactInfo", "company")
+
+
+def enable_performance_log(options):
+    """Ask chromedriver to record DevTools network events for the session built from these options"""
+    options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options
+
+
+class NetworkCapture:
+    """Collect the JSON bodies of XHR/fetch responses a page loads, from Chrome's performance log"""
+
+    def __init__(self, driver, url_filter=None):
+        self.driver = driver
+        self.url_filter = re.compile(url_filter) if url_filter else None
+        self.responses = []
+        self._pending = {}
+
+    def start(self):
+        """Enable the Network domain with buffers big enough to keep directory-sized bodies"""
+        self.driver.execute_cdp_cmd("Network.enable", {
+            "maxTotalBufferSize": 200_000_000,
+            "maxResourceBufferSize": 50_000_000,
+        })
+        return self
+
+    def _wanted(self, response):
+        url = response.get("url", "")
+        if self.url_filter and not self.url_filter.search(url):
+            return False
+        mime = response.get("mimeType", "")
+        return "json" in mime or "graphql" in url.lower()
+
+    def _body(self, request_id):
+        try:
+            result = self.driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request_id})
+        except WebDriverException as e:
+            logger.debug(f"No body for request {request_id}: {e}")
+            return None
+        body = result.get("body", "")
+        if result.get("base64Encoded"):
+            body = base64.b64decode(body).decode("utf-8", errors="replace")
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def drain(self):
+        """Read new performance-log entries and fetch the bodies of finished JSON responses"""
+        for entry in self.driver.get_log("performance"):
+            message = json.loads(entry["message"]).get("message", {})
+            method, params = message.get("method"), message.get("params", {})
+            if method == "Network.responseReceived" and self._wanted(params.get("response", {})):
+                self._pending[params["requestId"]] = params["response"]["url"]
+            elif method == "Network.loadingFinished" and params.get("requestId") in self._pending:
+                url = self._pending.pop(params["requestId"])
+                payload = self._body(params["requestId"])
+                if payload is not None:
+                    self.responses.append((url, payload))
+        logger.info(f"Captured {len(self.responses)} JSON responses")
+        return self.responses
+
+
+# ---------------- JSON → EXHIBITOR RECORDS ----------------
+def _text(value):
+    """Flatten a JSON value (string, {name/label}, list of those) into display text"""
+    if value is None or isinstance(value, bool):
+        return ""
+    if isinstance(value, (str, int, float)):
+        return str(value).strip()
+    if isinstance(value, dict):
+        for key in ("name", "label", "value", "text", "title"):
+            if key in value:
+                return _text(value[key])
+        return ""
+    if isinstance(value, list):
+        return "; ".join(t for t in (_text(v) for v in value) if t)
+    return ""
+
+
+def _lookup(obj, keys):
+    """First non-empty value for any of keys in obj or its usual nested containers"""
+    containers = [obj] + [obj[k] for k in NESTED_KEYS if isinstance(obj.get(k), dict)]
+    for container in containers:
+        for key in keys:
+            text = _text(container.get(key))
+            if text:
+                return text
+    return ""
+
+
+def _find_url(data, needle):
+    if isinstance(data, str):
+        return data if needle in data.lower() else ""
+    values = data.values() if isinstance(data, dict) else data if isinstance(data, list) else []
+    for value in values:
+        found = _find_url(value, needle)
+        if found:
+            return found
+    return ""
+
+
+def _looks_like_exhibitor(obj):
+    if not any(isinstance(obj.get(k), str) and obj[k].strip() for k in NAME_KEYS):
+        return False
+    return bool(_lookup(obj, BOOTH_KEYS + HALL_KEYS + COUNTRY_KEYS))
+
+
+def iter_exhibitor_objects(payload):
+    """Walk a JSON payload and yield every object that looks like an exhibitor"""
+    if isinstance(payload, dict):
+        if _looks_like_exhibitor(payload):
+            yield payload
+            return
+        for value in payload.values():
+            yield from iter_exhibitor_objects(value)
+    elif isinstance(payload, list):
+        for value in payload:
+            yield from iter_exhibitor_objects(value)
+
+
+def exhibitor_record(obj):
+    """Normalise one exhibitor object from a widget API into flat columns"""
+    website = _lookup(obj, WEBSITE_KEYS)
+    return {
+        "Company Name": _lookup(obj, NAME_KEYS),
+        "Booth No": _lookup(obj, BOOTH_KEYS),
+        "Hall": _lookup(obj, HALL_KEYS),
+        "Country": _lookup(obj, COUNTRY_KEYS),
+        "Website": website if website.startswith("http") else "",
+        "LinkedIn": _find_url(obj, "linkedin.com"),
+        "Email": _lookup(obj, EMAIL_KEYS),
+        "Phone": _lookup(obj, PHONE_KEYS),
+        "Description": _lookup(obj, DESCRIPTION_KEYS),
+    }
+
+
+def records_from_responses(responses):
+    """Build de-duplicated exhibitor records from captured (url, payload) pairs"""
+    records = {}
+    for _, payload in responses:
+        for obj in iter_exhibitor_objects(payload):
+            record = exhibitor_record(obj)
+            key = str(obj.get("id") or (record["Company Name"].lower(), record["Booth No"]))
+            merged = records.setdefault(key, record)
+            for column, value in record.items():
+                if value and not merged[column]:
+                    merged[column] = value
+    return list(records.values())
@@ -1,20 +1,18 @@
-import requests
+import sys
 from bs4 import BeautifulSoup
-import pandas as pd
-import time
+from http_client import fetch_pages
+from sinks import XlsxSink, with_shared
 
 base_url = "https://www.prime-expo.com/exhibitors-2025?page={}"
-headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-}
 
-all_data = []
+RATE = 5  # requests per second across all page fetches
+COLUMNS = ["Exhibitor Name", "Hall", "Stand", "Country", "Logo URL", "Find the Stand Link"]
+SHOW = "prime-expo"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
 
-for page in range(1, 7):  # pages 1–6
-    print(f"Scraping page {page}...")
-    url = base_url.format(page)
-    res = requests.get(url, headers=headers)
-    soup = BeautifulSoup(res.text, "html.parser")
+
+def parse_page(html):
+    soup = BeautifulSoup(html, "html.parser")
+    rows = []
 
     items = soup.select("li.m-exhibitors-list__items__item")
 
@@ -26,7 +24,7 @@ for page in range(1, 7):  # pages 1–6
         logo = item.select_one("div.m-exhibitors-list__items__item__logo img")
         stand_link = item.select_one("div.m-exhibitors-list__items__item__stand__location a")
 
-        all_data.append({
+        rows.append({
             "Exhibitor Name": name.get_text(strip=True) if name else "",
             "Hall": hall.get_text(strip=True) if hall else "",
             "Stand": stand.get_text(strip=True) if stand else "",
@@ -35,10 +33,17 @@ for page in range(1, 7):  # pages 1–6
             "Find the Stand Link": stand_link["href"] if stand_link else ""
         })
 
-    time.sleep(1)  # polite delay between pages
+    return rows
+
 
-# Save to Excel
-df = pd.DataFrame(all_data)
-df.to_excel("prime_expo_exhibitors_2025.xlsx", index=False)
+if __name__ == "__main__":
+    pages = range(1, 7)  # pages 1–6
+    print(f"Scraping {len(pages)} pages in parallel...")
+    with with_shared(XlsxSink("prime_expo_exhibitors_2025.xlsx", COLUMNS), SHOW, sys.argv) as sink:
+        for page, rows in zip(pages, fetch_pages(base_url, pages, parse_page, rate=RATE)):
+            if rows is None:
+                print(f"Page {page} failed")
+                continue
+            sink.write_many(rows)
 
-print("✅ Done! Data saved to prime_expo_exhibitors_2025.xlsx")
+    print("✅ Done! Data saved to prime_expo_exhibitors_2025.xlsx")
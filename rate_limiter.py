@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RATE = 5.0   # requests per second per host
+DEFAULT_BURST = 10   # requests allowed back-to-back after an idle spell
+
+# Per-host budgets as (rate, burst); anything not listed gets the defaults.
+# e.g. "www.bigfive.com": (2.0, 4)
+HOST_LIMITS = {}
+
+# Point this at a file to share buckets between processes (parallel script runs)
+STATE_ENV = "SCRAPER_RATE_DB"
+
+
+def host_of(url):
+    """Bucket key for a URL (or a bare host name)"""
+    return (urlsplit(url).netloc if "://" in url else url).lower()
+
+
+class TokenBucket:
+    """Thread-safe token bucket; each call reserves a token and says how long to wait for it"""
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """Take tokens now (possibly going into debt) and return the seconds to sleep before using them"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return max(0.0, -self.tokens / self.rate)
+
+    def acquire(self, tokens=1):
+        delay = self.reserve(tokens)
+        if delay:
+            time.sleep(delay)
+
+    async def acquire_async(self, tokens=1):
+        delay = self.reserve(tokens)
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose state lives in SQLite, so every process pointed at the same file shares it"""
+
+    def __init__(self, path, key, rate, burst):
+        super().__init__(rate, burst)
+        self.path = path
+        self.key = key
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def reserve(self, tokens=1):
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (self.key,)).fetchone()
+            now = time.time()
+            available = self.burst if row is None else min(self.burst, row[0] + (now - row[1]) * self.rate)
+            available -= tokens
+            conn.execute("INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                         (self.key, available, now))
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        return max(0.0, -available / self.rate)
+
+
+class HostLimiter:
+    """One token bucket per host, created on first use from HOST_LIMITS or the defaults"""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, limits=None, state_path=None):
+        self.rate = rate
+        self.burst = burst
+        self.limits = dict(HOST_LIMITS if limits is None else limits)
+        self.state_path = state_path
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def configure(self, host, rate, burst=None):
+        """Set a host's budget; takes effect for the next request to that host"""
+        host = host_of(host)
+        with self._lock:
+            self.limits[host] = (rate, burst or max(1, int(rate)))
+            self._buckets.pop(host, None)
+
+    def bucket(self, url):
+        host = host_of(url)
+        with self._lock:
+            if host not in self._buckets:
+                rate, burst = self.limits.get(host, (self.rate, self.burst))
+                if self.state_path:
+                    self._buckets[host] = SharedTokenBucket(self.state_path, host, rate, burst)
+                else:
+                    self._buckets[host] = TokenBucket(rate, burst)
+                logger.debug(f"Rate limit for {host}: {rate}/s, burst {burst}")
+            return self._buckets[host]
+
+    def acquire(self, url):
+        """Block until a request to url's host is within budget"""
+        self.bucket(url).acquire()
+
+    async def acquire_async(self, url):
+        await self.bucket(url).acquire_async()
+
+
+_default_limiter = None
+_default_lock = threading.Lock()
+
+
+def get_limiter():
+    """Process-wide limiter every fetch path goes through"""
+    global _default_limiter
+    with _default_lock:
+        if _default_limiter is None:
+            _default_limiter = HostLimiter(state_path=os.environ.get(STATE_ENV))
+        return _default_limiter
@@ -0,0 +1,244 @@
+import argparse
+import fnmatch
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from collections import Counter
+
+from incremental import load_records
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Shared modules and tools; every other top-level .py is a scraper
+LIBRARY_MODULES = {
+    "batch_extract", "browser_pool", "browser_service", "detail_fetcher", "driver_factory",
+    "entity_resolution", "exhibitor_schema", "exhibitor_store", "expoplatform", "http_cache", "http_client",
+    "incremental", "inpage_fetch", "journal", "messe_frankfurt", "messe_frankfurt_shows", "network_capture",
+    "rate_limiter", "run_all", "sinks", "tab_pool", "waits",
+}
+
+DEFAULT_TIMEOUT = 2 * 3600
+TIMEOUTS = {}  # per-script overrides in seconds, e.g. {"gulffood": 4 * 3600}
+MAX_JOBS = 6
+PER_SITE = 2  # scrapers hitting the same registrable domain at once
+
+# Shared state the children should agree on instead of each creating its own in its run directory
+SHARED_ENV = {
+    "SCRAPER_STORE": "exhibitors.sqlite",
+    "SCRAPER_PARQUET_ROOT": "exhibitors_parquet",
+    "SCRAPER_HTTP_CACHE": "http_cache.sqlite",
+    "SCRAPER_RATE_DB": "rate_limits.sqlite",
+}
+
+URL_RE = re.compile(r"https?://([\w.-]+)")
+# Thin wrappers (`from <engine> import run_shows` + `SHOW = "<slug>"`) around a multi-show engine
+ENGINE_RE = re.compile(r"^from (\w+) import run_shows$", re.M)
+SHOW_RE = re.compile(r'^SHOW = "([^"]+)"', re.M)
+
+
+def discover():
+    """Scraper script names (without .py), alphabetical"""
+    return sorted(name[:-3] for name in os.listdir(HERE)
+                  if name.endswith(".py") and name[:-3] not in LIBRARY_MODULES)
+
+
+def read_source(script):
+    with open(os.path.join(HERE, f"{script}.py"), encoding="utf-8", errors="ignore") as f:
+        return f.read()
+
+
+def engine_of(script):
+    """(engine, show slug) when the script only runs one show of a multi-show engine, else None"""
+    source = read_source(script)
+    engine, show = ENGINE_RE.search(source), SHOW_RE.search(source)
+    return (engine.group(1), show.group(1)) if engine and show else None
+
+
+def plan(scripts):
+    """
+    (script, args) per job: wrappers of the same engine fold into one run of the engine with all
+    their shows, so it warms up once and counts once against its site's cap.
+    """
+    jobs, shows = [], {}
+    for script in scripts:
+        wrapped = engine_of(script)
+        if wrapped is None:
+            jobs.append((script, ()))
+        else:
+            if wrapped[0] not in shows:
+                shows[wrapped[0]] = []
+                jobs.append((wrapped[0], shows[wrapped[0]]))
+            shows[wrapped[0]].append(wrapped[1])
+    return [(script, tuple(args)) for script, args in jobs]
+
+
+def site_of(script):
+    """Registrable domain of the first URL in the script: intersec.ae.messefrankfurt.com → messefrankfurt.com"""
+    match = URL_RE.search(read_source(script))
+    if not match:
+        return script
+    labels = match.group(1).lower().split(".")
+    if len(labels) > 2 and len(labels[-1]) == 2 and labels[-2] in ("com", "co", "org", "net", "gov", "edu"):
+        return ".".join(labels[-3:])
+    return ".".join(labels[-2:])
+
+
+def count_records(directory, since, per_show=False):
+    """
+    Rows in the biggest xlsx/csv/json the job wrote; changesets and journals don't count.
+    per_show sums the biggest output of each file stem instead, for engines writing one file set per show.
+    """
+    best, outputs = Counter(), []
+    for name in os.listdir(directory):
+        path = os.path.join(directory, name)
+        if (not name.endswith((".xlsx", ".csv", ".json")) or "_changes" in name
+                or os.path.getmtime(path) < since):
+            continue
+        outputs.append(name)
+        stem = os.path.splitext(name)[0] if per_show else ""
+        try:
+            best[stem] = max(best[stem], len(load_records(path)))
+        except Exception:
+            pass
+    return sum(best.values()), outputs
+
+
+class Job:
+    def __init__(self, script, workdir, flags, timeout, shows=()):
+        self.script = script
+        self.shows = list(shows)  # engine jobs: the show slugs of the wrappers folded into this run
+        self.site = site_of(script)
+        self.directory = os.path.join(workdir, script)
+        self.flags = flags
+        self.timeout = timeout
+        self.process = None
+        self.status = "pending"
+
+    def start(self, env):
+        os.makedirs(self.directory, exist_ok=True)
+        self.log = open(os.path.join(self.directory, "run.log"), "w", encoding="utf-8")
+        self.started = time.time()
+        # Own process group so a timeout also takes down the job's Chrome/chromedriver children
+        self.process = subprocess.Popen(
+            [sys.executable, os.path.join(HERE, f"{self.script}.py"), *self.shows, *self.flags],
+            cwd=self.directory, env=env, stdin=subprocess.DEVNULL, stdout=self.log, stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+        self.status = "running"
+        shows = f" [{', '.join(self.shows)}]" if self.shows else ""
+        print(f"▶️ {self.script}{shows} ({self.site})")
+
+    def kill(self):
+        if hasattr(os, "killpg"):
+            for sig in (signal.SIGTERM, signal.SIGKILL):
+                try:
+                    os.killpg(self.process.pid, sig)
+                except ProcessLookupError:
+                    return
+                try:
+                    self.process.wait(10)
+                    return
+                except subprocess.TimeoutExpired:
+                    continue
+        else:
+            self.process.kill()
+
+    def poll(self):
+        """True once the job has finished or been killed"""
+        if self.process.poll() is None:
+            if time.time() - self.started < self.timeout:
+                return False
+            self.kill()
+            self.status = "timeout"
+        else:
+            self.status = "ok" if self.process.returncode == 0 else "failed"
+        self.log.close()
+        self.duration = time.time() - self.started
+        self.records, self.outputs = count_records(self.directory, self.started, per_show=bool(self.shows))
+        icon = {"ok": "✅", "failed": "❌", "timeout": "⏱️"}[self.status]
+        print(f"{icon} {self.script}: {self.status} in {self.duration:.0f}s, {self.records} records")
+        return True
+
+    def summary(self):
+        return {
+            "script": self.script, "shows": self.shows, "site": self.site, "status": self.status,
+            "exit_code": self.process.returncode if self.process else None,
+            "duration": round(getattr(self, "duration", 0), 1), "records": getattr(self, "records", 0),
+            "outputs": getattr(self, "outputs", []), "log": os.path.join(self.directory, "run.log"),
+        }
+
+
+def run(jobs, max_jobs=MAX_JOBS, per_site=PER_SITE, env=None):
+    """Run jobs as child processes, at most max_jobs at once and per_site per domain"""
+    pending, running, done = list(jobs), [], []
+    while pending or running:
+        busy = Counter(job.site for job in running)
+        for job in list(pending):
+            if len(running) >= max_jobs:
+                break
+            if busy[job.site] < per_site:
+                job.start(env)
+                busy[job.site] += 1
+                running.append(job)
+                pending.remove(job)
+        for job in list(running):
+            if job.poll():
+                running.remove(job)
+                done.append(job)
+        time.sleep(0.5)
+    return done
+
+
+def print_summary(jobs, wall):
+    print("\n" + "=" * 72)
+    print(f"{'Script':<28}{'Status':<10}{'Records':>9}{'Seconds':>10}  Outputs")
+    for job in sorted(jobs, key=lambda j: j.script):
+        s = job.summary()
+        print(f"{s['script']:<28}{s['status']:<10}{s['records']:>9}{s['duration']:>10.0f}  {', '.join(s['outputs'])}")
+    statuses = Counter(job.status for job in jobs)
+    serial = sum(job.duration for job in jobs)
+    print("=" * 72)
+    print(f"{len(jobs)} jobs: {statuses['ok']} ok, {statuses['failed']} failed, {statuses['timeout']} timed out; "
+          f"{sum(job.records for job in jobs)} records in {wall:.0f}s (serial would be {serial:.0f}s)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run every scraper concurrently and summarize the refresh",
+                                     epilog="Arguments after -- go to every scraper, e.g. -- --http --store")
+    parser.add_argument("scripts", nargs="*", help="script names or globs to run (default: all)")
+    parser.add_argument("--exclude", nargs="*", default=[], help="script names or globs to skip")
+    parser.add_argument("--jobs", type=int, default=MAX_JOBS, help="scrapers running at once")
+    parser.add_argument("--per-site", type=int, default=PER_SITE, help="scrapers per domain at once")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="seconds before a job is killed")
+    parser.add_argument("--workdir", default="scraper_runs", help="each script runs in <workdir>/<script>")
+    parser.add_argument("--list", action="store_true", help="print the planned jobs and exit")
+    argv = sys.argv[1:]
+    flags = argv[argv.index("--") + 1:] if "--" in argv else []
+    args = parser.parse_args(argv[:argv.index("--")] if "--" in argv else argv)
+
+    scripts = [s for s in discover()
+               if (not args.scripts or any(fnmatch.fnmatch(s, p) for p in args.scripts))
+               and not any(fnmatch.fnmatch(s, p) for p in args.exclude)]
+    planned = plan(scripts)
+    if args.list:
+        for script, shows in planned:
+            print(f"{script:<28}{site_of(script):<28}{' '.join(shows)}")
+        sys.exit(0)
+
+    workdir = os.path.abspath(args.workdir)
+    os.makedirs(workdir, exist_ok=True)
+    env = dict(os.environ, PYTHONIOENCODING="utf-8")
+    for name, filename in SHARED_ENV.items():
+        env.setdefault(name, os.path.join(workdir, filename))
+
+    started = time.time()
+    jobs = run([Job(s, workdir, flags, TIMEOUTS.get(s, args.timeout), shows) for s, shows in planned],
+               args.jobs, args.per_site, env)
+    print_summary(jobs, time.time() - started)
+    with open(os.path.join(workdir, "summary.json"), "w", encoding="utf-8") as f:
+        json.dump([job.summary() for job in jobs], f, indent=2)
+    sys.exit(0 if all(job.status == "ok" for job in jobs) else 1)
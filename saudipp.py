@@ -1,18 +1,15 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
 import time
+from driver_factory import make_driver
 
 # --- Website URL ---
 URL = "https://saudipp.com/exhibitor-list/"
 
 # --- Setup Chrome ---
-options = webdriver.ChromeOptions()
-options.add_argument("--start-maximized")
-options.add_argument("--disable-blink-features=AutomationControlled")
-driver = webdriver.Chrome(options=options)
+driver = make_driver()
 wait = WebDriverWait(driver, 15)
 
 driver.get(URL)
@@ -1,9 +1,8 @@
 # pip install selenium pandas openpyxl
 import time
 import pandas as pd
-from selenium import webdriver
+from driver_factory import make_driver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -96,12 +95,7 @@ def wait_for_page_change(driver, wait, prev_first_company):
         time.sleep(0.8)
 
 def main():
-    opts = Options()
-    opts.add_argument("--start-maximized")
-    opts.add_argument("--disable-blink-features=AutomationControlled")
-    # opts.add_argument("--headless=new")  # uncomment if you want headless
-
-    driver = webdriver.Chrome(options=opts)
+    driver = make_driver(allow=("images",))  # Logo is read from the img src
     wait = WebDriverWait(driver, 15)
 
     try:
@@ -0,0 +1,210 @@
+import csv
+import os
+from datetime import date
+
+from openpyxl import Workbook
+
+from exhibitor_schema import FIELDS, arrow_schema, to_canonical
+from exhibitor_store import STORE_PATH, ExhibitorStore
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+PARQUET_ROOT = os.environ.get("SCRAPER_PARQUET_ROOT", "exhibitors_parquet")
+
+
+def cell(value):
+    """Lists become "a, b"; None stays empty"""
+    if isinstance(value, (list, tuple)):
+        return ", ".join(str(v) for v in value)
+    return value
+
+
+class _Sink:
+    """Rows (dicts) are written as they arrive, in a fixed column order; unknown keys are ignored"""
+
+    def __init__(self, path, columns):
+        self.path = path
+        self.columns = list(columns)
+        self.count = 0
+
+    def _values(self, row):
+        return [cell(row.get(column)) for column in self.columns]
+
+    def write(self, row):
+        self._write(self._values(row))
+        self.count += 1
+
+    def write_many(self, rows):
+        for row in rows:
+            self.write(row)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CsvSink(_Sink):
+    """CSV written and flushed row by row"""
+
+    def __init__(self, path, columns):
+        super().__init__(path, columns)
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(self.columns)
+
+    def _write(self, values):
+        self._writer.writerow(["" if v is None else v for v in values])
+        self._file.flush()
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+
+
+class XlsxSink(_Sink):
+    """
+    Streaming xlsx: xlsxwriter in constant_memory mode when installed, otherwise an openpyxl
+    write_only workbook. Either way rows go straight to disk and close() only finishes the file.
+    """
+
+    def __init__(self, path, columns, sheet_name="Sheet1"):
+        super().__init__(path, columns)
+        self._closed = False
+        if xlsxwriter is not None:
+            # URLs stay plain text; xlsxwriter caps hyperlinks per sheet
+            self._book = xlsxwriter.Workbook(path, {"constant_memory": True, "strings_to_urls": False})
+            self._sheet = self._book.add_worksheet(sheet_name)
+            self._sheet.write_row(0, 0, self.columns)
+            self._next_row = 1
+        else:
+            self._book = Workbook(write_only=True)
+            self._sheet = self._book.create_sheet(sheet_name)
+            self._sheet.append(self.columns)
+
+    def _write(self, values):
+        if xlsxwriter is not None:
+            self._sheet.write_row(self._next_row, 0, values)
+            self._next_row += 1
+        else:
+            self._sheet.append(values)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if xlsxwriter is not None:
+            self._book.close()
+        else:
+            self._book.save(self.path)
+
+
+class ParquetSink(_Sink):
+    """
+    Any scraper's records mapped onto the shared exhibitor schema and written as Parquet, partitioned
+    hive-style as <root>/show=<show>/run_date=<YYYY-MM-DD>/part-0.parquet, one row group per batch.
+    """
+
+    def __init__(self, show, root=PARQUET_ROOT, run_date=None, batch_size=2000):
+        if pa is None:
+            raise RuntimeError("ParquetSink needs pyarrow: pip install pyarrow")
+        self.show = show
+        self.run_date = run_date or date.today().isoformat()
+        directory = os.path.join(root, f"show={show}", f"run_date={self.run_date}")
+        os.makedirs(directory, exist_ok=True)
+        super().__init__(os.path.join(directory, "part-0.parquet"), FIELDS)
+        self.batch_size = batch_size
+        self._schema = arrow_schema(pa)
+        self._writer = pq.ParquetWriter(self.path, self._schema, compression="zstd")
+        self._batch = []
+
+    def write(self, row):
+        self._batch.append(to_canonical(row, self.show, self.run_date))
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self._writer.write_table(pa.Table.from_pylist(self._batch, schema=self._schema))
+            self._batch = []
+
+    def close(self):
+        if self._writer is None:
+            return
+        self._flush()
+        self._writer.close()
+        self._writer = None
+
+
+class StoreSink(_Sink):
+    """Upsert rows into the cross-show SQLite exhibitor store under `show`, one transaction per batch"""
+
+    def __init__(self, show, path=STORE_PATH, batch_size=500):
+        super().__init__(path, FIELDS)
+        self.show = show
+        self.batch_size = batch_size
+        self._store = ExhibitorStore(path)
+        self._batch = []
+
+    def write(self, row):
+        self._batch.append(row)
+        self.count += 1
+        if len(self._batch) >= self.batch_size:
+            self._flush()
+
+    def _flush(self):
+        if self._batch:
+            self._store.upsert_many(self.show, self._batch)
+            self._batch = []
+
+    def close(self):
+        self._flush()
+
+
+class TeeSink(_Sink):
+    """Send every row to several sinks, e.g. the script's xlsx plus the shared Parquet dataset"""
+
+    def __init__(self, *sinks):
+        super().__init__(sinks[0].path, sinks[0].columns)
+        self.sinks = sinks
+
+    def write(self, row):
+        for sink in self.sinks:
+            sink.write(row)
+        self.count += 1
+
+    def close(self):
+        for sink in self.sinks:
+            sink.close()
+
+
+def shared_sinks(show, flags):
+    """The shared outputs asked for on the command line: Parquet dataset (--parquet), SQLite store (--store)"""
+    sinks = []
+    if "--parquet" in flags:
+        sinks.append(ParquetSink(show))
+    if "--store" in flags:
+        sinks.append(StoreSink(show))
+    return sinks
+
+
+def with_shared(sink, show, flags):
+    """Also feed the rows into the shared outputs under `show` (scripts pass sys.argv as flags)"""
+    extra = shared_sinks(show, flags)
+    return TeeSink(sink, *extra) if extra else sink
+
+
+def open_sink(path, columns):
+    """CsvSink for .csv paths, XlsxSink for everything else"""
+    return CsvSink(path, columns) if path.endswith(".csv") else XlsxSink(path, columns)
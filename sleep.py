@@ -1,20 +1,17 @@
-import requests
+import sys
 from bs4 import BeautifulSoup
-import pandas as pd
-import time
+from http_client import fetch_pages
+from sinks import XlsxSink, with_shared
 
 BASE_URL = "https://www.sleepexpome.com/exhibitor-list-2025/?page={}"
 
-headers = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
-                  "(KHTML, like Gecko) Chrome/117.0.0.0 Safari/537.36"
-}
+RATE = 5  # requests per second across all page fetches
+COLUMNS = ["Name", "Stand"]
+SHOW = "sleep-expo-middle-east"  # show name in the shared Parquet dataset / SQLite store (--parquet, --store)
 
-def scrape_page(page):
-    url = BASE_URL.format(page)
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-    soup = BeautifulSoup(response.text, "html.parser")
+
+def parse_page(html):
+    soup = BeautifulSoup(html, "html.parser")
 
     data = []
     exhibitors = soup.select("div.list--list-item")
@@ -39,19 +36,20 @@ def scrape_page(page):
     return data
 
 
-all_data = []
-
-for page in range(1, 7):  # 1 to 6 pages
-    print(f"\n🔎 Scraping page {page} ...")
-    try:
-        page_data = scrape_page(page)
-        all_data.extend(page_data)
-        time.sleep(1)  # avoid hammering server
-    except Exception as e:
-        print(f"❌ Error on page {page}: {e}")
-
-# Save to Excel
-df = pd.DataFrame(all_data)
-df.to_excel("sleepexpo_exhibitors_2025.xlsx", index=False)
-
-print("\n✅ Done! Data saved to sleepexpo_exhibitors_2025.xlsx")
+if __name__ == "__main__":
+    pages = range(1, 7)  # 1 to 6 pages
+    print(f"Scraping {len(pages)} pages in parallel ...")
+    failed = []
+    with with_shared(XlsxSink("sleepexpo_exhibitors_2025.xlsx", COLUMNS), SHOW, sys.argv) as sink:
+        for page, page_data in zip(pages, fetch_pages(BASE_URL, pages, parse_page, rate=RATE)):
+            if page_data is None:
+                print(f"❌ Error on page {page}")
+                failed.append(page)
+                continue
+            sink.write_many(page_data)
+
+    if failed:
+        print(f"\n⚠️ {len(failed)} pages failed ({', '.join(map(str, failed))}); "
+              f"the rest is saved to sleepexpo_exhibitors_2025.xlsx")
+        sys.exit(1)
+    print("\n✅ Done! Data saved to sleepexpo_exhibitors_2025.xlsx")
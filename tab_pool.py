@@ -0,0 +1,92 @@
+import logging
+import time
+from collections import deque
+
+from driver_factory import block_resources
+from rate_limiter import get_limiter
+
+logger = logging.getLogger(__name__)
+
+READY_SCRIPT = """
+const selector = arguments[0];
+if (document.readyState !== 'complete') return false;
+return !selector || document.querySelector(selector) !== null;
+"""
+
+
+class TabPool:
+    """Sliding window of browser tabs: keep `size` pages loading and harvest whichever is ready first"""
+
+    def __init__(self, driver, size=8, ready_selector=None, load_timeout=30, poll_interval=0.1):
+        self.driver = driver
+        self.size = size
+        self.ready_selector = ready_selector
+        self.load_timeout = load_timeout
+        self.poll_interval = poll_interval
+
+    def _open(self, url):
+        """Open url in a new background tab and return its window handle"""
+        get_limiter().acquire(url)
+        before = set(self.driver.window_handles)
+        self.driver.switch_to.window(self.main_handle)
+        blocked = getattr(self.driver, "blocked_urls", None)
+        # With a block list the tab opens blank first so the list is in place before the page loads
+        self.driver.execute_script("window.open(arguments[0], '_blank');", "about:blank" if blocked else url)
+        new_handles = [h for h in self.driver.window_handles if h not in before]
+        if not new_handles:
+            return None
+        if blocked:
+            self.driver.switch_to.window(new_handles[0])
+            block_resources(self.driver)
+            self.driver.execute_script("window.location.href = arguments[0];", url)
+        return new_handles[0]
+
+    def _is_ready(self, handle, started):
+        self.driver.switch_to.window(handle)
+        if time.time() - started > self.load_timeout:
+            return True  # let the scrape function's own waits decide
+        try:
+            return bool(self.driver.execute_script(READY_SCRIPT, self.ready_selector))
+        except Exception:
+            return False
+
+    def _close(self, handle):
+        try:
+            self.driver.switch_to.window(handle)
+            self.driver.close()
+        except Exception:
+            pass
+        self.driver.switch_to.window(self.main_handle)
+
+    def run(self, urls, scrape):
+        """Call scrape(driver) on every URL's tab; results come back in the order of urls (None on failure)"""
+        self.main_handle = self.driver.current_window_handle
+        results = [None] * len(urls)
+        pending = deque(enumerate(urls))
+        in_flight = {}
+
+        while pending or in_flight:
+            # Refill free slots
+            while pending and len(in_flight) < self.size:
+                index, url = pending.popleft()
+                handle = self._open(url)
+                if handle is None:
+                    logger.warning(f"Could not open tab for {url}")
+                    continue
+                in_flight[handle] = (index, url, time.time())
+
+            ready = next((h for h, (_, _, started) in in_flight.items() if self._is_ready(h, started)), None)
+            if ready is None:
+                time.sleep(self.poll_interval)
+                continue
+
+            index, url, _ = in_flight.pop(ready)
+            self.driver.switch_to.window(ready)
+            try:
+                results[index] = scrape(self.driver)
+            except Exception as e:
+                logger.warning(f"Error scraping {url}: {e}")
+            finally:
+                self._close(ready)
+
+        return results
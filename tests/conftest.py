@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The scrapers and shared modules are top-level scripts, not a package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,184 @@
+import os
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from detail_fetcher import AsyncDetailFetcher, parse_detail_page
+from http_cache import HttpCache
+from rate_limiter import HostLimiter
+
+PAGES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "detail_pages")
+
+
+def read_page(name):
+    with open(os.path.join(PAGES, name), "rb") as f:
+        return f.read()
+
+
+# ---------------- PARSER ----------------
+def test_parse_detail_page_reads_every_field():
+    assert parse_detail_page(read_page("exhibitor_full.html")) == {
+        "website": "https://www.gulfsteel.example",
+        "email": "sales@gulfsteel.example",
+        "linkedin": "https://www.linkedin.com/company/gulf-steel-trading/",
+        "categories": ["Structural Steel", "Rebar & Mesh"],
+        "description": "Gulf Steel Trading supplies structural steel across the GCC. "
+                       "Stockists of rebar, mesh and hollow sections since 1998.",
+    }
+
+
+def test_parse_detail_page_skips_missing_and_placeholder_fields():
+    assert parse_detail_page(read_page("exhibitor_minimal.html")) == {"categories": [], "description": ""}
+
+
+# ---------------- STAND-IN SERVER ----------------
+class StandIn:
+    """Serves the detail page fixtures; ?fail=N answers 503 to the first N requests for that URL"""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.requests = Counter()
+        self.conditional = Counter()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                stand_in.handle(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def handle(self, handler):
+        path, _, query = handler.path.partition("?")
+        with self._lock:
+            self.requests[handler.path] += 1
+            count = self.requests[handler.path]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            time.sleep(self.delay)
+            params = dict(p.split("=", 1) for p in query.split("&") if "=" in p)
+            name = os.path.basename(path.split("/")[-1])
+            if count <= int(params.get("fail", 0)):
+                self.reply(handler, 503, b"busy")
+            elif not os.path.exists(os.path.join(PAGES, name)):
+                self.reply(handler, 404, b"not found")
+            elif handler.headers.get("If-None-Match") == f'"{name}"':
+                with self._lock:
+                    self.conditional[handler.path] += 1
+                self.reply(handler, 304, b"")
+            else:
+                self.reply(handler, 200, read_page(name), {"ETag": f'"{name}"'})
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+    @staticmethod
+    def reply(handler, status, body, headers=None):
+        handler.send_response(status)
+        for key, value in (headers or {}).items():
+            handler.send_header(key, value)
+        handler.send_header("Content-Type", "text/html; charset=utf-8")
+        handler.send_header("Content-Length", str(len(body)))
+        handler.end_headers()
+        handler.wfile.write(body)
+
+    def url(self, name, **params):
+        query = "&".join(f"{k}={v}" for k, v in params.items())
+        return f"{self.base}/{name}" + (f"?{query}" if query else "")
+
+
+@pytest.fixture
+def stand_in():
+    server = StandIn()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+def fetcher(**kwargs):
+    # Local server: no politeness budget, and no backoff between retries
+    kwargs.setdefault("limiter", HostLimiter(rate=10_000, burst=10_000))
+    kwargs.setdefault("backoff", 0)
+    return AsyncDetailFetcher(**kwargs)
+
+
+# ---------------- FETCHER ----------------
+def test_fetch_all_parses_every_unique_url(stand_in):
+    full, minimal = stand_in.url("exhibitor_full.html"), stand_in.url("exhibitor_minimal.html")
+    results = fetcher().fetch_all([full, minimal, full, None, ""])
+    assert results == {
+        full: parse_detail_page(read_page("exhibitor_full.html")),
+        minimal: parse_detail_page(read_page("exhibitor_minimal.html")),
+    }
+    assert stand_in.requests["/exhibitor_full.html"] == 1
+
+
+def test_fetch_all_retries_transient_errors(stand_in):
+    url = stand_in.url("exhibitor_full.html", fail=2)
+    results = fetcher(retries=3).fetch_all([url])
+    assert results[url]["email"] == "sales@gulfsteel.example"
+    assert stand_in.requests["/exhibitor_full.html?fail=2"] == 3
+
+
+def test_fetch_all_gives_up_after_the_last_retry(stand_in):
+    url = stand_in.url("exhibitor_full.html", fail=5)
+    assert fetcher(retries=3).fetch_all([url]) == {url: {}}
+    assert stand_in.requests["/exhibitor_full.html?fail=5"] == 3
+
+
+def test_fetch_all_does_not_retry_a_missing_page(stand_in):
+    url = stand_in.url("missing.html")
+    assert fetcher(retries=3).fetch_all([url]) == {url: {}}
+    assert stand_in.requests["/missing.html"] == 1
+
+
+def test_cache_miss_then_fresh_hit(stand_in, tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite"))
+    url = stand_in.url("exhibitor_full.html")
+    first = fetcher(cache=cache).fetch_all([url])
+    second = fetcher(cache=cache).fetch_all([url])
+    assert first == second
+    assert stand_in.requests["/exhibitor_full.html"] == 1
+    assert cache.stats["miss"] == 1 and cache.stats["fresh"] == 1
+
+
+def test_stale_cache_entry_is_revalidated(stand_in, tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    url = stand_in.url("exhibitor_full.html")
+    fetcher(cache=HttpCache(path)).fetch_all([url])
+
+    stale = HttpCache(path, ttl=0)
+    results = fetcher(cache=stale).fetch_all([url])
+    assert results[url] == parse_detail_page(read_page("exhibitor_full.html"))
+    assert stand_in.conditional["/exhibitor_full.html"] == 1
+    assert stale.stats["revalidated"] == 1
+
+
+def test_per_host_cap_is_shared_across_threads():
+    server = StandIn(delay=0.05)
+    try:
+        shared = fetcher(per_host=3)
+        batches = [[server.url("exhibitor_full.html", batch=b, n=i) for i in range(15)] for b in range(2)]
+        threads = [threading.Thread(target=shared.fetch_all, args=(batch,)) for batch in batches]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        server.server.shutdown()
+        server.server.server_close()
+    assert sum(server.requests.values()) == 30
+    assert server.max_in_flight <= 3
@@ -0,0 +1,143 @@
+import json
+import os
+
+import pytest
+import requests
+
+from messe_frankfurt import (
+    COLUMNS, MesseFrankfurtClient, ReplaySession, discover_search_config, format_booth,
+    parse_detail_html, record_from_hit,
+)
+
+FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "messe_frankfurt")
+SEARCH_URL = "https://intersec.ae.messefrankfurt.com/dubai/en/exhibitor-search.html"
+DETAIL_URL = "https://intersec.ae.messefrankfurt.com/dubai/en/exhibitor-search.detail.html/{}.html"
+
+
+def fixture_text(url):
+    """Body recorded for url in the fixture manifest"""
+    with open(os.path.join(FIXTURES, "manifest.json"), encoding="utf-8") as f:
+        entry = json.load(f)[url]
+    with open(os.path.join(FIXTURES, entry["file"]), encoding="utf-8") as f:
+        return f.read()
+
+
+class CountingReplay(ReplaySession):
+    """ReplaySession that remembers which URLs were requested"""
+
+    def __init__(self, fixtures_dir):
+        super().__init__(fixtures_dir)
+        self.requested = []
+
+    def get(self, url, params=None, **kwargs):
+        response = super().get(url, params=params, **kwargs)
+        self.requested.append(response.url)
+        return response
+
+
+@pytest.fixture
+def session():
+    return CountingReplay(FIXTURES)
+
+
+# ---------------- PARSERS ----------------
+def test_discover_search_config_reads_key_and_event():
+    assert discover_search_config(fixture_text(SEARCH_URL)) == {
+        "api_key": "fixture-api-key",
+        "event_variable": "INTERSEC",
+    }
+
+
+def test_discover_search_config_without_widget():
+    assert discover_search_config("<html><body>No search here</body></html>") == {}
+
+
+def test_format_booth_lists_every_hall_and_stand():
+    exhibition = {"exhibitionHall": [
+        {"name": "Hall 1", "stand": [{"name": "C10"}, {"name": "C11"}]},
+        {"name": "Outdoor"},
+        {"name": "", "stand": [{"name": "Z9"}]},
+    ]}
+    assert format_booth(exhibition) == "Hall 1 - C10; Hall 1 - C11; Outdoor; Z9"
+    assert format_booth({}) == ""
+
+
+def test_record_from_hit_maps_api_fields():
+    hit = {"exhibitor": {
+        "rewriteId": "delta",
+        "name": " Delta Ltd ",
+        "homepage": "https://delta.example",
+        "address": {"city": "Doha", "country": "Qatar", "phone": "+974 555"},
+        "exhibition": {"exhibitionHall": [{"name": "Hall 3", "stand": [{"name": "D1"}]}]},
+        "links": {"social": ["https://x.com/delta", "https://www.linkedin.com/company/delta/"]},
+    }}
+    assert record_from_hit(hit, "https://example/delta.html") == {
+        "Order": "",
+        "Company Name": "Delta Ltd",
+        "City": "Doha",
+        "Country": "Qatar",
+        "Booth No": "Hall 3 - D1",
+        "Company Website": "https://delta.example",
+        "Company LinkedIn": "https://www.linkedin.com/company/delta/",
+        "Company Contact": "+974 555",
+        "URL": "https://example/delta.html",
+    }
+
+
+def test_parse_detail_html_reads_contact_box():
+    url = DETAIL_URL.format("beta-secure")
+    assert parse_detail_html(fixture_text(url), url) == {
+        "Company Name": "Beta Secure GmbH",
+        "City": "Hamburg",
+        "Country": "Germany",
+        "Booth No": "Hall 2 - B40",
+        "Company Website": "https://www.betasecure.example",
+        "Company LinkedIn": "https://www.linkedin.com/company/beta-secure/",
+        "Company Contact": "+49 40 5550 1234",
+        "URL": url,
+    }
+
+
+# ---------------- REPLAYED CLIENT ----------------
+def test_replayed_scrape_merges_api_and_detail_pages(session):
+    records = MesseFrankfurtClient(SEARCH_URL, page_size=2, session=session).scrape()
+
+    assert [r["Order"] for r in records] == [1, 2, 3]
+    assert all(list(r) == COLUMNS for r in records)
+    alpha, beta, gamma = records
+
+    # Complete in the search API, so its detail page is never requested
+    assert alpha["Company Name"] == "Alpha Fire Systems LLC"
+    assert alpha["Country"] == "United Arab Emirates"
+    assert alpha["Company LinkedIn"] == "https://www.linkedin.com/company/alpha-fire-systems/"
+    assert DETAIL_URL.format("alpha-fire-systems") not in session.requested
+
+    # Blanks filled from the recorded detail page
+    assert beta["Company Website"] == "https://www.betasecure.example"
+    assert beta["Company Contact"] == "+49 40 5550 1234"
+    assert beta["Company LinkedIn"] == "https://www.linkedin.com/company/beta-secure/"
+
+    # Detail page missing from the recording: API fields kept, blanks stay blank
+    assert gamma["Booth No"] == "Hall 1 - C10; Hall 1 - C11; Outdoor"
+    assert gamma["Company Website"] == "https://gamma.example"
+    assert gamma["Company Contact"] == ""
+    assert gamma["URL"] == DETAIL_URL.format("gamma-guarding")
+    assert DETAIL_URL.format("gamma-guarding") in session.requested
+
+
+def test_replayed_scrape_stops_at_hits_total(session):
+    MesseFrankfurtClient(SEARCH_URL, page_size=2, session=session).scrape(with_details=False)
+    api_calls = [url for url in session.requested if "pageNumber=" in url]
+    assert len(api_calls) == 2
+
+
+def test_replayed_scrape_respects_max_pages(session):
+    records = MesseFrankfurtClient(SEARCH_URL, page_size=2, session=session).scrape(max_pages=1, with_details=False)
+    assert [r["Company Name"] for r in records] == ["Alpha Fire Systems LLC", "Beta Secure GmbH"]
+
+
+def test_discover_fails_when_search_page_was_not_recorded(tmp_path):
+    (tmp_path / "manifest.json").write_text("{}")
+    client = MesseFrankfurtClient(SEARCH_URL, session=ReplaySession(str(tmp_path)))
+    with pytest.raises(requests.HTTPError):
+        client.discover()
@@ -0,0 +1,119 @@
+import threading
+import time
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+class WaitStats:
+    """Per-label count, total and worst-case time spent in condition waits"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats = {}
+
+    def record(self, label, elapsed, timed_out):
+        with self._lock:
+            entry = self.stats.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            entry["count"] += 1
+            entry["total"] += elapsed
+            entry["max"] = max(entry["max"], elapsed)
+            entry["timeouts"] += int(timed_out)
+
+    def report(self):
+        """Print how long each kind of wait actually cost"""
+        if not self.stats:
+            return
+        print("\n⏱️ Wait report")
+        print(f"   {'wait':<28}{'count':>7}{'total s':>10}{'avg s':>8}{'max s':>8}{'timeouts':>10}")
+        for label, e in sorted(self.stats.items(), key=lambda x: x[1]["total"], reverse=True):
+            print(f"   {label:<28}{e['count']:>7}{e['total']:>10.1f}{e['total'] / e['count']:>8.2f}"
+                  f"{e['max']:>8.2f}{e['timeouts']:>10}")
+
+
+STATS = WaitStats()
+
+
+def wait_for(driver, condition, timeout=10, label="wait", poll=0.1):
+    """Return condition(driver)'s first truthy value, or None on timeout; the time spent is recorded under label"""
+    start = time.time()
+    try:
+        wait = WebDriverWait(driver, timeout, poll_frequency=poll,
+                             ignored_exceptions=(StaleElementReferenceException,))
+        result = wait.until(condition)
+        STATS.record(label, time.time() - start, False)
+        return result
+    except TimeoutException:
+        STATS.record(label, time.time() - start, True)
+        return None
+
+
+def element_present(driver, selector, timeout=10, label=None):
+    """Wait until a CSS selector matches at least one element"""
+    def condition(d):
+        elements = d.find_elements(By.CSS_SELECTOR, selector)
+        return elements[0] if elements else False
+    return wait_for(driver, condition, timeout, label or f"present {selector}")
+
+
+def element_gone(driver, selector, timeout=10, label=None):
+    """Wait until nothing visible matches a CSS selector (modal closed, loader hidden)"""
+    def condition(d):
+        try:
+            return not any(e.is_displayed() for e in d.find_elements(By.CSS_SELECTOR, selector))
+        except WebDriverException:
+            return False
+    return wait_for(driver, condition, timeout, label or f"gone {selector}")
+
+
+def text_changed(driver, selector, old_text, timeout=10, label=None):
+    """Wait until the first element matching selector has text different from old_text"""
+    def condition(d):
+        elements = d.find_elements(By.CSS_SELECTOR, selector)
+        try:
+            text = elements[0].text if elements else None
+        except WebDriverException:
+            return False
+        return text if text is not None and text != old_text else False
+    return wait_for(driver, condition, timeout, label or f"text changed {selector}")
+
+
+NETWORK_STATE_SCRIPT = """
+return [document.readyState, performance.getEntriesByType('resource').length];
+"""
+
+
+def network_quiet(driver, quiet_for=0.5, timeout=15, label="network quiet"):
+    """Wait until the document is loaded and no new resources have been fetched for quiet_for seconds"""
+    state = {"count": -1, "since": time.time()}
+
+    def condition(d):
+        ready, count = d.execute_script(NETWORK_STATE_SCRIPT)
+        now = time.time()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return ready == "complete" and now - state["since"] >= quiet_for
+
+    return wait_for(driver, condition, timeout, label)
+
+
+def count_stable(driver, selector, stable_for=1.0, timeout=30, label=None, minimum=1):
+    """
+    Wait until the number of elements matching selector stops changing; returns the final count, or None
+    when it times out (including when fewer than minimum elements ever render)
+    """
+    state = {"count": -1, "since": time.time()}
+
+    def condition(d):
+        count = len(d.find_elements(By.CSS_SELECTOR, selector))
+        now = time.time()
+        if count != state["count"]:
+            state["count"], state["since"] = count, now
+            return False
+        return count >= minimum and now - state["since"] >= stable_for
+
+    if not wait_for(driver, condition, timeout, label or f"count stable {selector}"):
+        return None
+    return state["count"]
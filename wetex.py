@@ -1,14 +1,17 @@
-import requests
 import pandas as pd
-import time
 import json
+from bs4 import BeautifulSoup
+from http_client import get
+from rate_limiter import get_limiter
 
 BASE_URL = "https://www.wetex.ae/umbraco/surface/wetexdatasurface/GetExhibitorList"
+# Only the AJAX-specific headers; User-Agent etc. come from the shared session
 HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
     "X-Requested-With": "XMLHttpRequest",
     "Referer": "https://www.wetex.ae/en/exhibit"
 }
+RATE = 1  # requests per second, the pace the old sleep(1) between pages allowed
+get_limiter().configure(BASE_URL, RATE)
 
 def scrape_exhibitors():
     all_data = []
@@ -28,13 +31,12 @@ def scrape_exhibitors():
         print(f"🔎 Scraping page {current_page + 1}...")
         
         try:
-            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=15)
+            response = get(BASE_URL, params=params, headers=HEADERS, timeout=15)
             if response.status_code != 200:
                 print(f"⚠️ Failed to fetch page {current_page + 1}, status {response.status_code}")
                 break
             
             # Parse the HTML response
-            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             rows = soup.select("tr.m19-table__content-table-row")
             
@@ -63,7 +65,6 @@ def scrape_exhibitors():
                 
             all_data.extend(page_data)
             current_page += 1
-            time.sleep(1)  # Be respectful to the server
             
         except Exception as e:
             print(f"❌ Error scraping page {current_page + 1}: {e}")
@@ -90,12 +91,11 @@ def scrape_government_exhibitors():
         print(f"🔎 Scraping government exhibitors page {current_page + 1}...")
         
         try:
-            response = requests.get(BASE_URL, params=params, headers=HEADERS, timeout=15)
+            response = get(BASE_URL, params=params, headers=HEADERS, timeout=15)
             if response.status_code != 200:
                 print(f"⚠️ Failed to fetch government page {current_page + 1}, status {response.status_code}")
                 break
             
-            from bs4 import BeautifulSoup
             soup = BeautifulSoup(response.text, 'html.parser')
             rows = soup.select("tr.m19-table__content-table-row")
             
@@ -124,7 +124,6 @@ def scrape_government_exhibitors():
                 
             all_data.extend(page_data)
             current_page += 1
-            time.sleep(1)
             
         except Exception as e:
             print(f"❌ Error scraping government page {current_page + 1}: {e}")